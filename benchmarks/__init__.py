@@ -0,0 +1 @@
+"""Headless performance benchmarks for the Streamlit dashboard data layer."""
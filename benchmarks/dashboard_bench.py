@@ -0,0 +1,232 @@
+"""Headless benchmark of the dashboard data layer on synthetic snapshots
+
+Times snapshot loading, every filter predicate and every section aggregate
+without starting Streamlit, records peak memory, and writes the results as
+JSON so runs can be compared across snapshots and code changes.
+
+Usage:
+    python -m benchmarks.dashboard_bench                       # 10k, 100k, 1M coldkeys
+    python -m benchmarks.dashboard_bench --sizes 10000 100000 --repeat 5
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from benchmarks.synthetic import write_snapshot_json
+from dashboard.aggregates import breakdown, distribution, role_totals, summary_metrics
+from dashboard.binning import (
+    ALPHA_PERCENTAGE_BUCKETS,
+    TOKEN_BUCKETS,
+    TX_BUCKETS,
+    TX_TIME_BUCKETS,
+    TX_TIME_DETAIL_BUCKETS,
+)
+from dashboard.concentration import ConcentrationIndex
+from dashboard.cube import build_cube, rollup_breakdown, rollup_role_totals, rollup_summary
+from dashboard.filters import RANGE_COLUMNS, FilterState, Selection, build_mask
+from dashboard.holders import ColumnIndex
+from dashboard.snapshot import parse_json, read_snapshot, write_snapshot
+from dashboard.subnets import subnet_totals
+from dashboard.topk import ranked_positions
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+RESULTS_DIR = 'output/benchmarks'
+
+# One filter per predicate, plus everything at once
+FILTER_CASES = {
+    'role': FilterState(role="Miner"),
+    'staking_proxy': FilterState(staking_proxy="True"),
+    'wallet_value': FilterState(wallet_value=(10.0, 10_000.0)),
+    'wallet_value_narrow': FilterState(wallet_value=(500.0, 10_000.0)),  # A few percent of holders: resolved from the sorted index
+    'token_count': FilterState(tokens=(2, 20)),
+    'number_tx': FilterState(number_tx=(1, 50)),
+    'tx_time': FilterState(tx_time=(1, 12)),
+    'alpha_percentage': FilterState(alpha_percentage=(50.0, 100.0)),
+    'subnet': FilterState(netuids=(1, 2, 3)),
+    'subnet_all': FilterState(netuids=(1, 2, 3), subnet_match="All"),
+    'subnet_many': FilterState(netuids=tuple(range(1, 33))),  # "Any" of a quarter of the subnets: most holders
+    'combined': FilterState(role="Investor", staking_proxy="False", wallet_value=(1.0, 1e9), tokens=(1, 64)),
+}
+
+# Section aggregates, computed over a Selection exactly like the dashboard does
+AGGREGATE_CASES = {
+    'global_role_analysis': lambda s: role_totals(s.holders),
+    'summary_metrics': lambda s: summary_metrics(s.holders),
+    'breakdown_by_tx': lambda s: breakdown(s.holders, 'number_tx', TX_BUCKETS),
+    'breakdown_by_tx_time': lambda s: breakdown(s.holders, 'tx_time', TX_TIME_BUCKETS),
+    'breakdown_by_tx_time_1_5': lambda s: breakdown(s.holders, 'tx_time', TX_TIME_DETAIL_BUCKETS, 'Sessions'),
+    'breakdown_by_tokens': lambda s: breakdown(s.holders, 'unique_alpha_tokens', TOKEN_BUCKETS),
+    'breakdown_by_alpha_percentage': lambda s: breakdown(s.holders, 'alpha_percentage', ALPHA_PERCENTAGE_BUCKETS),
+    'breakdown_by_tx_detailed': lambda s: distribution(s.holders, 'number_tx', 'TX Count'),
+    'breakdown_by_tx_time_detailed': lambda s: distribution(s.holders, 'tx_time', 'Sessions Count'),
+    'breakdown_by_tokens_detailed': lambda s: distribution(s.holders, 'unique_alpha_tokens', 'Token Count'),
+    'top_holders': lambda s: ranked_positions(s, 'total_alpha_value_rao', 20),
+    'subnet_breakdown': lambda s: subnet_totals(s.snapshot, s.mask),
+    # The same sections answered from the precomputed cube (row engine where it can't)
+    'cube_global_role_analysis': lambda s: rollup_role_totals(s),
+    'cube_summary_metrics': lambda s: rollup_summary(s),
+    'cube_breakdown_by_tx': lambda s: rollup_breakdown(s, 'tx'),
+    'cube_breakdown_by_tokens': lambda s: rollup_breakdown(s, 'tokens'),
+}
+
+# Concentration metrics, answered from values sorted once per snapshot
+CONCENTRATION_CASES = {
+    'concentration_population': lambda index, s: index.population(s.mask),
+    'concentration_lorenz': lambda index, s: index.lorenz(s.mask),
+    'concentration_per_subnet': lambda index, s: index.per_subnet(s.mask),
+}
+
+
+def build_column_index(holders) -> ColumnIndex:
+    """Column index with the bounds and sorted permutation of every range filter column already built"""
+    index = ColumnIndex(holders)
+    for column in RANGE_COLUMNS.values():
+        index.bounds(column)
+        index.sorted_order(column)
+    return index
+
+
+def measure(func: Callable, repeat: int = 1) -> Dict[str, float]:
+    """Median/min wall time over repeat runs, and the Python heap peak of one more, traced run
+
+    tracemalloc slows every allocation down (several times over for a JSON
+    parse), so the timed runs are never traced.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'median_ms': statistics.median(times) * 1000,
+        'min_ms': min(times) * 1000,
+        'peak_mb': peak / 1024 / 1024,
+    }
+
+
+def bench_size(num_coldkeys: int, workdir: str, repeat: int) -> Dict:
+    """Benchmark one synthetic snapshot size"""
+    json_path = os.path.join(workdir, f"alpha_holders_{num_coldkeys}.json")
+    if not os.path.exists(json_path):
+        print(f"  generating {num_coldkeys:,} coldkeys...")
+        write_snapshot_json(num_coldkeys, json_path)
+
+    results = {'coldkeys': num_coldkeys, 'json_mb': os.path.getsize(json_path) / 1024 / 1024}
+
+    # Loading: JSON parse (cold start without a binary snapshot), conversion, mapped load
+    load = {}
+    load['parse_json'] = measure(lambda: parse_json(json_path))
+    snapshot = parse_json(json_path)
+    load['build_cube'] = measure(lambda: build_cube(snapshot))
+    load['write_snapshot'] = measure(lambda: write_snapshot(snapshot, json_path))
+    load['read_snapshot'] = measure(lambda: read_snapshot(json_path), repeat)
+    results['load'] = load
+
+    snapshot = read_snapshot(json_path)
+    results['holdings'] = len(snapshot.holdings)
+    load['concentration_index'] = measure(lambda: ConcentrationIndex(snapshot))
+    index = ConcentrationIndex(snapshot)
+    # Only snapshots without column_index.arrow (parsed or older registered runs) build it; read_snapshot maps it
+    load['column_index'] = measure(lambda: build_column_index(snapshot.holders))
+
+    results['filters'] = {
+        name: measure(lambda state=state: build_mask(snapshot, state), repeat)
+        for name, state in FILTER_CASES.items()
+    }
+
+    # Aggregates over the unfiltered population and over a typical filtered one
+    results['aggregates'] = {}
+    for scope, state in [('unfiltered', FilterState()), ('filtered', FILTER_CASES['combined'])]:
+        selection = Selection(snapshot, state)
+        selection.holders  # Filtering is timed above, keep it out of the aggregate numbers
+        results['aggregates'][scope] = {
+            name: measure(lambda func=func: func(selection), repeat)
+            for name, func in AGGREGATE_CASES.items()
+        }
+        results['aggregates'][scope].update({
+            name: measure(lambda func=func: func(index, selection), repeat)
+            for name, func in CONCENTRATION_CASES.items()
+        })
+
+    return results
+
+
+def git_commit() -> str:
+    """Current commit, so results can be tied to the code that produced them"""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def print_summary(results: List[Dict]):
+    """Human readable summary of the slowest steps"""
+    for size in results:
+        print(f"\n=== {size['coldkeys']:,} coldkeys / {size['holdings']:,} holdings ({size['json_mb']:.0f} MB JSON) ===")
+        for name, m in size['load'].items():
+            print(f"  load      {name:<32} {m['median_ms']:>10.1f} ms  peak {m['peak_mb']:>8.1f} MB")
+        for name, m in size['filters'].items():
+            print(f"  filter    {name:<32} {m['median_ms']:>10.2f} ms")
+        for scope, aggregates in size['aggregates'].items():
+            for name, m in aggregates.items():
+                print(f"  {scope:<9} {name:<32} {m['median_ms']:>10.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Coldkey counts to benchmark')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (median is reported)')
+    parser.add_argument('--workdir', default=None, help='Where synthetic snapshots are generated and kept')
+    parser.add_argument('--output', default=None, help='Results file (default: output/benchmarks/bench_<timestamp>.json)')
+    args = parser.parse_args()
+
+    workdir = args.workdir or os.path.join(tempfile.gettempdir(), 'alpha_dashboard_bench')
+    os.makedirs(workdir, exist_ok=True)
+
+    results = []
+    for size in args.sizes:
+        print(f"Benchmarking {size:,} coldkeys...")
+        results.append(bench_size(size, workdir, args.repeat))
+
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        # ru_maxrss is KB on Linux, bytes on macOS
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024),
+        'results': results,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"bench_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print_summary(results)
+    print(f"\nPeak RSS: {report['peak_rss_mb']:.0f} MB")
+    print(f"✓ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
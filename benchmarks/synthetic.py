@@ -0,0 +1,108 @@
+"""Synthetic alpha_holders_analysis.json generator matching AlphaHolderAnalysis (src/types/index.ts)
+
+Usage:
+    python -m benchmarks.synthetic 100000 output/benchmarks/synthetic_100k.json
+
+The live analysis output (output/alpha_holders_analysis.json) is never overwritten.
+"""
+import json
+import os
+import sys
+from typing import Dict, List
+
+import numpy as np
+
+from dashboard.snapshot import SNAPSHOT_JSON
+
+SS58_ALPHABET = np.array(list("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"))
+NUM_SUBNETS = 128
+
+# Same role mix as the real classification output: mostly plain investors
+ROLE_SETS = [
+    (["Investor"], 0.86),
+    (["Miner"], 0.06),
+    (["Validator"], 0.03),
+    (["Miner", "Validator"], 0.03),
+    (["Subnet Owner", "Validator"], 0.01),
+    (["Subnet Owner"], 0.01),
+]
+
+
+def generate_records(num_coldkeys: int, seed: int = 42) -> List[Dict]:
+    """Generate records with heavy-tailed holdings per coldkey and lognormal balances"""
+    rng = np.random.default_rng(seed)
+
+    # Most coldkeys hold one or two subnets, a long tail holds dozens
+    holdings_per_coldkey = np.minimum(rng.zipf(1.9, num_coldkeys), NUM_SUBNETS)
+    # Popular subnets attract more stakers
+    subnet_weights = 1.0 / np.arange(1, NUM_SUBNETS + 1) ** 0.8
+    subnet_weights /= subnet_weights.sum()
+    # Alpha price in TAO per subnet
+    subnet_prices = rng.lognormal(-3.5, 1.0, NUM_SUBNETS)
+
+    coldkeys = rng.choice(SS58_ALPHABET, size=(num_coldkeys, 47))
+    role_sets = [roles for roles, _ in ROLE_SETS]
+    role_index = rng.choice(len(ROLE_SETS), size=num_coldkeys, p=[p for _, p in ROLE_SETS])
+    has_proxy = rng.random(num_coldkeys) < 0.08
+    number_tx = np.minimum(rng.zipf(1.6, num_coldkeys) - 1, 5000)
+    tx_time = np.minimum(number_tx, rng.zipf(1.8, num_coldkeys) - 1)
+    free_tao = rng.lognormal(-1.0, 2.0, num_coldkeys)
+    staked_tao = np.where(rng.random(num_coldkeys) < 0.4, rng.lognormal(1.0, 2.0, num_coldkeys), 0.0)
+
+    records = []
+    for i in range(num_coldkeys):
+        k = int(holdings_per_coldkey[i])
+        netuids = rng.choice(NUM_SUBNETS, size=k, replace=False, p=subnet_weights) + 1
+        balances = rng.lognormal(2.0, 2.5, k)
+        values = balances * subnet_prices[netuids - 1]
+        total_alpha = float(values.sum())
+        total_wallet = total_alpha + float(free_tao[i]) + float(staked_tao[i])
+
+        order = np.argsort(-values)
+        holdings = [
+            {
+                'netuid': int(netuids[j]),
+                'subnet_name': f"subnet-{int(netuids[j])}",
+                'balance_alpha': float(balances[j]),
+                'value_tao': float(values[j]),
+                'percentage_of_portfolio': float(values[j] / total_wallet * 100),
+            }
+            for j in order
+        ]
+
+        records.append({
+            'coldkey': '5' + ''.join(coldkeys[i]),
+            'roles': role_sets[role_index[i]],
+            'has_staking_proxy': bool(has_proxy[i]),
+            'total_alpha_value_tao': total_alpha,
+            'unique_alpha_tokens': k,
+            'alpha_holdings': holdings,
+            'total_staked_tao': float(staked_tao[i]),
+            'free_tao': float(free_tao[i]),
+            'total_wallet_value_tao': total_wallet,
+            'alpha_percentage': total_alpha / total_wallet * 100,
+            'number_tx': int(number_tx[i]),
+            'tx_time': int(tx_time[i]),
+        })
+
+    # exportToJSON writes holders sorted by alpha value
+    records.sort(key=lambda r: r['total_alpha_value_tao'], reverse=True)
+    return records
+
+
+def write_snapshot_json(num_coldkeys: int, path: str, seed: int = 42, indent: int = 2):
+    """Write a synthetic snapshot pretty-printed the same way exportToJSON does"""
+    if os.path.abspath(path) == os.path.abspath(SNAPSHOT_JSON):
+        raise ValueError(f"Refusing to overwrite the analysis output {SNAPSHOT_JSON} with synthetic data")
+    records = generate_records(num_coldkeys, seed)
+    with open(path, 'w') as f:
+        json.dump(records, f, indent=indent)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(1)
+    os.makedirs(os.path.dirname(sys.argv[2]) or '.', exist_ok=True)
+    write_snapshot_json(int(sys.argv[1]), sys.argv[2])
+    print(f"✓ Wrote {int(sys.argv[1]):,} synthetic coldkeys to {sys.argv[2]}")
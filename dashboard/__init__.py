@@ -0,0 +1 @@
+"""Data layer for the Streamlit alpha holders dashboard (streamlit_app.py)."""
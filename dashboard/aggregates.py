@@ -0,0 +1,53 @@
+"""Section aggregates that are not plain bucket tables"""
+from typing import Dict, List
+
+import pandas as pd
+
+from dashboard.binning import Buckets, bucket_table, exact_value_table
+from dashboard.holders import ROLE_BITS, role_mask
+from dashboard.rao import to_tao
+
+
+def breakdown(holders: pd.DataFrame, column: str, buckets: Buckets, label: str = 'Category') -> pd.DataFrame:
+    """Bucketed coldkey counts and alpha value for one holder column"""
+    return bucket_table(holders[column].to_numpy(), holders['total_alpha_value_rao'].to_numpy(), buckets, label)
+
+
+def distribution(holders: pd.DataFrame, column: str, label: str) -> pd.DataFrame:
+    """Coldkey counts and alpha value for every exact value of one holder column"""
+    return exact_value_table(holders[column].to_numpy(), holders['total_alpha_value_rao'].to_numpy(), label)
+
+
+def role_totals(holders: pd.DataFrame) -> pd.DataFrame:
+    """Coldkeys and alpha value per role (a holder counts once for each role it carries)"""
+    alpha = holders['total_alpha_value_rao'].to_numpy()
+    role_stats = []
+
+    for role in ROLE_BITS:
+        in_role = role_mask(holders, role)
+        if in_role.any():
+            role_stats.append({
+                'Role': role,
+                'Coldkeys': int(in_role.sum()),
+                'Total Alpha (TAO)': float(to_tao(alpha[in_role].sum()))
+            })
+
+    return role_table(role_stats)
+
+
+def role_table(role_stats: List[Dict]) -> pd.DataFrame:
+    """Role rows sorted by alpha value, with their share of alpha value and of coldkeys"""
+    role_df = pd.DataFrame(role_stats, columns=['Role', 'Coldkeys', 'Total Alpha (TAO)'])
+    role_df = role_df.sort_values('Total Alpha (TAO)', ascending=False)
+    role_df['Percentage'] = (role_df['Total Alpha (TAO)'] / role_df['Total Alpha (TAO)'].sum() * 100).round(1)
+    role_df['Percentage_CK'] = (role_df['Coldkeys'] / role_df['Coldkeys'].sum() * 100).round(1)
+    return role_df
+
+
+def summary_metrics(holders: pd.DataFrame) -> Dict[str, float]:
+    """Headline numbers shown above the filtered sections"""
+    return {
+        'holders': len(holders),
+        'total_alpha_value': float(to_tao(holders['total_alpha_value_rao'].sum())),
+        'proxy_count': int(holders['has_staking_proxy'].sum()),
+    }
@@ -0,0 +1,107 @@
+"""Single-pass histogram binning shared by the create_breakdown_* sections"""
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard.rao import group_sums, to_tao
+
+INF = float('inf')
+
+
+@dataclass(frozen=True)
+class Buckets:
+    """Bucket labels with their boundaries: bucket i covers edges[i] <= value < edges[i + 1]"""
+    labels: Tuple[str, ...]
+    edges: Tuple[float, ...]
+
+    def __post_init__(self):
+        if len(self.edges) != len(self.labels) + 1:
+            raise ValueError("Buckets need exactly one more edge than labels")
+        if any(lo >= hi for lo, hi in zip(self.edges, self.edges[1:])):
+            raise ValueError("Bucket edges must be strictly increasing")
+
+
+# Integer columns use half-open edges, so '1-5' is [1, 6)
+TX_BUCKETS = Buckets(
+    labels=('0', '1-5', '6-10', '11-20', '21-30', '31-50', '51-75', '76-100', '101-200', '201-500', '500+'),
+    edges=(0, 1, 6, 11, 21, 31, 51, 76, 101, 201, 501, INF),
+)
+
+TX_TIME_BUCKETS = Buckets(
+    labels=('0', '1-5', '6-12', '13-25', '26-50', '51-100', '100+'),
+    edges=(0, 1, 6, 13, 26, 51, 101, INF),
+)
+
+TX_TIME_DETAIL_BUCKETS = Buckets(
+    labels=('1', '2', '3', '4', '5'),
+    edges=(1, 2, 3, 4, 5, 6),
+)
+
+TOKEN_BUCKETS = Buckets(
+    labels=('1', '2-3', '4-5', '6-8', '9-12', '13-16', '17-20', '21-30', '31-50', '50+'),
+    edges=(1, 2, 4, 6, 9, 13, 17, 21, 31, 51, INF),
+)
+
+ALPHA_PERCENTAGE_BUCKETS = Buckets(
+    labels=('0-25%', '25-50%', '50-75%', '75-90%', '90-95%', '95-99%', '99-100%'),
+    edges=(-INF, 25, 50, 75, 90, 95, 99, INF),
+)
+
+
+def with_percentages(df: pd.DataFrame) -> pd.DataFrame:
+    """Add each row's share of the total alpha value and of the coldkeys"""
+    df['Pct_Alpha'] = (df['Total Alpha (TAO)'] / df['Total Alpha (TAO)'].sum() * 100).round(1)
+    df['Pct_Coldkeys'] = (df['Coldkeys'] / df['Coldkeys'].sum() * 100).round(1)
+    return df
+
+
+def assign_buckets(values: np.ndarray, buckets: Buckets) -> np.ndarray:
+    """Bucket index for every value, -1 where the value falls outside all buckets"""
+    edges = np.asarray(buckets.edges, dtype=np.float64)
+    index = np.searchsorted(edges, values, side='right') - 1
+    index[index >= len(buckets.labels)] = -1
+    return index
+
+
+def bucket_table(values: np.ndarray, alpha_rao: np.ndarray, buckets: Buckets, label: str = 'Category') -> pd.DataFrame:
+    """Coldkey counts and alpha sums (with percentages) per bucket, computed in one pass"""
+    index = assign_buckets(values, buckets)
+    inside = index >= 0
+    n = len(buckets.labels)
+    return counts_table(
+        buckets,
+        np.bincount(index[inside], minlength=n),
+        group_sums(index[inside], alpha_rao[inside], minlength=n),
+        label,
+    )
+
+
+def counts_table(buckets: Buckets, counts: np.ndarray, sums: np.ndarray, label: str = 'Category') -> pd.DataFrame:
+    """Bucket table (with percentages) from per-bucket coldkey counts and alpha sums in RAO"""
+    return with_percentages(pd.DataFrame({
+        label: list(buckets.labels),
+        'Coldkeys': counts,
+        'Total Alpha (TAO)': to_tao(sums)
+    }))
+
+
+def exact_value_table(values: np.ndarray, alpha_rao: np.ndarray, label: str) -> pd.DataFrame:
+    """Coldkey counts and alpha sums (with percentages) for every distinct integer value present"""
+    if len(values) and values.min() >= 0:
+        counts = np.bincount(values)
+        sums = group_sums(values, alpha_rao, minlength=len(counts))
+        present = np.flatnonzero(counts)
+        return with_percentages(pd.DataFrame({
+            label: present,
+            'Coldkeys': counts[present],
+            'Total Alpha (TAO)': to_tao(sums[present])
+        }))
+
+    present, inverse = np.unique(values, return_inverse=True)
+    return with_percentages(pd.DataFrame({
+        label: present,
+        'Coldkeys': np.bincount(inverse, minlength=len(present)),
+        'Total Alpha (TAO)': to_tao(group_sums(inverse, alpha_rao, minlength=len(present)))
+    }))
@@ -0,0 +1,57 @@
+"""Bounded LRU memoization for section aggregates"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import astuple, is_dataclass
+from typing import Any, Callable, Dict
+
+
+def cache_key(*parts: Any) -> str:
+    """Canonical hash of the key parts (dataclasses are normalized to tuples)"""
+    normalized = [astuple(part) if is_dataclass(part) else part for part in parts]
+    payload = json.dumps(normalized, sort_keys=True, default=repr)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class AggregateCache:
+    """Thread-safe LRU cache shared by every session of a worker process
+
+    Cached values are handed out as-is, so callers must treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Compute outside the lock so slow sections don't block other sessions
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'maxsize': self.maxsize}
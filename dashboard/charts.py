@@ -0,0 +1,120 @@
+"""Plotly figure factories sharing one registered template
+
+Every chart used to be built with px's default template (several KB of JSON
+shipped with each figure) and then restyled by hand. The dashboard's look now
+lives in one small template, and figures are cached by a digest of the frame
+they are drawn from, so unchanged sections skip figure construction. Streamlit
+still serializes a figure whenever it is sent; sections being fragments is what
+keeps unchanged charts from being sent again.
+"""
+import hashlib
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# Light to dark brand blue, used for every bar chart
+COLOR_SCALE = [[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']]
+
+TEMPLATE_NAME = 'alpha_holders'
+
+# Part of every figure cache key: bump whenever the template or a factory changes
+THEME_VERSION = '1'
+
+pio.templates[TEMPLATE_NAME] = go.layout.Template(layout=dict(
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(size=12),
+    margin=dict(l=20, r=20, t=40, b=20),
+    showlegend=True,
+    legend=dict(
+        orientation="v",
+        yanchor="top",
+        y=1,
+        xanchor="left",
+        x=1.02
+    ),
+    colorscale=dict(sequential=COLOR_SCALE),
+    coloraxis=dict(colorscale=COLOR_SCALE, showscale=False),
+))
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """Content hash of a frame's column names and values"""
+    digest = hashlib.sha1('\x1f'.join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def bar_chart(df: pd.DataFrame, x: str, y: str, title: str, text: str, hovertemplate: str,
+              log_y: bool = False) -> go.Figure:
+    """Vertical bars colored by value and labelled with a percentage column"""
+    fig = px.bar(df, x=x, y=y, title=title, color=y, text=text, log_y=log_y, template=TEMPLATE_NAME)
+    fig.update_traces(
+        hovertemplate=hovertemplate,
+        texttemplate='%{text:.1f}%',
+        textposition='outside'
+    )
+    fig.update_xaxes(title_text='')
+    return fig
+
+
+def subnet_chart(subnet_df: pd.DataFrame) -> go.Figure:
+    """One horizontal bar per subnet, largest value first"""
+    # Labels are formatted by plotly.js from x instead of shipping a string per bar
+    fig = go.Figure(go.Bar(
+        y=subnet_df['Subnet Name'],
+        x=subnet_df['Total Value (TAO)'],
+        orientation='h',
+        texttemplate='%{x:,.0f} TAO',
+        textposition='auto',
+        marker=dict(
+            color=subnet_df['Total Value (TAO)'],
+            colorscale=COLOR_SCALE,
+            showscale=False
+        ),
+        hovertemplate='<b>%{y}</b><br>Total Value: %{x:,.2f} TAO<br>Stakers: %{customdata}<extra></extra>',
+        customdata=subnet_df['Number of Stakers']
+    ))
+
+    fig.update_layout(
+        template=TEMPLATE_NAME,
+        title=f'Alpha Value Distribution Across All Subnets ({len(subnet_df)} subnets)',
+        xaxis_title='Total Alpha Value (TAO)',
+        yaxis_title='Subnet',
+        height=max(600, len(subnet_df) * 20),  # Minimum 600px, 20px per subnet
+        showlegend=False,
+        yaxis=dict(autorange="reversed"),
+    )
+    return fig
+
+
+def lorenz_chart(lorenz_df: pd.DataFrame) -> go.Figure:
+    """Lorenz curve against the line of perfect equality"""
+    fig = go.Figure([
+        go.Scatter(
+            x=lorenz_df['Holders (%)'],
+            y=lorenz_df['Value (%)'],
+            mode='lines',
+            name='Holders',
+            line=dict(color=COLOR_SCALE[-1][1]),
+            fill='tozeroy',
+            hovertemplate='Poorest %{x:.0f}% of holders hold %{y:.2f}% of the value<extra></extra>'
+        ),
+        go.Scatter(
+            x=[0, 100],
+            y=[0, 100],
+            mode='lines',
+            name='Perfect equality',
+            line=dict(color='gray', dash='dash'),
+            hoverinfo='skip'
+        ),
+    ])
+    fig.update_layout(
+        template=TEMPLATE_NAME,
+        title='Lorenz Curve of Total Wallet Value',
+        xaxis_title='Cumulative share of holders (%)',
+        yaxis_title='Cumulative share of value (%)',
+    )
+    return fig
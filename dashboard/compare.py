@@ -0,0 +1,76 @@
+"""Per-coldkey changes between two snapshots"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dashboard.holders import RAO_COLUMNS, Snapshot
+from dashboard.rao import to_tao
+
+# Holder columns compared between runs: display name -> column
+DELTA_COLUMNS = {
+    'Alpha Value (TAO)': 'total_alpha_value_rao',
+    'Total Value (TAO)': 'total_wallet_value_rao',
+    'Unique Tokens': 'unique_alpha_tokens',
+    'Transactions': 'number_tx',
+}
+
+# Status of a coldkey in the newer snapshot relative to the older one
+STATUSES = ('New', 'Exited', 'Changed', 'Unchanged')
+
+
+def coldkey_deltas(old: Snapshot, new: Snapshot) -> pd.DataFrame:
+    """Before/after/delta of every compared column for the union of both snapshots' coldkeys
+
+    The join is one vectorized binary search of the new key table in the old
+    one (integer ids come out, no string is hashed); all columns are then
+    gathered positionally, never row by row. Balances are compared and
+    differenced in exact RAO and only then shown in TAO; the RAO differences
+    are kept as <column>_delta columns for exact sums.
+    """
+    in_old = old.coldkeys.ids(new.coldkeys.keys)       # -1 for coldkeys that are new
+    exited = np.setdiff1d(np.arange(len(old.coldkeys)), in_old[in_old >= 0], assume_unique=True)
+
+    # Rows: every coldkey of the new snapshot, then those that only exist in the old one
+    n_new, n_exited = len(new.coldkeys), len(exited)
+    old_rows = np.concatenate([in_old, exited])
+    new_rows = np.concatenate([np.arange(n_new), np.full(n_exited, -1)])
+
+    coldkeys = pa.concat_arrays([new.coldkeys.text(np.arange(n_new)), old.coldkeys.text(exited)])
+    frame = {'Coldkey': pd.arrays.ArrowStringArray(coldkeys)}
+    changed = np.zeros(n_new + n_exited, dtype=bool)
+    for name, column in DELTA_COLUMNS.items():
+        before = _gather(old.holders[column].to_numpy(), old_rows)
+        after = _gather(new.holders[column].to_numpy(), new_rows)
+        changed |= before != after
+        scale = to_tao if column in RAO_COLUMNS else _as_float
+        frame[f'{name} Before'] = scale(before)
+        frame[f'{name} After'] = scale(after)
+        frame[f'{name} Δ'] = scale(after - before)
+        if column in RAO_COLUMNS:
+            frame[f'{column}_delta'] = after - before  # Exact, for sums; not displayed
+
+    status = np.where(old_rows < 0, 0, np.where(new_rows < 0, 1, np.where(changed, 2, 3)))
+    frame['Status'] = pd.Categorical.from_codes(status, categories=list(STATUSES))
+    return pd.DataFrame(frame)
+
+
+def _gather(values: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """values[rows] as int64, with 0 where rows is -1 (coldkey absent from that snapshot)"""
+    gathered = values.astype(np.int64)[np.maximum(rows, 0)] if len(values) else np.zeros(len(rows), dtype=np.int64)
+    gathered[rows < 0] = 0
+    return gathered
+
+
+def _as_float(values: np.ndarray) -> np.ndarray:
+    """Counts shown as floats, like the TAO columns next to them"""
+    return values.astype(np.float64)
+
+
+def delta_summary(deltas: pd.DataFrame) -> dict:
+    """Coldkey counts per status and the net alpha value change"""
+    counts = deltas['Status'].value_counts()
+    return {
+        **{status: int(counts.get(status, 0)) for status in STATUSES},
+        # Summed in RAO so the net change is exact, shown in TAO
+        'net_alpha': float(to_tao(deltas['total_alpha_value_rao_delta'].to_numpy().sum())),
+    }
@@ -0,0 +1,205 @@
+"""How concentrated holdings are: Gini coefficient, top shares, percentiles and Lorenz curves
+
+Every metric here is a function of the values in ascending order. The sort is
+done once per snapshot (ConcentrationIndex); a selection then only gathers its
+rows out of the precomputed order, which keeps them sorted, and works on
+sums over those sorted runs. Reruns with new filters never re-sort anything.
+Values stay in integer RAO, so totals and shares come from exact sums;
+amounts are converted to TAO only in the returned metrics and tables.
+"""
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from dashboard.holders import Snapshot
+from dashboard.rao import to_tao
+
+# Percentiles of the wallet value reported for the filtered population
+PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+# Shares of the total held by the top x% of holders
+TOP_SHARES = (1, 10)
+
+# Points of the Lorenz curve sent to the chart (0%, 1%, ..., 100% of holders)
+LORENZ_POINTS = 101
+
+
+def gini_from_sums(n: int, total, weighted: float) -> float:
+    """Gini coefficient from the count, the total and the rank-weighted sum (ranks 1..n, ascending)"""
+    if n == 0 or total <= 0:
+        return 0.0
+    # Float total: n * total in RAO can overflow int64
+    return float(2 * weighted / (n * float(total)) - (n + 1) / n)
+
+
+def gini(sorted_values: np.ndarray) -> float:
+    """Gini coefficient of non-negative values in ascending order (0 = equal, 1 = one holder owns all)"""
+    # Float ranks: rank-weighted RAO would overflow int64
+    ranks = np.arange(1, len(sorted_values) + 1, dtype=np.float64)
+    return gini_from_sums(len(sorted_values), sorted_values.sum(), np.dot(ranks, sorted_values))
+
+
+def top_count(n, percent: float):
+    """How many of n values make up the top percent% (at least one)"""
+    return np.maximum(1, np.ceil(n * percent / 100).astype(np.int64))
+
+
+def top_share(sorted_values: np.ndarray, percent: float) -> float:
+    """Percentage of the total held by the largest percent% of values (at least one value)"""
+    n = len(sorted_values)
+    total = sorted_values.sum()
+    if n == 0 or total <= 0:
+        return 0.0
+    k = int(top_count(n, percent))
+    return float(sorted_values[n - k:].sum() / total * 100)
+
+
+def sorted_quantile(sorted_values: np.ndarray, q: float) -> float:
+    """Quantile of values in ascending order, interpolated like np.quantile's default method"""
+    n = len(sorted_values)
+    if n == 0:
+        return 0.0
+    position = q * (n - 1)
+    lo = int(np.floor(position))
+    hi = min(lo + 1, n - 1)
+    return float(sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (position - lo))
+
+
+def concentration_metrics(sorted_values: np.ndarray) -> Dict[str, float]:
+    """Gini, top shares and percentiles of values in ascending order"""
+    metrics = {
+        'holders': len(sorted_values),
+        'total': sorted_values.sum().item(),
+        'gini': gini(sorted_values),
+    }
+    for percent in TOP_SHARES:
+        metrics[f'top_{percent}_share'] = top_share(sorted_values, percent)
+    for percentile in PERCENTILES:
+        metrics[f'p{percentile}'] = sorted_quantile(sorted_values, percentile / 100)
+    return metrics
+
+
+def metrics_in_tao(metrics: Dict[str, float]) -> Dict[str, float]:
+    """Concentration metrics with the total and percentiles converted from RAO to TAO"""
+    for name in ['total', *(f'p{percentile}' for percentile in PERCENTILES)]:
+        metrics[name] = float(to_tao(metrics[name]))
+    return metrics
+
+
+def lorenz_ranks(n: int, points: int = LORENZ_POINTS) -> np.ndarray:
+    """Ranks (0..n) whose running totals the Lorenz curve's points interpolate between"""
+    lo = np.floor(np.linspace(0, n, points)).astype(np.int64)
+    return np.unique(np.concatenate([lo, np.minimum(lo + 1, n)]))
+
+
+def lorenz_table(n: int, ranks: np.ndarray, running: np.ndarray, points: int = LORENZ_POINTS) -> pd.DataFrame:
+    """Lorenz curve from the running totals (sum of the rank smallest values) at lorenz_ranks(n), or more ranks"""
+    holders_share = np.linspace(0, 100, points)
+    total = running[-1]
+    # Interpolating the cumulative sum between whole holders
+    value_share = np.interp(holders_share / 100 * n, ranks, running)
+    return pd.DataFrame({
+        'Holders (%)': holders_share,
+        'Value (%)': value_share / total * 100 if total > 0 else holders_share,
+    })
+
+
+def lorenz_curve(sorted_values: np.ndarray, points: int = LORENZ_POINTS) -> pd.DataFrame:
+    """Cumulative share of the total against the cumulative share of holders, poorest first"""
+    n = len(sorted_values)
+    cumulative = np.concatenate([[0], np.cumsum(sorted_values)])
+    return lorenz_table(n, np.arange(n + 1), cumulative, points)
+
+
+def subnet_table(subnet_names: pd.Series, netuid: np.ndarray, counts: np.ndarray, totals: np.ndarray,
+                 weighted: np.ndarray, tops: Dict[int, np.ndarray], median: np.ndarray) -> pd.DataFrame:
+    """Per-subnet concentration table from each subnet's staker count, exact total (RAO), rank-weighted sum,
+    top TOP_SHARES sums (RAO) and median holding (RAO)"""
+    positive = totals > 0
+    safe_totals = np.where(positive, totals, 1.0)
+    frame = {
+        'Netuid': netuid,
+        'Subnet Name': subnet_names.reindex(netuid).fillna('').to_numpy(),
+        'Stakers': counts,
+        'Total Value (TAO)': to_tao(totals),
+        'Gini': np.where(positive, 2 * weighted / (counts * safe_totals) - (counts + 1) / counts, 0.0),
+    }
+    for percent in TOP_SHARES:
+        frame[f'Top {percent}% Share (%)'] = np.where(positive, tops[percent] / safe_totals * 100, 0.0)
+    frame['Median Holding (TAO)'] = to_tao(median)
+    return pd.DataFrame(frame)
+
+
+def segment_sums(values: np.ndarray, starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """values[start:stop].sum() for every (start, stop) pair with start < stop, in the dtype of values
+
+    Summed segment by segment (reduceat) rather than as differences of one
+    running total, which would lose the precision of small subnets next to
+    large ones when the values are floats.
+    """
+    if len(starts) == 0:
+        return np.zeros(0, dtype=values.dtype)
+    bounds = np.column_stack([starts, stops]).ravel()
+    # A trailing zero keeps the last stop a valid index; odd positions sum the gaps and are dropped
+    return np.add.reduceat(np.append(values, values.dtype.type(0)), bounds)[::2]
+
+
+class ConcentrationIndex:
+    """Holder wallet values and per-subnet holding values (RAO), sorted once per snapshot
+
+    Holdings are ordered by (netuid, value), so after dropping unselected
+    holders every subnet is still one ascending run and all subnets are
+    measured together with segmented sums.
+    """
+
+    def __init__(self, snapshot: Snapshot):
+        wallet = snapshot.holders['total_wallet_value_rao'].to_numpy()
+        self._wallet_order = np.argsort(wallet, kind='stable')
+        self._wallet_sorted = wallet[self._wallet_order]
+
+        holdings = snapshot.holdings
+        value = holdings['value_rao'].to_numpy()
+        netuid = holdings['netuid'].to_numpy()
+        order = np.lexsort((value, netuid))
+        self._holding_holder = holdings['holder'].to_numpy()[order]
+        self._holding_netuid = netuid[order]
+        self._holding_value = value[order]
+        self._subnet_names = snapshot.subnet_names
+
+    def wallet_values(self, mask: np.ndarray) -> np.ndarray:
+        """total_wallet_value_rao of the selected holders, ascending"""
+        return self._wallet_sorted[mask[self._wallet_order]]
+
+    def population(self, mask: np.ndarray) -> Dict[str, float]:
+        """Concentration of wallet value across the selected holders, amounts in TAO"""
+        return metrics_in_tao(concentration_metrics(self.wallet_values(mask)))
+
+    def lorenz(self, mask: np.ndarray) -> pd.DataFrame:
+        """Lorenz curve of wallet value across the selected holders"""
+        return lorenz_curve(self.wallet_values(mask))
+
+    def per_subnet(self, mask: np.ndarray) -> pd.DataFrame:
+        """Concentration of holding value among each subnet's selected stakers"""
+        keep = mask[self._holding_holder]
+        netuid = self._holding_netuid[keep]
+        value = self._holding_value[keep]
+
+        starts = np.flatnonzero(np.r_[True, netuid[1:] != netuid[:-1]]) if len(netuid) else np.empty(0, dtype=np.int64)
+        counts = np.diff(np.r_[starts, len(netuid)])
+        ends = starts + counts
+        totals = segment_sums(value, starts, ends)
+
+        # Rank-weighted sum per run, ranks restarting at 1 in every subnet
+        ranks = np.arange(len(value)) - np.repeat(starts, counts) + 1
+        weighted = segment_sums(ranks * value.astype(np.float64), starts, ends)
+        tops = {percent: segment_sums(value, ends - top_count(counts, percent), ends) for percent in TOP_SHARES}
+
+        # Median holding, interpolated within each run
+        position = starts + 0.5 * (counts - 1)
+        lo = np.floor(position).astype(np.int64)
+        hi = np.minimum(lo + 1, ends - 1)
+        median = value[lo] + (value[hi] - value[lo]) * (position - lo) if len(value) else np.zeros(0)
+
+        subnet_netuids = netuid[starts] if len(netuid) else np.empty(0, dtype=np.int64)
+        return subnet_table(self._subnet_names, subnet_netuids, counts, totals, weighted, tops, median)
@@ -0,0 +1,223 @@
+"""Precomputed rollups of the bucketed sections over every role × proxy × value × token cell
+
+The sidebar filters the dashboard opens with are low-cardinality: a role, a
+staking proxy choice and wallet-value / token-count ranges. build_cube runs
+once per snapshot (next to the binary tables) and stores, for every
+combination of role bitmask, proxy flag, wallet-value cell and token-count
+cell, the coldkey count and alpha sum of each section bucket. When a filter
+state only uses those dimensions, and its ranges fall on cell edges, a
+section is answered by summing a few thousand cube rows instead of scanning
+every holder; anything else falls back to the row engine.
+"""
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard.aggregates import breakdown, role_table, role_totals, summary_metrics
+from dashboard.binning import (
+    ALPHA_PERCENTAGE_BUCKETS,
+    TOKEN_BUCKETS,
+    TX_BUCKETS,
+    TX_TIME_BUCKETS,
+    TX_TIME_DETAIL_BUCKETS,
+    counts_table,
+)
+from dashboard.filters import FilterState, RANGE_COLUMNS, Selection, column_bounds
+from dashboard.holders import ROLE_BITS, Snapshot
+from dashboard.rao import RAO_PER_TAO, group_sums, to_tao
+
+# Bucketed sections held in the cube, by their cached_aggregate name: (column, buckets, label)
+CUBE_SECTIONS = {
+    'tx': ('number_tx', TX_BUCKETS, 'Category'),
+    'tx_time': ('tx_time', TX_TIME_BUCKETS, 'Category'),
+    'tx_time_1_5': ('tx_time', TX_TIME_DETAIL_BUCKETS, 'Sessions'),
+    'tokens': ('unique_alpha_tokens', TOKEN_BUCKETS, 'Category'),
+    'alpha_percentage': ('alpha_percentage', ALPHA_PERCENTAGE_BUCKETS, 'Category'),
+}
+
+# Section code 0 has a single bucket holding every holder (summary metrics and role totals)
+TOTALS = 0
+SECTION_CODES = {name: code for code, name in enumerate(CUBE_SECTIONS, start=1)}
+
+# Filter dimensions: values are quantized on these edges (in column units), ranges have to start
+# and end on one. Wallet inputs step by whole TAO, so a 1-2-5 series in RAO; token counts are exact up to 10.
+CELL_EDGES = {
+    'wallet_value': (0,) + tuple(m * 10 ** e * RAO_PER_TAO // 100 for e in range(10) for m in (1, 2, 5)),
+    'tokens': tuple(range(11)) + (12, 15, 20, 25, 30, 40, 50, 64, 100, 128, 256),
+}
+
+# Dimension columns of the cube table, in key order
+CELL_COLUMNS = {'wallet_value': 'wallet_cell', 'tokens': 'token_cell'}
+
+
+@dataclass
+class AggregateCube:
+    """Cube rows sorted by section, plus the (min, max) of every filter dimension column"""
+    cells: pd.DataFrame
+    extents: Dict[str, Tuple[float, float]]
+
+
+def assign_cells(values: np.ndarray, edges: Tuple[float, ...]) -> np.ndarray:
+    """Cell of every value: each edge is a cell of its own, and so is each gap between edges
+
+    Cell 0 is below the first edge, cell 2i + 1 is exactly edges[i] and cell
+    2i + 2 lies strictly between edges[i] and edges[i + 1], so both inclusive
+    bounds of a range that start and end on edges map onto whole cells.
+    """
+    edges = np.asarray(edges, dtype=np.float64)
+    index = np.searchsorted(edges, values, side='right') - 1
+    above = values > edges[np.maximum(index, 0)]
+    return np.where(index < 0, 0, 2 * index + 1 + above).astype(np.int16)
+
+
+def cell_range(bounds: Optional[Tuple[float, float]], edges: Tuple[float, ...],
+               extent: Tuple[float, float]) -> Optional[Tuple[int, int]]:
+    """Inclusive (first, last) cells covering an inclusive value range, None if it doesn't line up
+
+    Bounds are in column units. Bounds beyond the column's own extent cover everything on that side, so
+    the sidebar's untouched min/max inputs always line up.
+    """
+    last = 2 * len(edges)
+    if bounds is None:
+        return 0, last
+    lo, hi = bounds
+    if lo <= extent[0]:
+        first = 0
+    elif lo in edges:
+        first = 2 * edges.index(lo) + 1
+    else:
+        return None
+    if hi >= extent[1]:
+        stop = last
+    elif hi in edges:
+        stop = 2 * edges.index(hi) + 1
+    else:
+        return None
+    return first, stop
+
+
+def build_cube(snapshot: Snapshot) -> AggregateCube:
+    """Roll every bucketed section up over the role, proxy, wallet-value and token-count cells"""
+    holders = snapshot.holders
+    alpha = holders['total_alpha_value_rao'].to_numpy()
+    roles = holders['roles'].to_numpy().astype(np.int64)
+    proxy = holders['has_staking_proxy'].to_numpy().astype(np.int64)
+    cells = {
+        field: assign_cells(holders[RANGE_COLUMNS[field]].to_numpy(), edges).astype(np.int64)
+        for field, edges in CELL_EDGES.items()
+    }
+    wallet_cells = 2 * len(CELL_EDGES['wallet_value']) + 1
+    token_cells = 2 * len(CELL_EDGES['tokens']) + 1
+    base = ((roles * 2 + proxy) * wallet_cells + cells['wallet_value']) * token_cells + cells['tokens']
+
+    sections = [(TOTALS, np.zeros(len(holders), dtype=np.int64), 1)]
+    for name, (column, buckets, _) in CUBE_SECTIONS.items():
+        edges = np.asarray(buckets.edges, dtype=np.float64)
+        bucket = np.searchsorted(edges, holders[column].to_numpy(), side='right') - 1
+        bucket[bucket >= len(buckets.labels)] = -1
+        sections.append((SECTION_CODES[name], bucket, len(buckets.labels)))
+
+    parts = []
+    for code, bucket, num_buckets in sections:
+        inside = bucket >= 0
+        keys, inverse = np.unique(base[inside] * num_buckets + bucket[inside], return_inverse=True)
+        cell, bucket_index = np.divmod(keys, num_buckets)
+        cell, token_cell = np.divmod(cell, token_cells)
+        cell, wallet_cell = np.divmod(cell, wallet_cells)
+        cell_roles, cell_proxy = np.divmod(cell, 2)
+        parts.append(pd.DataFrame({
+            'section': np.full(len(keys), code, dtype=np.int8),
+            'roles': cell_roles.astype(np.uint8),
+            'has_staking_proxy': cell_proxy.astype(bool),
+            'wallet_cell': wallet_cell.astype(np.int16),
+            'token_cell': token_cell.astype(np.int16),
+            'bucket': bucket_index.astype(np.int16),
+            'coldkeys': np.bincount(inverse, minlength=len(keys)),
+            'alpha': group_sums(inverse, alpha[inside], minlength=len(keys)),
+        }))
+
+    extents = {field: snapshot.column_index.bounds(RANGE_COLUMNS[field]) for field in CELL_EDGES}
+    return AggregateCube(cells=pd.concat(parts, ignore_index=True), extents=extents)
+
+
+def cube_rows(cube: AggregateCube, state: FilterState, code: int) -> Optional[pd.DataFrame]:
+    """Cube rows of one section matching the filter state, None if the cube can't answer it"""
+    if state.netuids or any(getattr(state, field) is not None
+                            for field in RANGE_COLUMNS if field not in CELL_EDGES):
+        return None
+    ranges = {
+        field: cell_range(column_bounds(field, getattr(state, field)), edges, cube.extents[field])
+        for field, edges in CELL_EDGES.items()
+    }
+    if any(bounds is None for bounds in ranges.values()):
+        return None
+
+    # Rows are sorted by section, so each section is one contiguous slice
+    sections = cube.cells['section'].to_numpy()
+    start, stop = np.searchsorted(sections, [code, code + 1])
+    rows = cube.cells.iloc[start:stop]
+
+    keep = np.ones(len(rows), dtype=bool)
+    if state.role != "All":
+        keep &= (rows['roles'].to_numpy() & ROLE_BITS[state.role]) != 0
+    if state.staking_proxy != "All":
+        has_proxy = rows['has_staking_proxy'].to_numpy()
+        keep &= has_proxy if state.staking_proxy == "True" else ~has_proxy
+    for field, (first, last) in ranges.items():
+        cell = rows[CELL_COLUMNS[field]].to_numpy()
+        keep &= (cell >= first) & (cell <= last)
+    return rows[keep]
+
+
+def rollup_breakdown(selection: Selection, name: str) -> pd.DataFrame:
+    """Bucketed section from the cube when the filters allow it, from the holder rows otherwise"""
+    column, buckets, label = CUBE_SECTIONS[name]
+    cube = selection.snapshot.cube
+    rows = cube_rows(cube, selection.filters, SECTION_CODES[name]) if cube is not None else None
+    if rows is None:
+        return breakdown(selection.holders, column, buckets, label)
+
+    bucket = rows['bucket'].to_numpy()
+    n = len(buckets.labels)
+    counts = np.bincount(bucket, weights=rows['coldkeys'].to_numpy(), minlength=n).astype(np.int64)
+    sums = group_sums(bucket, rows['alpha'].to_numpy(), minlength=n)
+    return counts_table(buckets, counts, sums, label)
+
+
+def rollup_summary(selection: Selection) -> Dict[str, float]:
+    """Headline numbers from the cube when the filters allow it, from the holder rows otherwise"""
+    cube = selection.snapshot.cube
+    rows = cube_rows(cube, selection.filters, TOTALS) if cube is not None else None
+    if rows is None:
+        return summary_metrics(selection.holders)
+
+    coldkeys = rows['coldkeys'].to_numpy()
+    return {
+        'holders': int(coldkeys.sum()),
+        'total_alpha_value': float(to_tao(rows['alpha'].sum())),
+        'proxy_count': int(coldkeys[rows['has_staking_proxy'].to_numpy()].sum()),
+    }
+
+
+def rollup_role_totals(selection: Selection) -> pd.DataFrame:
+    """Per-role totals from the cube when the filters allow it, from the holder rows otherwise"""
+    cube = selection.snapshot.cube
+    rows = cube_rows(cube, selection.filters, TOTALS) if cube is not None else None
+    if rows is None:
+        return role_totals(selection.holders)
+
+    roles = rows['roles'].to_numpy()
+    coldkeys = rows['coldkeys'].to_numpy()
+    alpha = rows['alpha'].to_numpy()
+    role_stats = []
+    for role, bit in ROLE_BITS.items():
+        in_role = (roles & bit) != 0
+        if coldkeys[in_role].sum():
+            role_stats.append({
+                'Role': role,
+                'Coldkeys': int(coldkeys[in_role].sum()),
+                'Total Alpha (TAO)': float(to_tao(alpha[in_role].sum()))
+            })
+    return role_table(role_stats)
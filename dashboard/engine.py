@@ -0,0 +1,326 @@
+"""Query engines behind the dashboard sections
+
+Every filtered section goes through one of two interchangeable engines:
+
+- ``memory`` (default): the numpy filter engine and aggregates over the
+  memory-mapped tables, answering from the aggregate cube where it can.
+- ``duckdb``: filters, group-bys and the concentration section's ranks and
+  quantiles are pushed down as SQL to an embedded DuckDB, scanning the binary
+  snapshot files directly, so neither the holder nor the holdings table ever
+  has to fit in RAM (nor be sorted there). Requires ``pip install duckdb``.
+
+The engine is chosen with the DASHBOARD_ENGINE environment variable. Both
+return the same frames (columns, dtypes and row order) for the same filters.
+"""
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dashboard.aggregates import distribution, role_table
+from dashboard.binning import Buckets, counts_table, with_percentages
+from dashboard.cache import AggregateCache
+from dashboard.concentration import (PERCENTILES, TOP_SHARES, ConcentrationIndex, gini_from_sums,
+                                     lorenz_ranks, lorenz_table, metrics_in_tao, subnet_table)
+from dashboard.cube import CUBE_SECTIONS, rollup_breakdown, rollup_role_totals, rollup_summary
+from dashboard.filters import RANGE_COLUMNS, FilterState, Selection, column_bounds
+from dashboard.holders import ROLE_BITS, Snapshot
+from dashboard.rao import to_tao
+from dashboard.subnets import subnet_totals
+from dashboard.topk import ranked_positions
+
+ENGINE_ENV = 'DASHBOARD_ENGINE'
+DEFAULT_ENGINE = 'memory'
+
+
+# Snapshots whose sorted concentration values an engine keeps: the one being served and the one it replaced
+SNAPSHOT_CACHE_SIZE = 2
+
+
+def snapshot_key(snapshot: Snapshot) -> str:
+    """Identifies a snapshot among the ones an engine has seen"""
+    return f"{snapshot.version}:{snapshot.directory}"
+
+
+class MemoryEngine:
+    """In-process numpy engine over the memory-mapped snapshot"""
+    name = 'memory'
+
+    def __init__(self):
+        self._concentration = AggregateCache(maxsize=SNAPSHOT_CACHE_SIZE)
+
+    def concentration_index(self, snapshot: Snapshot) -> ConcentrationIndex:
+        """Wallet and holding values of a snapshot sorted for the concentration section, built once per snapshot"""
+        return self._concentration.get_or_compute(snapshot_key(snapshot), lambda: ConcentrationIndex(snapshot))
+
+    def summary(self, selection: Selection) -> Dict[str, float]:
+        return rollup_summary(selection)
+
+    def role_totals(self, selection: Selection) -> pd.DataFrame:
+        return rollup_role_totals(selection)
+
+    def breakdown(self, selection: Selection, name: str) -> pd.DataFrame:
+        return rollup_breakdown(selection, name)
+
+    def distribution(self, selection: Selection, column: str, label: str) -> pd.DataFrame:
+        return distribution(selection.holders, column, label)
+
+    def subnet_totals(self, selection: Selection) -> pd.DataFrame:
+        return subnet_totals(selection.snapshot, selection.mask)
+
+    def top_positions(self, selection: Selection, column: str, k: int) -> np.ndarray:
+        return ranked_positions(selection, column, k)
+
+    def concentration(self, selection: Selection) -> Dict[str, float]:
+        return self.concentration_index(selection.snapshot).population(selection.mask)
+
+    def lorenz(self, selection: Selection) -> pd.DataFrame:
+        return self.concentration_index(selection.snapshot).lorenz(selection.mask)
+
+    def subnet_concentration(self, selection: Selection) -> pd.DataFrame:
+        return self.concentration_index(selection.snapshot).per_subnet(selection.mask)
+
+
+def filter_sql(state: FilterState) -> Tuple[str, List]:
+    """WHERE clause over the holders table (with its position column 'pos') and its parameters"""
+    clauses, params = [], []
+    if state.role != "All":
+        clauses.append(f"(roles & {ROLE_BITS[state.role]}) <> 0")
+    if state.staking_proxy != "All":
+        clauses.append(f"{'' if state.staking_proxy == 'True' else 'NOT '}CAST(has_staking_proxy AS BOOLEAN)")
+    for field, column in RANGE_COLUMNS.items():
+        bounds = column_bounds(field, getattr(state, field))
+        if bounds is not None:
+            clauses.append(f"{column} BETWEEN ? AND ?")
+            params.extend(bounds)
+    if state.netuids:
+        netuids = ', '.join(str(int(netuid)) for netuid in state.netuids)
+        having = f" GROUP BY holder HAVING count(DISTINCT netuid) = {len(set(state.netuids))}" if state.subnet_match == "All" else ""
+        clauses.append(f"pos IN (SELECT holder FROM holdings WHERE netuid IN ({netuids}){having})")
+    return ' AND '.join(clauses) or 'TRUE', params
+
+
+def bucket_sql(column: str, buckets: Buckets) -> str:
+    """CASE expression giving the bucket index of column, NULL outside every bucket"""
+    cases = []
+    for i, (lo, hi) in enumerate(zip(buckets.edges, buckets.edges[1:])):
+        bounds = []
+        if np.isfinite(lo):
+            bounds.append(f"{column} >= {lo!r}")
+        if np.isfinite(hi):
+            bounds.append(f"{column} < {hi!r}")
+        cases.append(f"WHEN {' AND '.join(bounds) or 'TRUE'} THEN {i}")
+    return f"CASE {' '.join(cases)} END"
+
+
+def rao_sum_sql(column: str, condition: str = '') -> str:
+    """Exact sum of an int64 RAO column, 0 when empty (DuckDB widens it to HUGEINT, which pandas reads as float)"""
+    where = f" FILTER ({condition})" if condition else ''
+    return f"CAST(coalesce(sum({column}){where}, 0) AS BIGINT)"
+
+
+def ranked_sql(value: str, source: str, partition: str = '') -> str:
+    """Rows of source with value, its ascending rank (from 1) and the row count, per partition if given"""
+    over = f"PARTITION BY {partition} " if partition else ''
+    columns = f"{partition}, " if partition else ''
+    return (
+        f"SELECT {columns}{value} AS value, row_number() OVER ({over}ORDER BY {value}) AS rank, "
+        f"count(*) OVER ({over.strip()}) AS n FROM {source}"
+    )
+
+
+def concentration_sql() -> str:
+    """Aggregates over ranked_sql rows that concentration.py turns into Gini and top shares"""
+    tops = ', '.join(
+        f"{rao_sum_sql('value', f'rank > n - greatest(1, ceil(n * {percent} / 100))')} AS top_{percent}"
+        for percent in TOP_SHARES
+    )
+    return (
+        f"count(*) AS n, {rao_sum_sql('value')} AS total, "
+        f"coalesce(sum(CAST(rank AS DOUBLE) * value), 0) AS weighted, {tops}"
+    )
+
+
+def arrow_view(df: pd.DataFrame) -> pa.Table:
+    """The frame as an Arrow table sharing its column buffers, nothing copied
+
+    Columns of a mapped snapshot are views over its Arrow files, so DuckDB still
+    scans the files out of core. Booleans are viewed as uint8, as they are
+    stored in the files.
+    """
+    columns = {}
+    for name in df.columns:
+        values = df[name].array if isinstance(df[name].dtype, pd.StringDtype) else df[name].to_numpy()
+        columns[name] = values.view(np.uint8) if values.dtype == bool else values
+    return pa.table(columns)
+
+
+class DuckDBEngine:
+    """Pushes filters and group-bys down to DuckDB scanning the snapshot's Arrow files"""
+    name = 'duckdb'
+
+    def __init__(self):
+        import duckdb  # Optional dependency, only needed when this engine is selected
+
+        self._connection = duckdb.connect()
+        self._tables = AggregateCache(maxsize=SNAPSHOT_CACHE_SIZE)
+
+    def tables(self, snapshot: Snapshot) -> Tuple[pa.Table, pa.Table]:
+        """Holders and holdings of a snapshot as Arrow tables over its columns, built once per snapshot
+
+        Going through the snapshot's columns rather than reopening its files
+        also serves snapshots parsed straight from JSON and registered runs
+        whose TAO balances were converted to RAO columns when they were read.
+        """
+        def build():
+            holders = arrow_view(snapshot.holders)
+            # Holdings reference holders by row position, which SQL has no notion of
+            holders = holders.append_column('pos', pa.array(np.arange(len(holders), dtype=np.int32)))
+            return holders, arrow_view(snapshot.holdings)
+        return self._tables.get_or_compute(snapshot_key(snapshot), build)
+
+    def _query(self, selection: Selection, sql: str, params: List = ()) -> pd.DataFrame:
+        """Run sql with 'selected' bound to the filtered holders and 'holdings' to all holdings"""
+        holders, holdings = self.tables(selection.snapshot)
+        where, where_params = filter_sql(selection.filters)
+
+        # A cursor per query, so concurrent sessions never share one connection;
+        # registering an Arrow table only creates a view over it, nothing is copied
+        cursor = self._connection.cursor()
+        cursor.register('holders', holders)
+        cursor.register('holdings', holdings)
+        query = f"WITH selected AS (SELECT * FROM holders WHERE {where}) {sql}"
+        return cursor.execute(query, [*where_params, *params]).df()
+
+    def summary(self, selection: Selection) -> Dict[str, float]:
+        row = self._query(selection, (
+            f"SELECT count(*) AS holders, {rao_sum_sql('total_alpha_value_rao')} AS total_alpha_value, "
+            "coalesce(sum(CAST(has_staking_proxy AS INTEGER)), 0) AS proxy_count FROM selected"
+        )).iloc[0]
+        return {
+            'holders': int(row['holders']),
+            'total_alpha_value': float(to_tao(int(row['total_alpha_value']))),
+            'proxy_count': int(row['proxy_count']),
+        }
+
+    def role_totals(self, selection: Selection) -> pd.DataFrame:
+        columns = ', '.join(
+            f"count(*) FILTER ((roles & {bit}) <> 0) AS c{bit}, "
+            f"{rao_sum_sql('total_alpha_value_rao', f'(roles & {bit}) <> 0')} AS a{bit}"
+            for bit in ROLE_BITS.values()
+        )
+        row = self._query(selection, f"SELECT {columns} FROM selected").iloc[0]
+        return role_table([
+            {'Role': role, 'Coldkeys': int(row[f'c{bit}']), 'Total Alpha (TAO)': float(to_tao(int(row[f'a{bit}'])))}
+            for role, bit in ROLE_BITS.items() if row[f'c{bit}'] > 0
+        ])
+
+    def breakdown(self, selection: Selection, name: str) -> pd.DataFrame:
+        column, buckets, label = CUBE_SECTIONS[name]
+        df = self._query(selection, (
+            f"SELECT bucket, count(*) AS coldkeys, {rao_sum_sql('total_alpha_value_rao')} AS alpha "
+            f"FROM (SELECT {bucket_sql(column, buckets)} AS bucket, total_alpha_value_rao FROM selected) "
+            f"WHERE bucket IS NOT NULL GROUP BY bucket"
+        ))
+        n = len(buckets.labels)
+        counts = np.zeros(n, dtype=np.int64)
+        sums = np.zeros(n, dtype=np.int64)
+        counts[df['bucket'].to_numpy()] = df['coldkeys'].to_numpy()
+        sums[df['bucket'].to_numpy()] = df['alpha'].to_numpy()
+        return counts_table(buckets, counts, sums, label)
+
+    def distribution(self, selection: Selection, column: str, label: str) -> pd.DataFrame:
+        df = self._query(selection, (
+            f"SELECT {column} AS value, count(*) AS coldkeys, {rao_sum_sql('total_alpha_value_rao')} AS alpha "
+            f"FROM selected GROUP BY {column} ORDER BY {column}"
+        ))
+        dtype = selection.snapshot.holders[column].dtype
+        return with_percentages(pd.DataFrame({
+            label: df['value'].to_numpy().astype(np.int64 if dtype.kind in 'iu' else dtype),
+            'Coldkeys': df['coldkeys'].to_numpy().astype(np.int64),
+            'Total Alpha (TAO)': to_tao(df['alpha'].to_numpy())
+        }))
+
+    def subnet_totals(self, selection: Selection) -> pd.DataFrame:
+        df = self._query(selection, (
+            f"SELECT netuid, {rao_sum_sql('balance_alpha_rao')} AS alpha, {rao_sum_sql('value_rao')} AS value, "
+            "count(*) AS stakers FROM holdings WHERE holder IN (SELECT pos FROM selected) GROUP BY netuid ORDER BY netuid"
+        ))
+        netuid = df['netuid'].to_numpy().astype(np.int64)
+        return pd.DataFrame({
+            'Netuid': netuid,
+            'Subnet Name': selection.snapshot.subnet_names.reindex(netuid).fillna('').to_numpy(),
+            'Total Alpha Staked': to_tao(df['alpha'].to_numpy()),
+            'Total Value (TAO)': to_tao(df['value'].to_numpy()),
+            'Number of Stakers': df['stakers'].to_numpy().astype(np.int64)
+        })
+
+    def top_positions(self, selection: Selection, column: str, k: int) -> np.ndarray:
+        # Ties broken by position, exactly like dashboard.topk.top_k
+        df = self._query(selection, f"SELECT pos FROM selected ORDER BY {column} DESC, pos LIMIT ?", [int(k)])
+        return df['pos'].to_numpy().astype(np.int64)
+
+    # Concentration: ranks, running totals and quantiles are window and
+    # aggregate functions, so DuckDB sorts out of core and only a row per
+    # subnet (or per Lorenz point) comes back
+    def concentration(self, selection: Selection) -> Dict[str, float]:
+        quantiles = ', '.join(
+            f"coalesce(quantile_cont(value, {percentile / 100!r}), 0) AS p{percentile}" for percentile in PERCENTILES
+        )
+        row = self._query(selection, (
+            f"SELECT {concentration_sql()}, {quantiles} "
+            f"FROM ({ranked_sql('total_wallet_value_rao', 'selected')})"
+        )).iloc[0]
+        n, total = int(row['n']), int(row['total'])
+        metrics = {'holders': n, 'total': total, 'gini': gini_from_sums(n, total, float(row['weighted']))}
+        for percent in TOP_SHARES:
+            metrics[f'top_{percent}_share'] = float(row[f'top_{percent}'] / total * 100) if n and total > 0 else 0.0
+        for percentile in PERCENTILES:
+            metrics[f'p{percentile}'] = float(row[f'p{percentile}'])
+        return metrics_in_tao(metrics)
+
+    def lorenz(self, selection: Selection) -> pd.DataFrame:
+        n = int(self._query(selection, "SELECT count(*) AS n FROM selected").iloc[0]['n'])
+        ranks = lorenz_ranks(n)
+        df = self._query(selection, (
+            "SELECT rank, running FROM (SELECT row_number() OVER w AS rank, "
+            "CAST(sum(total_wallet_value_rao) OVER w AS BIGINT) AS running FROM selected "
+            "WINDOW w AS (ORDER BY total_wallet_value_rao ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)) "
+            f"WHERE rank IN ({', '.join(str(rank) for rank in ranks)}) ORDER BY rank"
+        ))
+        # ranks starts at 0, the empty prefix, which no row has
+        running = np.zeros(len(ranks), dtype=np.int64)
+        running[1:] = df['running'].to_numpy()
+        return lorenz_table(n, ranks, running)
+
+    def subnet_concentration(self, selection: Selection) -> pd.DataFrame:
+        ranked = ranked_sql('value_rao', 'holdings WHERE holder IN (SELECT pos FROM selected)', 'netuid')
+        df = self._query(selection, (
+            f"SELECT netuid, {concentration_sql()}, quantile_cont(value, 0.5) AS median "
+            f"FROM ({ranked}) GROUP BY netuid ORDER BY netuid"
+        ))
+        return subnet_table(
+            selection.snapshot.subnet_names,
+            df['netuid'].to_numpy().astype(selection.snapshot.holdings['netuid'].dtype),
+            df['n'].to_numpy().astype(np.int64),
+            df['total'].to_numpy().astype(np.int64),
+            df['weighted'].to_numpy(),
+            {percent: df[f'top_{percent}'].to_numpy().astype(np.int64) for percent in TOP_SHARES},
+            df['median'].to_numpy().astype(np.float64),
+        )
+
+
+ENGINES = {
+    'memory': MemoryEngine,
+    'duckdb': DuckDBEngine,
+}
+
+
+def make_engine(name: str = ''):
+    """Engine named by the argument, else by DASHBOARD_ENGINE, else the in-memory one"""
+    name = (name or os.environ.get(ENGINE_ENV) or DEFAULT_ENGINE).strip().lower()
+    if name not in ENGINES:
+        raise ValueError(f"Unknown {ENGINE_ENV} '{name}' (expected one of: {', '.join(ENGINES)})")
+    return ENGINES[name]()
@@ -0,0 +1,169 @@
+"""Filter engine: turns the sidebar state into one boolean mask over the holder table"""
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard.holders import Snapshot, role_mask
+from dashboard.rao import to_rao
+from dashboard.tracing import phase
+
+# Inclusive (min, max) bounds; None means the filter is not applied
+Range = Optional[Tuple[float, float]]
+
+
+@dataclass(frozen=True)
+class FilterState:
+    """Normalized sidebar filter state"""
+    role: str = "All"
+    staking_proxy: str = "All"
+    wallet_value: Range = None
+    tokens: Range = None
+    number_tx: Range = None
+    tx_time: Range = None
+    alpha_percentage: Range = None
+    netuids: Tuple[int, ...] = ()
+    subnet_match: str = "Any"  # "Any": staked in at least one of netuids, "All": in every one
+
+    def describe(self) -> str:
+        """Human readable summary for the 'Filters Active' banner"""
+        parts = [f"Role = {self.role}", f"Staking Proxy = {self.staking_proxy}"]
+        if self.wallet_value is not None:
+            parts.append(f"Wallet Value = {self.wallet_value[0]:.0f}-{self.wallet_value[1]:.0f} TAO")
+        if self.tokens is not None:
+            parts.append(f"Tokens = {self.tokens[0]}-{self.tokens[1]}")
+        if self.number_tx is not None:
+            parts.append(f"TX = {self.number_tx[0]}-{self.number_tx[1]}")
+        if self.tx_time is not None:
+            parts.append(f"Sessions = {self.tx_time[0]}-{self.tx_time[1]}")
+        if self.alpha_percentage is not None:
+            parts.append(f"Alpha % = {self.alpha_percentage[0]:.0f}-{self.alpha_percentage[1]:.0f}")
+        if self.netuids:
+            parts.append(f"Subnets ({self.subnet_match.lower()}) = {', '.join(str(n) for n in self.netuids)}")
+        return " | ".join(parts)
+
+
+# Range filters map one-to-one onto holder table columns
+RANGE_COLUMNS = {
+    'wallet_value': 'total_wallet_value_rao',
+    'tokens': 'unique_alpha_tokens',
+    'number_tx': 'number_tx',
+    'tx_time': 'tx_time',
+    'alpha_percentage': 'alpha_percentage',
+}
+
+# Range filters set in TAO over columns held in RAO
+TAO_RANGES = {'wallet_value'}
+
+
+# Share of the holders up to which a range filter is scattered from the sorted index rather than compared row by row
+SCATTER_SHARE = 0.125
+
+
+def column_bounds(field: str, bounds: Range) -> Range:
+    """Bounds of a range filter in the units of its column"""
+    if bounds is None or field not in TAO_RANGES:
+        return bounds
+    lo, hi = to_rao(bounds).tolist()
+    return lo, hi
+
+
+def range_predicate(snapshot: Snapshot, column: str, bounds: Tuple[float, float]) -> Optional[np.ndarray]:
+    """Holders whose column value lies within the inclusive bounds, None if that is every holder
+
+    Resolved through the snapshot's column index: the column bounds skip a
+    range spanning the whole column, and two binary searches find the slice of
+    the column's sorted permutation inside the range. Only that slice (or what
+    lies outside it, whichever is smaller) is written into the mask; ranges
+    splitting the holders more evenly are cheaper to compare row by row.
+    """
+    index = snapshot.column_index
+    lowest, highest = index.bounds(column)
+    if bounds[0] <= lowest and bounds[1] >= highest:
+        return None
+    order = index.sorted_order(column)
+    start, stop = index.span(column, *bounds)
+    inside, rows = stop - start, len(order)
+    if inside <= rows * SCATTER_SHARE:
+        mask = np.zeros(rows, dtype=bool)
+        mask[order[start:stop]] = True
+    elif rows - inside <= rows * SCATTER_SHARE:
+        mask = np.ones(rows, dtype=bool)
+        mask[order[:start]] = False
+        mask[order[stop:]] = False
+    else:
+        values = snapshot.holders[column].to_numpy()
+        mask = (values >= bounds[0]) & (values <= bounds[1])
+    return mask
+
+
+def proxy_predicate(holders: pd.DataFrame, proxy_filter: str) -> np.ndarray:
+    """Holders matching the "True"/"False" staking proxy filter"""
+    has_proxy = holders['has_staking_proxy'].to_numpy()
+    return has_proxy if proxy_filter == "True" else ~has_proxy
+
+
+def subnet_predicate(snapshot: Snapshot, netuids: Tuple[int, ...], match: str = "Any") -> np.ndarray:
+    """Holders with alpha staked in any ("Any") or every ("All") one of the given subnets"""
+    index = snapshot.subnet_index
+    if match != "All":
+        return index.mask_any(netuids, len(snapshot.holders))
+    mask = np.zeros(len(snapshot.holders), dtype=bool)
+    mask[index.all_of(netuids)] = True
+    return mask
+
+
+def iter_predicates(snapshot: Snapshot, state: FilterState) -> Iterator[np.ndarray]:
+    """Yield one boolean mask per active filter"""
+    holders = snapshot.holders
+    if state.role != "All":
+        yield role_mask(holders, state.role)
+    if state.staking_proxy != "All":
+        yield proxy_predicate(holders, state.staking_proxy)
+    for field, column in RANGE_COLUMNS.items():
+        bounds = column_bounds(field, getattr(state, field))
+        predicate = range_predicate(snapshot, column, bounds) if bounds is not None else None
+        if predicate is not None:
+            yield predicate
+    if state.netuids:
+        yield subnet_predicate(snapshot, state.netuids, state.subnet_match)
+
+
+def build_mask(snapshot: Snapshot, state: FilterState) -> np.ndarray:
+    """AND every active predicate into a single boolean mask"""
+    mask = np.ones(len(snapshot.holders), dtype=bool)
+    for predicate in iter_predicates(snapshot, state):
+        mask &= predicate
+    return mask
+
+
+class Selection:
+    """Holders of a snapshot matching a filter state
+
+    The mask and the filtered rows are only computed when first needed, so a
+    rerun whose aggregates are all cached never touches the row data.
+    """
+
+    def __init__(self, snapshot: Snapshot, filters: FilterState):
+        self.snapshot = snapshot
+        self.filters = filters
+
+    @cached_property
+    def mask(self) -> np.ndarray:
+        with phase('filter', rows=len(self.snapshot.holders)):
+            return build_mask(self.snapshot, self.filters)
+
+    @cached_property
+    def positions(self) -> np.ndarray:
+        """Snapshot row position of every selected holder"""
+        if self.filters == FilterState():
+            return np.arange(len(self.snapshot.holders))
+        return np.flatnonzero(self.mask)
+
+    @cached_property
+    def holders(self) -> pd.DataFrame:
+        if self.filters == FilterState():
+            return self.snapshot.holders
+        return self.snapshot.holders[self.mask]
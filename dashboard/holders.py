@@ -0,0 +1,323 @@
+"""Columnar holder and holdings tables built once from alpha_holders_analysis.json"""
+from array import array
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dashboard.rao import to_rao
+
+if TYPE_CHECKING:
+    from dashboard.cube import AggregateCube
+
+# Roles are stored as a bitmask so role filters are a single vectorized AND
+ROLE_BITS = {
+    "Subnet Owner": 1,
+    "Validator": 2,
+    "Miner": 4,
+    "Investor": 8,
+    "Unknown": 16,
+}
+
+# Balance columns (int64 RAO) and the AlphaHolderAnalysis TAO fields they are read from
+RAO_COLUMNS = {
+    'total_alpha_value_rao': 'total_alpha_value_tao',
+    'total_wallet_value_rao': 'total_wallet_value_tao',
+    'total_staked_rao': 'total_staked_tao',
+    'free_rao': 'free_tao',
+}
+
+# Other numeric columns copied out of each AlphaHolderAnalysis record (see src/types/index.ts)
+HOLDER_COLUMNS = {
+    'unique_alpha_tokens': np.int32,
+    'number_tx': np.int32,
+    'tx_time': np.int32,
+    'alpha_percentage': np.float64,
+    'has_staking_proxy': np.bool_,
+}
+
+# array.array typecodes of the column buffers (booleans are kept as one byte)
+_TYPECODES = {np.float64: 'd', np.int32: 'i', np.bool_: 'B'}
+
+
+def encode_roles(roles: List[str]) -> int:
+    """Convert a list of role names into a role bitmask"""
+    mask = 0
+    for role in roles:
+        mask |= ROLE_BITS.get(role, ROLE_BITS["Unknown"])
+    return mask
+
+
+def decode_roles(mask: int) -> List[str]:
+    """Convert a role bitmask back into role names"""
+    return [role for role, bit in ROLE_BITS.items() if mask & bit]
+
+
+@dataclass(frozen=True)
+class KeyTable:
+    """Coldkeys interned into an int32 id space: id i is the holder in row i
+
+    The keys are one fixed-width bytes array (numpy 'S' dtype, memory-mappable)
+    instead of a Python string per holder, and order lists the ids by ascending
+    key, so exact and prefix lookups are binary searches over it.
+    """
+    keys: np.ndarray
+    order: np.ndarray
+
+    @classmethod
+    def from_keys(cls, keys: np.ndarray) -> 'KeyTable':
+        return cls(keys, np.argsort(keys, kind='stable').astype(np.int32))
+
+    @classmethod
+    def from_strings(cls, coldkeys: Iterable[str]) -> 'KeyTable':
+        return cls.from_keys(np.array([coldkey.encode() for coldkey in coldkeys], dtype=bytes))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def ids(self, keys: np.ndarray) -> np.ndarray:
+        """Id of every key (bytes, any width), -1 for keys that aren't in the table"""
+        if len(self.keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int32)
+        at = np.minimum(np.searchsorted(self.keys, keys, sorter=self.order), len(self.keys) - 1)
+        ids = self.order[at]
+        return np.where(self.keys[ids] == keys, ids, -1).astype(np.int32)
+
+    def find(self, coldkey: str) -> int:
+        """Id of an exact coldkey, -1 if it isn't in the table"""
+        return int(self.ids(np.array([coldkey.encode()]))[0])
+
+    def with_prefix(self, prefix: str, limit: int) -> np.ndarray:
+        """Ids of up to limit coldkeys starting with prefix, in key order"""
+        # Every key with this prefix sorts between the prefix and the prefix followed by 0xff
+        raw = prefix.encode()
+        start, stop = np.searchsorted(self.keys, np.array([raw, raw + b'\xff']), sorter=self.order)
+        return self.order[start:min(stop, start + limit)]
+
+    def decode(self, holder: int) -> str:
+        """Coldkey of one id"""
+        return self.keys[holder].decode()
+
+    def text(self, ids: np.ndarray) -> pa.Array:
+        """Coldkeys of the given ids as an Arrow string array (no Python object per key)"""
+        return pa.array(self.keys[ids]).cast(pa.string())
+
+
+@dataclass
+class Snapshot:
+    """Everything the dashboard needs from one analysis run"""
+    holders: pd.DataFrame
+    holdings: pd.DataFrame
+    subnet_names: pd.Series
+    coldkeys: KeyTable  # Key table of the holders, in holder row order
+    version: str = ''  # Identifies the analysis run, used to key cached aggregates
+    cube: Optional['AggregateCube'] = None  # Precomputed section rollups, written with the binary tables
+    directory: str = ''  # Where the binary tables live, empty for snapshots parsed straight from JSON
+
+    @cached_property
+    def subnet_index(self) -> 'SubnetIndex':
+        """Inverted netuid -> holders index, built on first use and kept with the snapshot"""
+        return SubnetIndex(self.holdings)
+
+    @cached_property
+    def column_index(self) -> 'ColumnIndex':
+        """Bounds and sorted permutations of holder columns, built per column on first use unless mapped with the tables"""
+        return ColumnIndex(self.holders)
+
+
+class SubnetIndex:
+    """Sorted holder positions of every subnet's stakers (CSR layout over the holdings table)
+
+    Holdings are stored in holder order, so a stable sort by netuid leaves each
+    subnet's holder positions sorted and duplicate-free, ready for merging.
+    """
+
+    def __init__(self, holdings: pd.DataFrame):
+        netuid = holdings['netuid'].to_numpy()
+        order = np.argsort(netuid, kind='stable')
+        self.holders = holdings['holder'].to_numpy()[order]
+        self.netuids, starts = np.unique(netuid[order], return_index=True)
+        self._bounds = np.append(starts, len(order))
+
+    def holders_of(self, netuid: int) -> np.ndarray:
+        """Sorted positions of the holders staked in one subnet (empty if unknown)"""
+        i = np.searchsorted(self.netuids, netuid)
+        if i == len(self.netuids) or self.netuids[i] != netuid:
+            return self.holders[:0]
+        return self.holders[self._bounds[i]:self._bounds[i + 1]]
+
+    def any_of(self, netuids: Iterable[int]) -> np.ndarray:
+        """Sorted positions of the holders staked in at least one of the subnets"""
+        arrays = [self.holders_of(netuid) for netuid in netuids]
+        return np.unique(np.concatenate(arrays)) if arrays else self.holders[:0]
+
+    def mask_any(self, netuids: Iterable[int], rows: int) -> np.ndarray:
+        """Boolean mask over rows holders of those staked in at least one of the subnets
+
+        Scatters each subnet's positions straight into the mask, so unlike any_of
+        the union is never concatenated or sorted.
+        """
+        mask = np.zeros(rows, dtype=bool)
+        for netuid in netuids:
+            mask[self.holders_of(netuid)] = True
+        return mask
+
+    def all_of(self, netuids: Iterable[int]) -> np.ndarray:
+        """Sorted positions of the holders staked in every one of the subnets"""
+        # Intersect smallest first so every step works on the shortest possible arrays
+        arrays = sorted((self.holders_of(netuid) for netuid in netuids), key=len)
+        if not arrays:
+            return self.holders[:0]
+        result = arrays[0]
+        for other in arrays[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, other, assume_unique=True)
+        return result
+
+
+class ColumnIndex:
+    """Per-column statistics and sorted permutation indexes over the holder table
+
+    Bounds (min, max) let a range that spans a whole column be skipped, and the
+    permutation sorting a column turns any other range into two binary searches
+    and one contiguous slice of holder positions, instead of a scan of every row.
+    Snapshots converted to binary tables map bounds and permutations written at
+    conversion time; other snapshots build them per column on first use.
+    """
+
+    def __init__(self, holders: pd.DataFrame, bounds: Optional[Dict[str, Tuple]] = None,
+                 orders: Optional[Dict[str, np.ndarray]] = None):
+        self._holders = holders
+        self._bounds: Dict[str, Tuple] = dict(bounds or {})
+        self._orders: Dict[str, np.ndarray] = dict(orders or {})
+
+    def bounds(self, column: str) -> Tuple:
+        """(min, max) of a column as Python numbers, (0, 0) for an empty table"""
+        if column not in self._bounds:
+            values = self._holders[column].to_numpy()
+            self._bounds[column] = (values.min().item(), values.max().item()) if len(values) else (0, 0)
+        return self._bounds[column]
+
+    def sorted_order(self, column: str) -> np.ndarray:
+        """Holder positions (int32) in ascending column order, ties in holder order"""
+        if column not in self._orders:
+            self._orders[column] = np.argsort(self._holders[column].to_numpy(), kind='stable').astype(np.int32)
+        return self._orders[column]
+
+    def span(self, column: str, lo, hi) -> Tuple[int, int]:
+        """Slice of the column's sorted permutation holding the values within [lo, hi]"""
+        start = self._search(column, lo, right=False)
+        stop = self._search(column, hi, right=True)
+        return start, max(start, stop)
+
+    def _search(self, column: str, value, right: bool) -> int:
+        """Like np.searchsorted over the column in sorted order, probing it through the permutation
+
+        Gathering the sorted values would copy the column, and np.searchsorted's
+        sorter argument copies the permutation; this touches log2(rows) values.
+        """
+        values = self._holders[column].to_numpy()
+        order = self.sorted_order(column)
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = values[order[mid]]
+            if probe < value or (right and probe == value):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class SnapshotBuilder:
+    """Appends AlphaHolderAnalysis records one at a time into typed column buffers
+
+    Only the compact columns are kept, so records can be streamed in and
+    discarded without ever materializing the whole parsed JSON.
+    """
+
+    def __init__(self):
+        self._coldkeys = bytearray()  # Every coldkey's bytes back to back, ending at _coldkey_ends
+        self._coldkey_ends = array('q')
+        self._amounts = {name: array('d') for name in RAO_COLUMNS}  # TAO as parsed, rounded to RAO in build()
+        self._columns = {name: array(_TYPECODES[dtype]) for name, dtype in HOLDER_COLUMNS.items()}
+        self._roles = array('B')
+        self._holding_holder = array('i')
+        self._holding_netuid = array('i')
+        self._holding_balance = array('d')
+        self._holding_value = array('d')
+        self._subnet_names: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._coldkey_ends)
+
+    def add(self, record: Dict):
+        """Append one holder record and its nested alpha_holdings"""
+        row = len(self._coldkey_ends)
+        self._coldkeys += record['coldkey'].encode()
+        self._coldkey_ends.append(len(self._coldkeys))
+        for name, field in RAO_COLUMNS.items():
+            self._amounts[name].append(record.get(field) or 0)
+        for name, column in self._columns.items():
+            column.append(record.get(name) or 0)
+        # Holders without a 'roles' key are counted as Unknown, as before
+        self._roles.append(encode_roles(record.get('roles', ['Unknown'])))
+
+        for holding in record.get('alpha_holdings', []):
+            netuid = holding['netuid']
+            self._holding_holder.append(row)
+            self._holding_netuid.append(netuid)
+            self._holding_balance.append(holding['balance_alpha'])
+            self._holding_value.append(holding['value_tao'])
+            if netuid not in self._subnet_names:
+                self._subnet_names[netuid] = holding['subnet_name']
+
+    def build(self, version: str = '') -> Snapshot:
+        """Wrap the buffers into the holder and holdings tables, balances converted to RAO in one pass"""
+        holders = {name: to_rao(np.frombuffer(amounts, dtype=np.float64)) for name, amounts in self._amounts.items()}
+        for name, dtype in HOLDER_COLUMNS.items():
+            values = np.frombuffer(self._columns[name], dtype=np.uint8 if dtype is np.bool_ else dtype)
+            holders[name] = values.view(np.bool_) if dtype is np.bool_ else values
+        holders['roles'] = np.frombuffer(self._roles, dtype=np.uint8)
+
+        holdings = {
+            'holder': np.frombuffer(self._holding_holder, dtype=np.int32),
+            'netuid': np.frombuffer(self._holding_netuid, dtype=np.int32),
+            'balance_alpha_rao': to_rao(np.frombuffer(self._holding_balance, dtype=np.float64)),
+            'value_rao': to_rao(np.frombuffer(self._holding_value, dtype=np.float64)),
+        }
+
+        return Snapshot(
+            holders=pd.DataFrame(holders, copy=False),
+            holdings=pd.DataFrame(holdings, copy=False),
+            subnet_names=pd.Series(self._subnet_names, dtype=object).sort_index(),
+            coldkeys=KeyTable.from_keys(self._key_array()),
+            version=version,
+        )
+
+    def _key_array(self) -> np.ndarray:
+        """Coldkeys as one fixed-width bytes array"""
+        ends = np.frombuffer(self._coldkey_ends, dtype=np.int64)
+        lengths = np.diff(ends, prepend=0)
+        if len(ends) and (lengths == lengths[0]).all() and lengths[0] > 0:
+            # SS58 addresses all have the same length: the buffer already is the array
+            return np.frombuffer(bytes(self._coldkeys), dtype=f'S{lengths[0]}')
+        data = bytes(self._coldkeys)
+        return np.array([data[end - length:end] for end, length in zip(ends, lengths)], dtype=bytes)
+
+
+def build_snapshot(records: Iterable[Dict], version: str = '') -> Snapshot:
+    """Build the holder table, the exploded holdings table and the subnet names from records streamed one at a time"""
+    builder = SnapshotBuilder()
+    for record in records:
+        builder.add(record)
+    return builder.build(version)
+
+
+def role_mask(holders: pd.DataFrame, role: str) -> np.ndarray:
+    """Boolean mask of holders carrying the given role"""
+    return (holders['roles'].to_numpy() & ROLE_BITS[role]) != 0
@@ -0,0 +1,62 @@
+"""Coldkey lookup and per-holder drill-down"""
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from dashboard.holders import Snapshot, decode_roles
+from dashboard.rao import to_tao
+
+# Largest number of prefix matches returned by one search
+MAX_MATCHES = 50
+
+
+def search_coldkeys(snapshot: Snapshot, query: str, limit: int = MAX_MATCHES) -> np.ndarray:
+    """Row positions of the coldkey equal to query, or else of up to limit coldkeys starting with it
+
+    Both are binary searches over the snapshot's key table, which is sorted
+    once when the snapshot is written: every key starting with a prefix lies
+    in one contiguous run of the sorted order.
+    """
+    query = query.strip()
+    if not query:
+        return np.empty(0, dtype=np.int32)
+    exact = snapshot.coldkeys.find(query)
+    if exact >= 0:
+        return np.array([exact])
+    return snapshot.coldkeys.with_prefix(query, limit)
+
+
+def holder_holdings(snapshot: Snapshot, position: int) -> pd.DataFrame:
+    """alpha_holdings of one holder, largest value first, with their share of the wallet
+
+    Holdings are stored grouped by holder in row order, so a holder's rows are
+    one slice located by binary search.
+    """
+    holdings = snapshot.holdings
+    holder = holdings['holder'].to_numpy()
+    start, stop = np.searchsorted(holder, [position, position + 1])
+    rows = holdings.iloc[start:stop]
+
+    wallet = snapshot.holders['total_wallet_value_rao'].iat[position]
+    value = rows['value_rao'].to_numpy()
+    netuid = rows['netuid'].to_numpy()
+    df = pd.DataFrame({
+        'Netuid': netuid,
+        'Subnet Name': snapshot.subnet_names.reindex(netuid).fillna('').to_numpy(),
+        'Balance (Alpha)': to_tao(rows['balance_alpha_rao'].to_numpy()),
+        'Value (TAO)': to_tao(value),
+        # Same definition as percentage_of_portfolio in src/analysis/alphaHolders.ts
+        '% of Portfolio': value / wallet * 100 if wallet > 0 else np.zeros(len(rows)),
+    })
+    return df.sort_values('Value (TAO)', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def holder_detail(snapshot: Snapshot, position: int) -> Dict:
+    """Every holder-level field of one coldkey, roles decoded (balances stay in RAO)"""
+    holders = snapshot.holders
+    # Column by column: a row Series of mixed dtypes would turn the int64 balances into floats
+    detail = {'coldkey': snapshot.coldkeys.decode(position)}
+    detail.update({name: holders[name].iat[position] for name in holders.columns if name != 'roles'})
+    detail['roles'] = decode_roles(int(holders['roles'].iat[position]))
+    return detail
@@ -0,0 +1,36 @@
+"""Exact balances: every amount is stored and summed as int64 RAO, turned into TAO only for display
+
+The analysis JSON carries TAO floats (RAO / 1e9, see src/analysis/alphaHolders.ts).
+They are rounded back to whole RAO once, when the snapshot is built; from then
+on sums are integer reductions, so totals are exact and identical whatever the
+order rows are added in. int64 RAO holds up to ~9.2 billion TAO, far above
+the 21 million supply.
+"""
+import numpy as np
+
+RAO_PER_TAO = 10 ** 9
+
+# Largest whole TAO amount int64 RAO can hold
+MAX_TAO = np.iinfo(np.int64).max // RAO_PER_TAO
+
+
+def to_rao(tao) -> np.ndarray:
+    """TAO amounts (floats) rounded to the nearest whole RAO
+
+    Amounts beyond +/-MAX_TAO, such as an open-ended filter bound, are clamped
+    to it rather than wrapping around.
+    """
+    tao = np.clip(np.asarray(tao, dtype=np.float64), -MAX_TAO, MAX_TAO)
+    return np.rint(tao * RAO_PER_TAO).astype(np.int64)
+
+
+def to_tao(rao) -> np.ndarray:
+    """RAO amounts as TAO floats, for display"""
+    return np.asarray(rao) / RAO_PER_TAO
+
+
+def group_sums(groups: np.ndarray, rao: np.ndarray, minlength: int = 0) -> np.ndarray:
+    """Exact int64 sum of the amounts in every group (np.bincount would sum them as floats)"""
+    sums = np.zeros(max(minlength, int(groups.max()) + 1 if len(groups) else 0), dtype=np.int64)
+    np.add.at(sums, groups, rao)
+    return sums
@@ -0,0 +1,151 @@
+"""Registry of past analysis runs, each kept as an immutable set of binary tables
+
+run_analysis.sh overwrites alpha_holders_analysis.json on every run. Registering
+a run copies its tables into output/snapshots/<run_id>/ next to a small
+meta.json, so older runs stay available to the dashboard (memory-mapped, like
+the latest one) and can be compared coldkey by coldkey.
+
+Usage:
+    python -m dashboard.registry register [path/to/alpha_holders_analysis.json] [path/to/ANALYSIS_RECAP.txt]
+    python -m dashboard.registry list
+"""
+import json
+import os
+import re
+import shutil
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from dashboard.holders import Snapshot
+from dashboard.snapshot import SNAPSHOT_JSON, conversion_lock, load_snapshot, read_tables, write_tables
+
+REGISTRY_DIR = 'output/snapshots'
+RECAP_FILE = 'output/ANALYSIS_RECAP.txt'
+META_FILE = 'meta.json'
+
+# Timestamp format of the recap's Started/Finished lines (see run_analysis.sh)
+RECAP_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+@dataclass(frozen=True)
+class RunInfo:
+    """Metadata of one registered analysis run"""
+    run_id: str
+    version: str  # Snapshot.version of the run, so cached aggregates never mix runs
+    started: str
+    finished: str
+    coldkeys: int
+    holdings: int
+    source: str
+
+    @property
+    def label(self) -> str:
+        """Short description for the snapshot pickers"""
+        return f"{self.started or self.run_id} ({self.coldkeys:,} coldkeys)"
+
+
+def parse_recap(recap_path: str) -> Tuple[str, str]:
+    """Run start and end times recorded in ANALYSIS_RECAP.txt, empty when unavailable"""
+    try:
+        with open(recap_path, 'r') as f:
+            text = f.read()
+    except OSError:
+        return '', ''
+    started = re.search(r'Started:\s*(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', text)
+    finished = re.search(r'Finished:\s*(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', text)
+    return (started.group(1) if started else '', finished.group(1) if finished else '')
+
+
+def run_id_for(started: str, json_path: str) -> str:
+    """Sortable run identifier: the recap start time, or the JSON's modification time"""
+    if started:
+        moment = datetime.strptime(started, RECAP_TIME_FORMAT)
+    else:
+        moment = datetime.fromtimestamp(os.path.getmtime(json_path))
+    return moment.strftime('%Y%m%d_%H%M%S')
+
+
+def list_runs(registry_dir: str = REGISTRY_DIR) -> List[RunInfo]:
+    """Every registered run, newest first"""
+    runs = []
+    if not os.path.isdir(registry_dir):
+        return runs
+    for name in os.listdir(registry_dir):
+        meta_path = os.path.join(registry_dir, name, META_FILE)
+        if not os.path.exists(meta_path):
+            continue  # Partially written or foreign directory
+        with open(meta_path, 'r') as f:
+            runs.append(RunInfo(**json.load(f)))
+    return sorted(runs, key=lambda run: run.run_id, reverse=True)
+
+
+def find_run(run_id: str, registry_dir: str = REGISTRY_DIR) -> Optional[RunInfo]:
+    """Registered run with the given id, None if there is none"""
+    return next((run for run in list_runs(registry_dir) if run.run_id == run_id), None)
+
+
+def open_run(run_id: str, registry_dir: str = REGISTRY_DIR) -> Snapshot:
+    """Map the tables of a registered run"""
+    return read_tables(os.path.join(registry_dir, run_id))
+
+
+def register_run(json_path: str = SNAPSHOT_JSON, recap_path: str = RECAP_FILE,
+                 registry_dir: str = REGISTRY_DIR) -> RunInfo:
+    """Add the run that produced json_path to the registry (a no-op if it is already there)
+
+    Runs are never modified once registered: the tables are written to a
+    temporary directory that is renamed into place in one step.
+    """
+    started, finished = parse_recap(recap_path)
+    # Same lock as the dashboard, so a worker converting this JSON never interleaves its tables with ours
+    with conversion_lock(json_path):
+        snapshot = load_snapshot(json_path)
+    run_id = run_id_for(started, json_path)
+
+    existing = find_run(run_id, registry_dir)
+    if existing is not None and existing.version == snapshot.version:
+        return existing
+    if existing is not None:
+        # The recap belongs to an earlier run than the JSON, so it can't date this one
+        started, finished = '', ''
+        run_id = run_id_for('', json_path)
+        existing = find_run(run_id, registry_dir)
+        if existing is not None:
+            return existing
+
+    info = RunInfo(
+        run_id=run_id,
+        version=snapshot.version,
+        started=started,
+        finished=finished,
+        coldkeys=len(snapshot.holders),
+        holdings=len(snapshot.holdings),
+        source=json_path,
+    )
+
+    final_dir = os.path.join(registry_dir, run_id)
+    tmp_dir = f"{final_dir}.{os.getpid()}.tmp"
+    try:
+        write_tables(snapshot, tmp_dir)
+        with open(os.path.join(tmp_dir, META_FILE), 'w') as f:
+            json.dump(asdict(info), f, indent=2)
+        os.rename(tmp_dir, final_dir)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return info
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'list'
+    if command == 'register':
+        path = sys.argv[2] if len(sys.argv) > 2 else SNAPSHOT_JSON
+        recap = sys.argv[3] if len(sys.argv) > 3 else RECAP_FILE
+        run = register_run(path, recap)
+        print(f"✓ Registered run {run.run_id}: {run.coldkeys:,} coldkeys in {os.path.join(REGISTRY_DIR, run.run_id)}")
+    elif command == 'list':
+        for run in list_runs():
+            print(f"{run.run_id}  {run.started or '-':<19}  {run.finished or '-':<19}  {run.coldkeys:>10,} coldkeys")
+    else:
+        sys.exit(__doc__)
@@ -0,0 +1,44 @@
+"""Which inputs every dashboard section reads, so an interaction only reruns what it affects
+
+Sections declare three kinds of inputs:
+
+- ``snapshot``: the analysis run on display. Switching runs (or a new run
+  being swapped in) reruns the whole page.
+- ``filters``: the sidebar filters, resolved into one filter mask shared by
+  every filtered section. A filter change reruns only the sections reading
+  them: they are fragments keyed by their section name, rerun together from
+  the filter widgets' callback.
+- ``local``: the section's own widgets (ranking, sorting, paging, toggles).
+  Such sections are fragments, so their widgets rerun them alone.
+
+Sections that don't read the filters (the unfiltered role analysis, the coldkey
+lookup, the run comparison) are neither recomputed nor re-sent on a filter change.
+"""
+from typing import Dict, List, Tuple
+
+SNAPSHOT = 'snapshot'
+FILTERS = 'filters'
+LOCAL = 'local'
+
+# Top-level sections in page order with their inputs; names are the fragment keys and trace section names
+SECTIONS: Dict[str, Tuple[str, ...]] = {
+    'filters': (SNAPSHOT, FILTERS),  # The sidebar itself: its ranges and enabled states follow the filters
+    'global_role_analysis': (SNAPSHOT,),
+    'filter_summary': (SNAPSHOT, FILTERS),
+    'breakdown_by_tx': (SNAPSHOT, FILTERS),
+    'breakdown_by_tx_time': (SNAPSHOT, FILTERS),
+    'breakdown_by_tokens': (SNAPSHOT, FILTERS),
+    'breakdown_by_alpha_percentage': (SNAPSHOT, FILTERS),
+    'top_holders_table': (SNAPSHOT, FILTERS, LOCAL),
+    'coldkey_lookup': (SNAPSHOT, LOCAL),
+    'subnet_breakdown': (SNAPSHOT, FILTERS),  # Its table is a nested fragment with local sort/page widgets
+    'concentration_analysis': (SNAPSHOT, FILTERS),  # Likewise its per-subnet table
+    'run_comparison': (SNAPSHOT, LOCAL),
+    'annexe': (SNAPSHOT, FILTERS, LOCAL),
+    'performance_panel': (SNAPSHOT, FILTERS, LOCAL),  # Sidebar, rendered last: lists the sections' latest timings
+}
+
+
+def downstream(changed: str) -> List[str]:
+    """Sections reading the changed input, in page order"""
+    return [name for name, inputs in SECTIONS.items() if changed in inputs]
@@ -0,0 +1,444 @@
+"""Binary (Arrow IPC) copy of alpha_holders_analysis.json for fast dashboard cold starts
+
+Usage:
+    python -m dashboard.snapshot [path/to/alpha_holders_analysis.json]
+"""
+import codecs
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+try:
+    import fcntl  # Cross-process conversion lock, POSIX only
+except ImportError:
+    fcntl = None
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dashboard.cube import AggregateCube, build_cube
+from dashboard.filters import RANGE_COLUMNS
+from dashboard.holders import RAO_COLUMNS, ColumnIndex, KeyTable, Snapshot, build_snapshot
+from dashboard.rao import to_rao
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_JSON = 'output/alpha_holders_analysis.json'
+
+# Streaming parser settings: read size, and how much text one record may span before it is
+# reported as malformed instead of being buffered further (a holder record is a few KB)
+CHUNK_SIZE = 1 << 20
+MAX_RECORD_SIZE = 64 << 20
+
+# Insignificant whitespace, as json itself defines it
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Called with (bytes_read, total_bytes) while a JSON snapshot is parsed
+Progress = Callable[[int, int], None]
+
+# Bumped whenever the table layout changes, so older files get regenerated
+FORMAT_VERSION = b'7'
+FORMAT_VERSION_KEY = b'format_version'
+
+# Schema metadata carrying Snapshot.version on the holders table
+VERSION_KEY = b'snapshot_version'
+
+# Schema metadata of the cube table holding AggregateCube.extents as JSON
+CUBE_EXTENTS_KEY = b'cube_extents'
+
+# Schema metadata of the column index table holding the (min, max) of every range filter column as JSON
+COLUMN_BOUNDS_KEY = b'column_bounds'
+
+# Schema metadata listing the columns stored as uint8 but exposed as bool
+BOOL_COLUMNS_KEY = b'bool_columns'
+
+# One Arrow file per table, written next to the JSON they were converted from
+TABLE_FILES = {
+    'holders': 'holders.arrow',
+    'holdings': 'holdings.arrow',
+    'subnets': 'subnets.arrow',
+    'cube': 'cube.arrow',
+    'coldkeys': 'coldkeys.arrow',
+    'column_index': 'column_index.arrow',
+}
+
+# Balance columns of runs registered while amounts were stored as TAO floats, and their RAO columns
+LEGACY_TAO_COLUMNS = {
+    **{field: name for name, field in RAO_COLUMNS.items()},
+    'balance_alpha': 'balance_alpha_rao',
+    'value_tao': 'value_rao',
+}
+
+
+def snapshot_dir(json_path: str) -> str:
+    """Directory holding the binary tables converted from json_path"""
+    base, _ = os.path.splitext(json_path)
+    return base + '.arrow'
+
+
+def is_fresh(json_path: str) -> bool:
+    """True when every binary table exists and was converted from the JSON as it is now
+
+    The holders table records the source_version it was converted from. Comparing
+    that rather than modification times also catches a new JSON carrying an older
+    mtime (copied with cp -p or rsync -t, or moved in from elsewhere).
+    """
+    directory = snapshot_dir(json_path)
+    paths = [os.path.join(directory, name) for name in TABLE_FILES.values()]
+    if not all(os.path.exists(path) and _format_version(path) == FORMAT_VERSION for path in paths):
+        return False
+    if not os.path.exists(json_path):
+        return True
+    holders_path = os.path.join(directory, TABLE_FILES['holders'])
+    return _schema_metadata(holders_path).get(VERSION_KEY, b'').decode() == source_version(json_path)
+
+
+_conversion_threads = threading.Lock()
+
+
+@contextmanager
+def conversion_lock(json_path: str) -> Iterator[None]:
+    """Held while json_path is converted, by one thread of one process at a time
+
+    Every worker and replica sharing the output directory waits here instead of
+    parsing the same JSON concurrently; whoever comes second finds the tables
+    fresh and only maps them. Without flock (or a writable directory) the lock
+    only covers this process.
+    """
+    with _conversion_threads:
+        try:
+            lock_file = open(snapshot_dir(json_path) + '.lock', 'a') if fcntl else None
+        except OSError:
+            lock_file = None
+        if lock_file is None:
+            yield
+            return
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def source_version(json_path: str) -> str:
+    """Short identifier of an analysis JSON derived from its size and modification time"""
+    stat = os.stat(json_path)
+    return hashlib.sha1(f"{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:12]
+
+
+def _schema_metadata(path: str) -> dict:
+    """Schema metadata of a table file, empty if the file is unreadable"""
+    try:
+        with pa.memory_map(path, 'r') as source:
+            return pa.ipc.open_file(source).schema.metadata or {}
+    except pa.ArrowInvalid:
+        return {}
+
+
+def _format_version(path: str) -> bytes:
+    """Format version recorded in a table file's schema metadata"""
+    return _schema_metadata(path).get(FORMAT_VERSION_KEY, b'')
+
+
+def _to_arrow(df: pd.DataFrame, metadata: Optional[dict] = None) -> pa.Table:
+    """Convert a table to a single-chunk Arrow table that can be mapped back zero-copy"""
+    # Arrow packs booleans into bits, so store them as one byte each and remember which they were
+    bool_columns = [name for name in df.columns if df[name].dtype == bool]
+    df = df.assign(**{name: df[name].to_numpy().view(np.uint8) for name in bool_columns})
+    table = pa.Table.from_pandas(df, preserve_index=False).combine_chunks()
+    return table.replace_schema_metadata({
+        **(metadata or {}),
+        FORMAT_VERSION_KEY: FORMAT_VERSION,
+        BOOL_COLUMNS_KEY: ','.join(bool_columns).encode(),
+    })
+
+
+def _write_table(df: pd.DataFrame, path: str, metadata: Optional[dict] = None):
+    """Write one table atomically so concurrent readers never see a partial file"""
+    _write_arrow(_to_arrow(df, metadata), path)
+
+
+def _write_arrow(table: pa.Table, path: str):
+    """Write one Arrow table atomically"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def open_table(path: str) -> pa.Table:
+    """Arrow table whose buffers point straight into a memory map of the file"""
+    return pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+
+
+def _key_table_arrow(coldkeys: KeyTable) -> pa.Table:
+    """Key table as fixed-size binary keys (sharing the numpy buffer) plus the sorted ids"""
+    keys = np.ascontiguousarray(coldkeys.keys)
+    key_array = pa.FixedSizeBinaryArray.from_buffers(
+        pa.binary(keys.dtype.itemsize), len(keys), [None, pa.py_buffer(keys)]
+    )
+    table = pa.table({'coldkey': key_array, 'order': pa.array(coldkeys.order, type=pa.int32())})
+    return table.replace_schema_metadata({FORMAT_VERSION_KEY: FORMAT_VERSION})
+
+
+def _map_key_table(path: str) -> KeyTable:
+    """Key table as numpy views over a memory map of the file"""
+    table = open_table(path).combine_chunks()
+    keys = table.column('coldkey').chunk(0) if table.num_rows else None
+    order = table.column('order').to_numpy()
+    if keys is None:
+        return KeyTable(np.empty(0, dtype='S1'), order.astype(np.int32))
+    width = keys.type.byte_width
+    data = np.frombuffer(keys.buffers()[1], dtype=f'S{width}', count=keys.offset + len(keys))
+    return KeyTable(data[keys.offset:], order)
+
+
+def _map_table(path: str) -> pd.DataFrame:
+    """Expose one table as read-only column views over a memory map
+
+    Nothing is copied onto the heap: every process mapping the same file shares
+    the OS page cache, and the map stays open as long as the columns are alive.
+    """
+    table = open_table(path)
+    metadata = table.schema.metadata or {}
+    bool_columns = set(metadata.get(BOOL_COLUMNS_KEY, b'').decode().split(','))
+
+    columns = {}
+    for name, column in zip(table.column_names, table.columns):
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            columns[name] = pd.arrays.ArrowStringArray(column)
+            continue
+        values = column.combine_chunks().to_numpy(zero_copy_only=True)
+        columns[name] = values.view(np.bool_) if name in bool_columns else values
+    return pd.DataFrame(columns, copy=False)
+
+
+def _write_column_index(snapshot: Snapshot, path: str):
+    """Write the bounds and sorted permutation of every range filter column, one int32 column per permutation"""
+    index = snapshot.column_index
+    columns = list(RANGE_COLUMNS.values())
+    _write_table(
+        pd.DataFrame({column: index.sorted_order(column) for column in columns}),
+        path,
+        {COLUMN_BOUNDS_KEY: json.dumps({column: index.bounds(column) for column in columns}).encode()},
+    )
+
+
+def _map_column_index(path: str, holders: pd.DataFrame) -> ColumnIndex:
+    """Column index over holders with its bounds and permutations read from the mapped table"""
+    bounds = json.loads(_schema_metadata(path).get(COLUMN_BOUNDS_KEY, b'{}'))
+    orders = _map_table(path)
+    return ColumnIndex(
+        holders,
+        bounds={column: tuple(values) for column, values in bounds.items()},
+        orders={column: orders[column].to_numpy() for column in orders.columns},
+    )
+
+
+def _legacy_amounts(df: pd.DataFrame) -> pd.DataFrame:
+    """Table of a run written with TAO float balances, its balances rounded to RAO columns"""
+    legacy = [name for name in df.columns if name in LEGACY_TAO_COLUMNS]
+    if not legacy:
+        return df
+    rao = {LEGACY_TAO_COLUMNS[name]: to_rao(df[name].to_numpy()) for name in legacy}
+    return df.drop(columns=legacy).assign(**rao)
+
+
+def write_snapshot(snapshot: Snapshot, json_path: str):
+    """Write the holder, holdings and subnet tables, and the aggregate cube, for json_path"""
+    write_tables(snapshot, snapshot_dir(json_path))
+
+
+def write_tables(snapshot: Snapshot, directory: str):
+    """Write every table of a snapshot into directory"""
+    os.makedirs(directory, exist_ok=True)
+    subnets = pd.DataFrame({
+        'netuid': snapshot.subnet_names.index.to_numpy(dtype='int32'),
+        'subnet_name': snapshot.subnet_names.to_numpy(),
+    })
+    _write_table(snapshot.holdings, os.path.join(directory, TABLE_FILES['holdings']))
+    _write_table(subnets, os.path.join(directory, TABLE_FILES['subnets']))
+    cube = snapshot.cube or build_cube(snapshot)
+    _write_table(
+        cube.cells,
+        os.path.join(directory, TABLE_FILES['cube']),
+        {CUBE_EXTENTS_KEY: json.dumps(cube.extents).encode()},
+    )
+    _write_arrow(_key_table_arrow(snapshot.coldkeys), os.path.join(directory, TABLE_FILES['coldkeys']))
+    _write_column_index(snapshot, os.path.join(directory, TABLE_FILES['column_index']))
+    _write_table(
+        snapshot.holders,
+        os.path.join(directory, TABLE_FILES['holders']),
+        {VERSION_KEY: snapshot.version.encode()},
+    )
+
+
+def read_snapshot(json_path: str) -> Snapshot:
+    """Map the binary tables converted from json_path"""
+    return read_tables(snapshot_dir(json_path))
+
+
+def read_tables(directory: str) -> Snapshot:
+    """Map every table of a snapshot written to directory"""
+    subnets = _map_table(os.path.join(directory, TABLE_FILES['subnets']))
+    holders_path = os.path.join(directory, TABLE_FILES['holders'])
+    cube_path = os.path.join(directory, TABLE_FILES['cube'])
+    extents = json.loads(_schema_metadata(cube_path).get(CUBE_EXTENTS_KEY, b'{}'))
+    holders = _map_table(holders_path)
+    coldkeys_path = os.path.join(directory, TABLE_FILES['coldkeys'])
+    if os.path.exists(coldkeys_path):
+        coldkeys = _map_key_table(coldkeys_path)
+    else:
+        # Registered runs written before the key table kept the coldkeys in the holders table
+        coldkeys = KeyTable.from_strings(holders.pop('coldkey'))
+    cube = AggregateCube(
+        cells=_map_table(cube_path),
+        extents={field: tuple(bounds) for field, bounds in extents.items()},
+    )
+    # Runs registered before the column index was written build it on first use instead
+    column_index_path = os.path.join(directory, TABLE_FILES['column_index'])
+    column_index = _map_column_index(column_index_path, holders) if os.path.exists(column_index_path) else None
+    if 'total_wallet_value_rao' not in holders:
+        # Registered before balances were kept in RAO: its cube sums TAO floats, so filter the rows instead
+        holders, cube, column_index = _legacy_amounts(holders), None, None
+    snapshot = Snapshot(
+        holders=holders,
+        holdings=_legacy_amounts(_map_table(os.path.join(directory, TABLE_FILES['holdings']))),
+        subnet_names=pd.Series(subnets['subnet_name'].to_numpy(), index=subnets['netuid'].to_numpy(), dtype=object),
+        coldkeys=coldkeys,
+        version=_schema_metadata(holders_path).get(VERSION_KEY, b'').decode(),
+        directory=directory,
+        cube=cube,
+    )
+    if column_index is not None:
+        snapshot.column_index = column_index
+    return snapshot
+
+
+def iter_json_records(json_path: str, progress: Optional[Progress] = None,
+                      chunk_size: int = CHUNK_SIZE, max_record_size: int = MAX_RECORD_SIZE) -> Iterator[dict]:
+    """Yield the records of a top-level JSON array of objects one at a time
+
+    Only one chunk of text plus the record being decoded is held in memory,
+    however large the file is. The array must be well-formed, exactly as for
+    json.load: one comma between records, nothing but whitespace after the
+    closing bracket. A record still failing to decode once it spans
+    max_record_size characters is malformed, not truncated, and raises.
+    progress(bytes_read, total_bytes) is called after every chunk.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    total = os.path.getsize(json_path)
+    bytes_read = 0
+    buffer = ''
+    pos = 0
+    more = True
+
+    with open(json_path, 'rb') as f:
+        def fill():
+            """Append the next chunk to the unconsumed text"""
+            nonlocal buffer, pos, bytes_read, more
+            chunk = f.read(chunk_size)
+            bytes_read += len(chunk)
+            buffer = buffer[pos:] + utf8.decode(chunk, final=not chunk)
+            pos = 0
+            more = bool(chunk)
+            if progress:
+                progress(bytes_read, total)
+
+        def next_char() -> str:
+            """First character after any whitespace (reading on as needed), '' at end of file"""
+            nonlocal pos
+            while True:
+                pos = JSON_WHITESPACE.match(buffer, pos).end()
+                if pos < len(buffer):
+                    return buffer[pos]
+                if not more:
+                    return ''
+                fill()
+
+        def expect(allowed: str) -> str:
+            """Consume the next character, which must be one of allowed"""
+            nonlocal pos
+            char = next_char()
+            if not char:
+                raise ValueError(f"{json_path}: unexpected end of file")
+            if char not in allowed:
+                raise ValueError(f"{json_path}: expected {' or '.join(repr(c) for c in allowed)}, found {char!r}")
+            pos += 1
+            return char
+
+        fill()
+        if next_char() != '[':
+            raise ValueError(f"{json_path}: expected a top-level JSON array")
+        pos += 1
+        if next_char() == ']':
+            pos += 1
+        else:
+            while True:
+                expect('{')
+                pos -= 1  # raw_decode starts at the opening brace
+                # A record cut off at the end of the buffer fails to decode until the rest is read
+                while True:
+                    try:
+                        record, pos = decoder.raw_decode(buffer, pos)
+                        break
+                    except json.JSONDecodeError:
+                        if not more or len(buffer) - pos > max_record_size:
+                            raise
+                        fill()
+                yield record
+                if expect(',]') == ']':
+                    break
+        if next_char():
+            raise ValueError(f"{json_path}: unexpected data after the top-level array")
+
+
+def parse_json(json_path: str, progress: Optional[Progress] = None) -> Snapshot:
+    """Stream the analysis JSON straight into the columnar tables"""
+    version = source_version(json_path)  # Taken first, so a JSON replaced mid-parse is never labelled as the new one
+    return build_snapshot(iter_json_records(json_path, progress), version=version)
+
+
+def convert_snapshot(json_path: str = SNAPSHOT_JSON, progress: Optional[Progress] = None) -> Snapshot:
+    """Parse the analysis JSON and write its binary tables"""
+    snapshot = parse_json(json_path, progress)
+    write_snapshot(snapshot, json_path)
+    return snapshot
+
+
+def load_snapshot(json_path: str = SNAPSHOT_JSON, progress: Optional[Progress] = None) -> Snapshot:
+    """Load from the binary tables, (re)converting from JSON when they are missing or stale"""
+    if is_fresh(json_path):
+        return read_snapshot(json_path)
+
+    snapshot = parse_json(json_path, progress)
+    try:
+        write_snapshot(snapshot, json_path)
+    except OSError as e:
+        # A read-only output directory: serve the parsed tables, every later load parses the JSON again
+        logger.warning("Could not write the binary snapshot to %s, the JSON will be parsed on every load: %s",
+                       snapshot_dir(json_path), e)
+        return snapshot
+
+    # Serve the mapped copy so this process shares pages with every other worker
+    return read_snapshot(json_path)
+
+
+if __name__ == "__main__":
+    def print_progress(bytes_read: int, total: int):
+        print(f"\r  {bytes_read / max(total, 1):.0%} of {total / 1024 / 1024:,.0f} MB", end='', file=sys.stderr)
+
+    path = sys.argv[1] if len(sys.argv) > 1 else SNAPSHOT_JSON
+    converted = convert_snapshot(path, print_progress)
+    print(file=sys.stderr)
+    print(f"✓ Converted {len(converted.holders):,} holders / {len(converted.holdings):,} holdings to {snapshot_dir(path)}")
@@ -0,0 +1,27 @@
+"""Per-subnet aggregates over the exploded holdings table"""
+import numpy as np
+import pandas as pd
+
+from dashboard.holders import Snapshot
+from dashboard.rao import group_sums, to_tao
+
+
+def subnet_totals(snapshot: Snapshot, mask: np.ndarray) -> pd.DataFrame:
+    """Alpha staked, TAO value and staker count per subnet for the selected holders"""
+    holdings = snapshot.holdings
+    keep = mask[holdings['holder'].to_numpy()]
+    netuid = holdings['netuid'].to_numpy()[keep]
+
+    # Each holder has at most one holding per netuid, so row counts are staker counts
+    stakers = np.bincount(netuid)
+    present = np.flatnonzero(stakers)
+    alpha = group_sums(netuid, holdings['balance_alpha_rao'].to_numpy()[keep])
+    value = group_sums(netuid, holdings['value_rao'].to_numpy()[keep])
+
+    return pd.DataFrame({
+        'Netuid': present,
+        'Subnet Name': snapshot.subnet_names.reindex(present).fillna('').to_numpy(),
+        'Total Alpha Staked': to_tao(alpha[present]),
+        'Total Value (TAO)': to_tao(value[present]),
+        'Number of Stakers': stakers[present]
+    })
@@ -0,0 +1,34 @@
+"""Server-side sorting and paging of numeric tables
+
+Tables are shipped to the browser one page at a time and keep their numeric
+dtypes; number formatting is left to the client (st.column_config), so no
+value is ever turned into a Python string.
+"""
+import numpy as np
+import pandas as pd
+
+# Rows sent to the browser per page of a paged table
+PAGE_SIZE = 50
+
+
+def page_count(rows: int, page_size: int = PAGE_SIZE) -> int:
+    """Number of pages needed for rows, at least one so an empty table still has a page"""
+    return max(1, -(-rows // page_size))
+
+
+def sort_order(values: np.ndarray, ascending: bool = True) -> np.ndarray:
+    """Row positions that sort values, ties kept in row order in both directions"""
+    if values.dtype.kind in 'iu' and not ascending:
+        # Bitwise not reverses integer order exactly and never overflows, unlike negation or a float cast
+        # (int64 RAO above 2**53 would collapse into ties); a reversed ascending sort would flip ties
+        return np.argsort(~values, kind='stable')
+    if values.dtype.kind == 'f' and not ascending:
+        return np.argsort(-values, kind='stable')
+    order = pd.Series(values).sort_values(ascending=ascending, kind='stable').index
+    return order.to_numpy()
+
+
+def table_page(df: pd.DataFrame, order: np.ndarray, page: int, page_size: int = PAGE_SIZE) -> pd.DataFrame:
+    """Rows of one 1-based page of df in the given order"""
+    start = (page - 1) * page_size
+    return df.take(order[start:start + page_size]).reset_index(drop=True)
@@ -0,0 +1,41 @@
+"""Top-k ranking by partial selection instead of a full sort"""
+import numpy as np
+
+from dashboard.filters import Selection
+
+# Numeric holder columns the top holders table can be ranked by
+RANK_COLUMNS = {
+    'Alpha Value (TAO)': 'total_alpha_value_rao',
+    'Total Value (TAO)': 'total_wallet_value_rao',
+    'Transactions': 'number_tx',
+    'Transaction Sessions': 'tx_time',
+    'Alpha %': 'alpha_percentage',
+    'Unique Tokens': 'unique_alpha_tokens',
+}
+
+
+def top_k(values: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k largest values, largest first
+
+    Runs in O(n + k log k). Ties are broken by position so that consecutive
+    pages of the same ranking never overlap or skip rows.
+    """
+    n = len(values)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    # Everything strictly above the k-th largest value, then the earliest ties
+    kth = np.partition(values, n - k)[n - k]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:k - len(above)]
+    candidates = np.concatenate([above, ties])
+
+    order = np.lexsort((candidates, -values[candidates]))
+    return candidates[order]
+
+
+def ranked_positions(selection: Selection, column: str, k: int) -> np.ndarray:
+    """Snapshot row positions of the selection's k highest holders by column"""
+    local = top_k(selection.holders[column].to_numpy(), k)
+    return selection.positions[local]
@@ -0,0 +1,189 @@
+"""Per-rerun timing of the dashboard's sections
+
+Every rerun (or fragment rerun) opens a Trace. Sections are timed wall-clock,
+and inside them the work is split into phases: loading, filtering,
+aggregation, figure building and serialization (handing elements to
+Streamlit). Phases nest (filtering usually happens inside an aggregate that
+missed the cache), and each span records its own time only, so a section's
+phases add up to at most its wall time. Nothing is recorded outside a trace,
+so the hooks cost a context variable lookup when tracing isn't active.
+
+Finished traces are appended as JSON lines to output/perf/traces.jsonl
+(DASHBOARD_TRACE_LOG overrides the path; set it empty to disable the log) and
+handed to every subscribed listener, in the thread that ran them.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+TRACE_LOG_ENV = 'DASHBOARD_TRACE_LOG'
+TRACE_LOG = 'output/perf/traces.jsonl'
+
+PHASES = ('load', 'filter', 'aggregate', 'figure', 'serialize')
+
+
+@dataclass
+class Span:
+    """Time spent in one phase of one section"""
+    section: str
+    phase: str
+    seconds: float = 0.0
+    rows: int = 0
+    cache: str = ''  # 'hit' or 'miss' for cached phases
+    nested: float = field(default=0.0, repr=False)  # Time of phases opened inside this one
+
+
+@dataclass
+class Trace:
+    """Timings of one script or fragment rerun"""
+    kind: str  # 'rerun' or 'fragment'
+    started: float = field(default_factory=time.time)
+    seconds: float = 0.0
+    sections: Dict[str, float] = field(default_factory=dict)
+    spans: List[Span] = field(default_factory=list)
+
+    def table(self) -> pd.DataFrame:
+        """One row per section: wall time, time per phase, rows processed and cache hits/misses"""
+        spans = pd.DataFrame([asdict(span) for span in self.spans], columns=list(Span.__dataclass_fields__))
+        rows = []
+        for name, seconds in self.sections.items():
+            own = spans[spans['section'] == name]
+            phases = own.groupby('phase')['seconds'].sum()
+            rows.append({
+                'Section': name,
+                'Wall (ms)': seconds * 1000,
+                **{f'{phase.title()} (ms)': phases.get(phase, 0.0) * 1000 for phase in PHASES},
+                'Rows': int(own['rows'].sum()),
+                'Cache Hits': int((own['cache'] == 'hit').sum()),
+                'Cache Misses': int((own['cache'] == 'miss').sum()),
+            })
+        return pd.DataFrame(rows)
+
+    def to_json(self) -> str:
+        spans = [{k: v for k, v in asdict(span).items() if k != 'nested'} for span in self.spans]
+        return json.dumps({
+            'kind': self.kind,
+            'started': self.started,
+            'seconds': self.seconds,
+            'sections': self.sections,
+            'spans': spans,
+        })
+
+
+_trace: ContextVar[Optional[Trace]] = ContextVar('trace', default=None)
+_section: ContextVar[str] = ContextVar('section', default='')
+_span: ContextVar[Optional[Span]] = ContextVar('span', default=None)
+_log_lock = threading.Lock()
+_listeners: List[Callable[[Trace], None]] = []
+
+
+@contextmanager
+def trace_run(kind: str = 'rerun') -> Iterator[Trace]:
+    """Record everything timed inside the block into a new trace, logged when it ends"""
+    trace = Trace(kind=kind)
+    token = _trace.set(trace)
+    start = time.perf_counter()
+    try:
+        yield trace
+    finally:
+        trace.seconds = time.perf_counter() - start
+        _trace.reset(token)
+        export(trace)
+        for listener in list(_listeners):
+            listener(trace)
+
+
+@contextmanager
+def section(name: str) -> Iterator[None]:
+    """Time a dashboard section (a fragment rerunning on its own gets a trace of its own)"""
+    if _trace.get() is None:
+        with trace_run('fragment'):
+            with section(name):
+                yield
+        return
+
+    trace = _trace.get()
+    trace.sections.setdefault(name, 0.0)  # Listed in the order sections start
+    token = _section.set(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.sections[name] = trace.sections.get(name, 0.0) + time.perf_counter() - start
+        _section.reset(token)
+
+
+def traced(func):
+    """Decorator timing a create_* function as the section of the same name"""
+    name = func.__name__.removeprefix('create_')
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with section(name):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def phase(name: str, rows: int = 0) -> Iterator[Span]:
+    """Time one phase of the current section; the span can be updated (rows, cache) inside the block"""
+    trace = _trace.get()
+    span = Span(section=_section.get(), phase=name, rows=rows)
+    if trace is None:
+        yield span
+        return
+
+    parent = _span.get()
+    token = _span.set(span)
+    start = time.perf_counter()
+    try:
+        yield span
+    finally:
+        elapsed = time.perf_counter() - start
+        span.seconds = elapsed - span.nested
+        if parent is not None:
+            parent.nested += elapsed
+        _span.reset(token)
+        trace.spans.append(span)
+
+
+def subscribe(listener: Callable[[Trace], None]):
+    """Call listener with every finished trace, fragment reruns included (once per listener)"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def latest_sections(traces: Iterable[Trace]) -> pd.DataFrame:
+    """Trace.table rows of every section from the most recent trace that timed it
+
+    A fragment rerunning on its own only times its own section, so combining
+    traces gives each section's latest timing, whichever kind of rerun it came
+    from ('Rerun' column) and how long ago ('Age (s)').
+    """
+    now = time.time()
+    latest: Dict[str, dict] = {}
+    for trace in sorted(traces, key=lambda trace: trace.started):
+        for row in trace.table().to_dict('records'):
+            latest[row['Section']] = {**row, 'Rerun': trace.kind, 'Age (s)': now - trace.started}
+    return pd.DataFrame(list(latest.values()))
+
+
+def export(trace: Trace):
+    """Append a finished trace to the trace log, if one is configured"""
+    path = os.environ.get(TRACE_LOG_ENV, TRACE_LOG)
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with _log_lock, open(path, 'a') as f:
+            f.write(trace.to_json() + '\n')
+    except OSError:
+        pass  # A read-only deployment still gets the in-app panel
@@ -0,0 +1,104 @@
+"""Hot reload of the analysis snapshot without restarting the dashboard
+
+run_analysis.sh replaces alpha_holders_analysis.json at the end of every run.
+The watcher notices the new file from its size and modification time (the
+same source_version the snapshot is keyed by), builds the new snapshot on a
+background thread and then swaps a single reference. Reruns that already
+picked up the old snapshot keep using it until they finish: its tables are
+memory maps of files that were replaced, not overwritten, so they stay valid.
+"""
+import os
+import threading
+import time
+from typing import Optional, Set
+
+from dashboard.holders import Snapshot
+from dashboard.snapshot import (SNAPSHOT_JSON, conversion_lock, convert_snapshot, load_snapshot, read_snapshot,
+                                source_version)
+
+# How often the JSON is checked for a new run, at most
+POLL_SECONDS = 30.0
+
+# A JSON modified less than this long ago may still be being written
+SETTLE_SECONDS = 10.0
+
+
+class SnapshotWatcher:
+    """Current snapshot of one analysis JSON, replaced in the background when the JSON changes"""
+
+    def __init__(self, json_path: str = SNAPSHOT_JSON, poll_seconds: float = POLL_SECONDS,
+                 settle_seconds: float = SETTLE_SECONDS):
+        self.json_path = json_path
+        self.poll_seconds = poll_seconds
+        self.settle_seconds = settle_seconds
+        self.error: Optional[str] = None  # Why the last background build failed
+        self._snapshot: Optional[Snapshot] = None
+        self._builder: Optional[threading.Thread] = None
+        self._attempted: Set[str] = set()  # JSON versions whose build failed, not retried until the JSON changes
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """True once a snapshot is being served"""
+        return self._snapshot is not None
+
+    @property
+    def building(self) -> bool:
+        """True while a newer snapshot is being built in the background"""
+        builder = self._builder
+        return builder is not None and builder.is_alive()
+
+    def current(self) -> Snapshot:
+        """Snapshot to serve this rerun; the first call loads it synchronously"""
+        if self._snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    with conversion_lock(self.json_path):
+                        self._snapshot = load_snapshot(self.json_path)
+                    self._checked = time.monotonic()
+            return self._snapshot
+        self.poll()
+        return self._snapshot
+
+    def poll(self):
+        """Start building the snapshot of a changed JSON, at most once per poll interval"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked < self.poll_seconds or self.building:
+                return
+            self._checked = now
+            version = self._pending_version()
+            if version is None:
+                return
+            self._builder = threading.Thread(target=self._build, args=(version,), name='snapshot-watcher', daemon=True)
+            self._builder.start()
+
+    def _pending_version(self) -> Optional[str]:
+        """source_version of a settled JSON that differs from the served snapshot, else None"""
+        try:
+            version = source_version(self.json_path)
+            settled = time.time() - os.path.getmtime(self.json_path) >= self.settle_seconds
+        except OSError:
+            return None  # No JSON (binary tables only) or it is being replaced right now
+        if not settled or version in self._attempted or version == self._snapshot.version:
+            return None
+        return version
+
+    def _build(self, version: str):
+        try:
+            with conversion_lock(self.json_path):
+                snapshot = load_snapshot(self.json_path)
+                if snapshot.version != version:
+                    # Tables of another JSON than the one polled: convert the JSON as it is now
+                    convert_snapshot(self.json_path)
+                    snapshot = read_snapshot(self.json_path)
+        except Exception as e:
+            # A truncated or invalid JSON: keep serving the old snapshot until the file changes again
+            self._attempted.add(version)
+            self.error = f"{self.json_path}: {e}"
+            return
+        if snapshot.version != version:
+            return  # Replaced again while building: the next poll picks the newer JSON up once it settles
+        self.error = None
+        self._snapshot = snapshot  # One reference assignment: every later rerun sees the new snapshot
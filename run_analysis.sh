@@ -104,6 +104,18 @@ if [ -f "$JSON_FILE" ]; then
     echo "  Location: $JSON_FILE" >> "$RECAP_FILE"
     echo "  Size:     $FILE_SIZE" >> "$RECAP_FILE"
     echo "  Holders:  ~$HOLDER_COUNT coldkeys" >> "$RECAP_FILE"
+
+    # Pre-build the binary snapshot so the dashboard doesn't have to parse the JSON on start
+    if python3 -m dashboard.snapshot "$JSON_FILE" >> "$LOG_FILE" 2>&1; then
+        echo "  Binary:   output/alpha_holders_analysis.arrow/" >> "$RECAP_FILE"
+    else
+        echo "  Binary:   ⚠️  conversion failed (dashboard will fall back to JSON)" >> "$RECAP_FILE"
+    fi
+
+    # Keep an immutable copy of this run so the dashboard can go back to it and compare runs
+    if [ $EXIT_CODE -eq 0 ] && python3 -m dashboard.registry register "$JSON_FILE" "$RECAP_FILE" >> "$LOG_FILE" 2>&1; then
+        echo "  Registry: output/snapshots/ (list runs with: python3 -m dashboard.registry list)" >> "$RECAP_FILE"
+    fi
 else
     echo "⚠️  WARNING: Output file not found!" >> "$RECAP_FILE"
 fi
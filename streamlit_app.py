@@ -1,9 +1,25 @@
+import time
+
 import streamlit as st
+import numpy as np
 import pandas as pd
-import json
-import plotly.express as px
-import plotly.graph_objects as go
-from typing import Dict, List
+
+from dashboard.cache import AggregateCache, cache_key
+from dashboard.charts import THEME_VERSION, bar_chart, frame_digest, lorenz_chart, subnet_chart
+from dashboard.compare import DELTA_COLUMNS, coldkey_deltas, delta_summary
+from dashboard.concentration import PERCENTILES, TOP_SHARES
+from dashboard.sections import FILTERS, downstream
+from dashboard.engine import make_engine
+from dashboard.filters import FilterState, Selection
+from dashboard.holders import Snapshot, decode_roles
+from dashboard.lookup import MAX_MATCHES, holder_detail, holder_holdings, search_coldkeys
+from dashboard.rao import to_tao
+from dashboard.registry import RunInfo, list_runs, open_run
+from dashboard.snapshot import SNAPSHOT_JSON, conversion_lock, convert_snapshot, is_fresh, snapshot_dir, source_version
+from dashboard.tables import page_count, sort_order, table_page
+from dashboard.topk import RANK_COLUMNS, top_k
+from dashboard.tracing import PHASES, Trace, latest_sections, phase, section, subscribe, trace_run, traced
+from dashboard.watcher import SnapshotWatcher
 
 # Page configuration
 st.set_page_config(
@@ -53,1011 +69,854 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Load data
-@st.cache_data
-def load_data():
-    """Load the alpha holders analysis data"""
-    with open('output/alpha_holders_analysis.json', 'r') as f:
-        data = json.load(f)
-    return data
-
-def filter_data_by_role(data: List[Dict], role_filter: str) -> List[Dict]:
-    """Filter data by role"""
-    if role_filter == "All":
-        return data
-    
-    filtered = []
-    for holder in data:
-        roles = holder.get('roles', [])
-        if role_filter == "Subnet Owner" and "Subnet Owner" in roles:
-            filtered.append(holder)
-        elif role_filter == "Investor" and "Investor" in roles:
-            filtered.append(holder)
-        elif role_filter == "Miner" and "Miner" in roles:
-            filtered.append(holder)
-    
-    return filtered
-
-def filter_data_by_staking_proxy(data: List[Dict], proxy_filter: str) -> List[Dict]:
-    """Filter data by staking proxy status"""
-    if proxy_filter == "All":
-        return data
-    elif proxy_filter == "True":
-        return [h for h in data if h.get('has_staking_proxy', False)]
-    else:  # False
-        return [h for h in data if not h.get('has_staking_proxy', False)]
-
-def filter_data_by_wallet_value(data: List[Dict], min_value: float, max_value: float) -> List[Dict]:
-    """Filter data by total wallet value in TAO"""
-    return [h for h in data if min_value <= h.get('total_wallet_value_tao', 0) <= max_value]
-
-def filter_data_by_token_count(data: List[Dict], min_tokens: int, max_tokens: int) -> List[Dict]:
-    """Filter data by number of unique alpha tokens held"""
-    return [h for h in data if min_tokens <= h.get('unique_alpha_tokens', 0) <= max_tokens]
-
-def apply_chart_theme(fig):
-    """Apply consistent theme to plotly charts"""
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(size=12),
-        margin=dict(l=20, r=20, t=40, b=20),
-        showlegend=True,
-        legend=dict(
-            orientation="v",
-            yanchor="top",
-            y=1,
-            xanchor="left",
-            x=1.02
-        )
+@st.cache_resource
+def get_snapshot_watcher() -> SnapshotWatcher:
+    """Watcher of the analysis JSON shared by every session of this worker"""
+    return SnapshotWatcher(SNAPSHOT_JSON)
+
+def load_data() -> Snapshot:
+    """Load the alpha holders analysis data (binary snapshot first, JSON as fallback)
+
+    Every session shares the watcher's read-only, memory-mapped snapshot. When a
+    new analysis run lands it is loaded in the background and swapped in for the
+    following reruns, without restarting the worker.
+    """
+    return get_snapshot_watcher().current()
+
+@st.cache_resource
+def load_run(run_id: str) -> Snapshot:
+    """Map one registered analysis run (runs are immutable, so they never need reloading)"""
+    return open_run(run_id)
+
+@st.cache_resource(max_entries=4)
+def get_selection(version: str, filters: FilterState, _snapshot: Snapshot) -> Selection:
+    """One Selection (so one filter mask) per filter state, shared by the sections and sessions using it"""
+    return Selection(_snapshot, filters)
+
+@st.cache_resource
+def get_failed_conversions() -> dict:
+    """Why the binary tables of a source version could not be written, so reruns don't retry them"""
+    return {}
+
+def convert_with_progress():
+    """Stream a new or changed analysis JSON into the binary snapshot, showing a progress bar
+
+    Runs outside load_data because Streamlit replays elements created inside
+    cached functions; once the binary tables are fresh load_data just maps them.
+    """
+    with conversion_lock(SNAPSHOT_JSON):
+        failed = get_failed_conversions()
+        if is_fresh(SNAPSHOT_JSON):
+            return
+        version = source_version(SNAPSHOT_JSON)
+        if version in failed:
+            warn_unconverted(failed[version])
+            return
+        bar = st.progress(0.0, text="Parsing alpha holders analysis...")
+
+        def report(bytes_read: int, total: int):
+            mb = total / 1024 / 1024
+            bar.progress(min(bytes_read / max(total, 1), 1.0), text=f"Parsing alpha holders analysis ({mb:,.0f} MB)...")
+
+        try:
+            convert_snapshot(SNAPSHOT_JSON, report)
+        except OSError as e:
+            # Unwritable output directory: load_data parses without the binary copy
+            failed[version] = str(e)
+            warn_unconverted(failed[version])
+        finally:
+            bar.empty()
+
+def warn_unconverted(error: str):
+    """Tell the user the JSON is parsed on every load because its binary tables can't be written"""
+    st.warning(
+        f"⚠️ Could not write the binary snapshot to {snapshot_dir(SNAPSHOT_JSON)} ({error}). "
+        "The analysis JSON will be parsed again on every load until the output directory is writable."
     )
-    return fig
-
-def format_number(num, decimals=2):
-    """Format large numbers with K, M, B suffixes"""
-    if num >= 1_000_000:
-        return f"{num/1_000_000:.{decimals}f}M"
-    elif num >= 1_000:
-        return f"{num/1_000:.{decimals}f}K"
-    else:
-        return f"{num:.{decimals}f}"
-
-def create_global_role_analysis(data: List[Dict]):
+
+@st.cache_resource
+def get_engine():
+    """Query engine chosen by DASHBOARD_ENGINE (see dashboard/engine.py)"""
+    return make_engine()
+
+@st.cache_resource
+def get_aggregate_cache() -> AggregateCache:
+    """Section aggregates shared by every session of this worker"""
+    return AggregateCache(maxsize=256)
+
+def cached_aggregate(selection: Selection, name: str, compute, *params):
+    """Compute a section aggregate once per snapshot version, filter state and parameters"""
+    key = cache_key(selection.snapshot.version, selection.filters, name, *params)
+    with phase('aggregate') as span:
+        value = traced_lookup(get_aggregate_cache(), key, compute, span)
+        span.rows = len(value) if isinstance(value, (pd.DataFrame, np.ndarray)) else 0
+    return value
+
+def traced_lookup(cache: AggregateCache, key: str, compute, span):
+    """cache.get_or_compute, recording on the span whether it was a hit"""
+    span.cache = 'hit'
+
+    def compute_and_record():
+        span.cache = 'miss'
+        return compute()
+
+    return cache.get_or_compute(key, compute_and_record)
+
+@st.cache_resource
+def get_figure_cache() -> AggregateCache:
+    """Built figures shared by every session of this worker"""
+    return AggregateCache(maxsize=128)
+
+def cached_figure(factory, df: pd.DataFrame, *args, **kwargs):
+    """Build a figure once per chart, theme version and input frame content"""
+    with phase('figure', rows=len(df)) as span:
+        key = cache_key(factory.__name__, THEME_VERSION, frame_digest(df), *args, kwargs)
+        return traced_lookup(get_figure_cache(), key, lambda: factory(df, *args, **kwargs), span)
+
+def show_chart(fig):
+    """st.plotly_chart at full width, timed as serialization
+
+    Streamlit serializes the figure every time it is sent. Charts are only sent
+    again when their section reruns: sections are fragments rerun by their own
+    inputs (dashboard/sections.py), so unchanged charts are not re-sent.
+    """
+    with phase('serialize'):
+        st.plotly_chart(fig, width="stretch")
+
+def show_table(df: pd.DataFrame, **kwargs):
+    """st.dataframe, timed as serialization"""
+    with phase('serialize', rows=len(df)):
+        st.dataframe(df, **kwargs)
+
+# Client-side number formats: tables ship numbers (sortable, compact) and the browser formats them
+TAO_FORMAT = dict(format="localized", step=0.01)
+COUNT_FORMAT = dict(format="localized", step=1)
+
+def number_columns(**formats) -> dict:
+    """column_config mapping each column name to a NumberColumn with the given format"""
+    return {name: st.column_config.NumberColumn(**fmt) for name, fmt in formats.items()}
+
+@traced
+def create_global_role_analysis(selection: Selection):
     """Create global analysis by role (NO FILTERS APPLIED)"""
     st.markdown("<h2>📊 Global Analysis by Role (Unfiltered Data)</h2>", unsafe_allow_html=True)
     
-    # Aggregate by role
-    role_stats = {}
-    
-    for holder in data:
-        roles = holder.get('roles', ['Unknown'])
-        for role in roles:
-            if role not in role_stats:
-                role_stats[role] = {
-                    'count': 0,
-                    'total_alpha_tao': 0
-                }
-            
-            role_stats[role]['count'] += 1
-            role_stats[role]['total_alpha_tao'] += holder['total_alpha_value_tao']
-    
-    # Create DataFrame
-    role_df = pd.DataFrame([
-        {'Role': role, 'Coldkeys': stats['count'], 'Total Alpha (TAO)': stats['total_alpha_tao']}
-        for role, stats in role_stats.items()
-    ]).sort_values('Total Alpha (TAO)', ascending=False)
+    # Aggregate by role (cached per snapshot, the filters don't apply here)
+    role_df = cached_aggregate(selection, 'roles', lambda: get_engine().role_totals(selection))
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Bar chart: Total TAO by Role
-        total = role_df['Total Alpha (TAO)'].sum()
-        role_df['Percentage'] = (role_df['Total Alpha (TAO)'] / total * 100).round(1)
-        
-        fig = px.bar(
-            role_df,
-            x='Role',
-            y='Total Alpha (TAO)',
-            title='Total Alpha Value (TAO) by Role',
-            color='Total Alpha (TAO)',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Percentage'
-        )
-        fig.update_traces(
-            hovertemplate='%{x}<br>%{y:.1f} TAO<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
+        fig = cached_figure(
+            bar_chart, role_df, 'Role', 'Total Alpha (TAO)', 'Total Alpha Value (TAO) by Role', 'Percentage',
+            '%{x}<br>%{y:.1f} TAO<extra></extra>'
         )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         # Bar chart: Number of Coldkeys by Role
-        total_coldkeys = role_df['Coldkeys'].sum()
-        role_df['Percentage_CK'] = (role_df['Coldkeys'] / total_coldkeys * 100).round(1)
-        
-        fig = px.bar(
-            role_df,
-            x='Role',
-            y='Coldkeys',
-            title='Number of Coldkeys by Role',
-            color='Coldkeys',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Percentage_CK'
+        fig = cached_figure(
+            bar_chart, role_df, 'Role', 'Coldkeys', 'Number of Coldkeys by Role', 'Percentage_CK',
+            '%{x}<br>%{y:.0f} Coldkeys<extra></extra>'
         )
-        fig.update_traces(
-            hovertemplate='%{x}<br>%{y:.0f} Coldkeys<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
-        )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
-def create_breakdown_by_tx(data: List[Dict]):
+@st.fragment(key="breakdown_by_tx")
+@traced
+def create_breakdown_by_tx(snapshot: Snapshot):
     """Create breakdown by number of transactions (10 categories)"""
+    selection = current_selection(snapshot)
     st.markdown("<h2>💸 Breakdown by Transaction Count</h2>", unsafe_allow_html=True)
     
-    # Define TX categories
-    categories = [
-        ('0', 0, 0),
-        ('1-5', 1, 5),
-        ('6-10', 6, 10),
-        ('11-20', 11, 20),
-        ('21-30', 21, 30),
-        ('31-50', 31, 50),
-        ('51-75', 51, 75),
-        ('76-100', 76, 100),
-        ('101-200', 101, 200),
-        ('201-500', 201, 500),
-        ('500+', 501, float('inf'))
-    ]
-    
-    # Aggregate stats
-    tx_stats = []
-    for cat_name, min_tx, max_tx in categories:
-        holders = [h for h in data if min_tx <= h.get('number_tx', 0) <= max_tx]
-        total_alpha = sum(h['total_alpha_value_tao'] for h in holders)
-        tx_stats.append({
-            'Category': cat_name,
-            'Coldkeys': len(holders),
-            'Total Alpha (TAO)': total_alpha
-        })
-    
-    df = pd.DataFrame(tx_stats)
-    
-    # Calculate percentages
-    total_alpha = df['Total Alpha (TAO)'].sum()
-    total_coldkeys = df['Coldkeys'].sum()
-    df['Pct_Alpha'] = (df['Total Alpha (TAO)'] / total_alpha * 100).round(1)
-    df['Pct_Coldkeys'] = (df['Coldkeys'] / total_coldkeys * 100).round(1)
+    # Aggregate stats (bucket edges live in dashboard.binning)
+    df = cached_aggregate(selection, 'tx', lambda: get_engine().breakdown(selection, 'tx'))
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Alpha value by TX category
-        fig = px.bar(
-            df,
-            x='Category',
-            y='Total Alpha (TAO)',
-            title='Alpha Value by Transaction Count',
-            color='Total Alpha (TAO)',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Pct_Alpha'
-        )
-        fig.update_traces(
-            hovertemplate='%{x}<br>%{y:.1f} TAO<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
+        fig = cached_figure(
+            bar_chart, df, 'Category', 'Total Alpha (TAO)', 'Alpha Value by Transaction Count', 'Pct_Alpha',
+            '%{x}<br>%{y:.1f} TAO<extra></extra>'
         )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         # Number of coldkeys by TX category
-        fig = px.bar(
-            df,
-            x='Category',
-            y='Coldkeys',
-            title='Number of Coldkeys by Transaction Count',
-            color='Coldkeys',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Pct_Coldkeys'
+        fig = cached_figure(
+            bar_chart, df, 'Category', 'Coldkeys', 'Number of Coldkeys by Transaction Count', 'Pct_Coldkeys',
+            '%{x}<br>%{y:.0f} Coldkeys<extra></extra>'
         )
-        fig.update_traces(
-            hovertemplate='%{x}<br>%{y:.0f} Coldkeys<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
-        )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
-def create_breakdown_by_tx_time(data: List[Dict]):
-    """Create breakdown by number of transaction sessions (tx_time) (7 categories)"""
+@st.fragment(key="breakdown_by_tx_time")
+@traced
+def create_breakdown_by_tx_time(snapshot: Snapshot):
+    """Create breakdown by number of transaction sessions (tx_time) (7 non-overlapping categories)"""
+    selection = current_selection(snapshot)
     st.markdown("<h2>⏰ Breakdown by Transaction Sessions (tx_time)</h2>", unsafe_allow_html=True)
     
-    # Define TX sessions categories
-    categories = [
-        ('0', 0, 0),
-        ('1-5', 1, 5),
-        ('5-12', 5, 12),
-        ('12-25', 12, 25),
-        ('25-50', 25, 50),
-        ('50-100', 50, 100),
-        ('100+', 100, float('inf'))
-    ]
-    
-    # Aggregate stats
-    tx_time_stats = []
-    for cat_name, min_sessions, max_sessions in categories:
-        holders = [h for h in data if min_sessions <= h.get('tx_time', 0) <= max_sessions]
-        total_alpha = sum(h['total_alpha_value_tao'] for h in holders)
-        tx_time_stats.append({
-            'Category': cat_name,
-            'Coldkeys': len(holders),
-            'Total Alpha (TAO)': total_alpha
-        })
-    
-    df = pd.DataFrame(tx_time_stats)
-    
-    # Calculate percentages
-    total_alpha = df['Total Alpha (TAO)'].sum()
-    total_coldkeys = df['Coldkeys'].sum()
-    df['Pct_Alpha'] = (df['Total Alpha (TAO)'] / total_alpha * 100).round(1)
-    df['Pct_Coldkeys'] = (df['Coldkeys'] / total_coldkeys * 100).round(1)
+    # Aggregate stats (bucket edges live in dashboard.binning)
+    df = cached_aggregate(selection, 'tx_time', lambda: get_engine().breakdown(selection, 'tx_time'))
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Alpha value by TX sessions category
-        fig = px.bar(
-            df,
-            x='Category',
-            y='Total Alpha (TAO)',
-            title='Alpha Value by Transaction Sessions Count',
-            color='Total Alpha (TAO)',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Pct_Alpha'
-        )
-        fig.update_traces(
-            hovertemplate='%{x}<br>%{y:.1f} TAO<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
+        fig = cached_figure(
+            bar_chart, df, 'Category', 'Total Alpha (TAO)', 'Alpha Value by Transaction Sessions Count', 'Pct_Alpha',
+            '%{x}<br>%{y:.1f} TAO<extra></extra>'
         )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         # Number of coldkeys by TX sessions category
-        fig = px.bar(
-            df,
-            x='Category',
-            y='Coldkeys',
-            title='Number of Coldkeys by Transaction Sessions Count',
-            color='Coldkeys',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Pct_Coldkeys'
-        )
-        fig.update_traces(
-            hovertemplate='%{x}<br>%{y:.0f} Coldkeys<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
+        fig = cached_figure(
+            bar_chart, df, 'Category', 'Coldkeys', 'Number of Coldkeys by Transaction Sessions Count', 'Pct_Coldkeys',
+            '%{x}<br>%{y:.0f} Coldkeys<extra></extra>'
         )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     # Detailed breakdown for sessions 1-5
     st.markdown("<h3>📊 Detailed Breakdown: Sessions 1-5</h3>", unsafe_allow_html=True)
     
-    detailed_categories = [
-        ('1', 1, 1),
-        ('2', 2, 2),
-        ('3', 3, 3),
-        ('4', 4, 4),
-        ('5', 5, 5)
-    ]
-    
-    detailed_stats = []
-    for cat_name, min_s, max_s in detailed_categories:
-        holders = [h for h in data if min_s <= h.get('tx_time', 0) <= max_s]
-        total_alpha = sum(h['total_alpha_value_tao'] for h in holders)
-        detailed_stats.append({
-            'Sessions': cat_name,
-            'Coldkeys': len(holders),
-            'Total Alpha (TAO)': total_alpha
-        })
-    
-    df_detailed = pd.DataFrame(detailed_stats)
-    
-    # Calculate percentages
-    total_alpha_detailed = df_detailed['Total Alpha (TAO)'].sum()
-    total_coldkeys_detailed = df_detailed['Coldkeys'].sum()
-    df_detailed['Pct_Alpha'] = (df_detailed['Total Alpha (TAO)'] / total_alpha_detailed * 100).round(1)
-    df_detailed['Pct_Coldkeys'] = (df_detailed['Coldkeys'] / total_coldkeys_detailed * 100).round(1)
+    df_detailed = cached_aggregate(selection, 'tx_time_1_5', lambda: get_engine().breakdown(selection, 'tx_time_1_5'))
     
     col1, col2 = st.columns(2)
     
     with col1:
-        fig = px.bar(
-            df_detailed,
-            x='Sessions',
-            y='Total Alpha (TAO)',
-            title='Alpha Value by Sessions (0-5)',
-            color='Total Alpha (TAO)',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Pct_Alpha'
-        )
-        fig.update_traces(
-            hovertemplate='Sessions: %{x}<br>%{y:.1f} TAO<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
+        fig = cached_figure(
+            bar_chart, df_detailed, 'Sessions', 'Total Alpha (TAO)', 'Alpha Value by Sessions (0-5)', 'Pct_Alpha',
+            'Sessions: %{x}<br>%{y:.1f} TAO<extra></extra>'
         )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
-        fig = px.bar(
-            df_detailed,
-            x='Sessions',
-            y='Coldkeys',
-            title='Number of Coldkeys by Sessions (0-5)',
-            color='Coldkeys',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Pct_Coldkeys'
+        fig = cached_figure(
+            bar_chart, df_detailed, 'Sessions', 'Coldkeys', 'Number of Coldkeys by Sessions (0-5)', 'Pct_Coldkeys',
+            'Sessions: %{x}<br>%{y:.0f} Coldkeys<extra></extra>'
         )
-        fig.update_traces(
-            hovertemplate='Sessions: %{x}<br>%{y:.0f} Coldkeys<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
-        )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
-def create_breakdown_by_tx_detailed(data: List[Dict]):
+@traced
+def create_breakdown_by_tx_detailed(selection: Selection):
     """Create breakdown by number of transactions (all values with log scale)"""
     st.markdown("<h3>📊 Detailed Transaction Count Distribution</h3>", unsafe_allow_html=True)
     
     # Group by exact transaction count
-    tx_stats = {}
-    for holder in data:
-        tx_count = holder.get('number_tx', 0)
-        if tx_count not in tx_stats:
-            tx_stats[tx_count] = {
-                'holders': [],
-                'total_alpha': 0
-            }
-        tx_stats[tx_count]['holders'].append(holder)
-        tx_stats[tx_count]['total_alpha'] += holder['total_alpha_value_tao']
-    
-    # Convert to DataFrame
-    tx_data = []
-    for tx_count, stats in sorted(tx_stats.items()):
-        tx_data.append({
-            'TX Count': tx_count,
-            'Coldkeys': len(stats['holders']),
-            'Total Alpha (TAO)': stats['total_alpha']
-        })
-    
-    df = pd.DataFrame(tx_data)
-    
-    # Calculate percentages
-    total_alpha = df['Total Alpha (TAO)'].sum()
-    total_coldkeys = df['Coldkeys'].sum()
-    df['Pct_Alpha'] = (df['Total Alpha (TAO)'] / total_alpha * 100).round(1)
-    df['Pct_Coldkeys'] = (df['Coldkeys'] / total_coldkeys * 100).round(1)
+    df = cached_aggregate(selection, 'tx_detailed', lambda: get_engine().distribution(selection, 'number_tx', 'TX Count'))
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Alpha value by TX count
-        fig = px.bar(
-            df,
-            x='TX Count',
-            y='Total Alpha (TAO)',
-            title='Alpha Value by Transaction Count (Log Scale)',
-            color='Total Alpha (TAO)',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            log_y=True,
-            text='Pct_Alpha'
-        )
-        fig.update_traces(
-            hovertemplate='TX: %{x}<br>%{y:.1f} TAO<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
+        fig = cached_figure(
+            bar_chart, df, 'TX Count', 'Total Alpha (TAO)', 'Alpha Value by Transaction Count (Log Scale)', 'Pct_Alpha',
+            'TX: %{x}<br>%{y:.1f} TAO<extra></extra>', log_y=True
         )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         # Number of coldkeys by TX count
-        fig = px.bar(
-            df,
-            x='TX Count',
-            y='Coldkeys',
-            title='Number of Coldkeys by Transaction Count (Log Scale)',
-            color='Coldkeys',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            log_y=True,
-            text='Pct_Coldkeys'
+        fig = cached_figure(
+            bar_chart, df, 'TX Count', 'Coldkeys', 'Number of Coldkeys by Transaction Count (Log Scale)', 'Pct_Coldkeys',
+            'TX: %{x}<br>%{y:.0f} Coldkeys<extra></extra>', log_y=True
         )
-        fig.update_traces(
-            hovertemplate='TX: %{x}<br>%{y:.0f} Coldkeys<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
-        )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
-def create_breakdown_by_tx_time_detailed(data: List[Dict]):
+@traced
+def create_breakdown_by_tx_time_detailed(selection: Selection):
     """Create breakdown by number of transaction sessions (tx_time) (all values with log scale)"""
     st.markdown("<h3>⏰ Detailed Transaction Sessions Distribution</h3>", unsafe_allow_html=True)
     
     # Group by exact transaction sessions count
-    tx_time_stats = {}
-    for holder in data:
-        tx_time_count = holder.get('tx_time', 0)
-        if tx_time_count not in tx_time_stats:
-            tx_time_stats[tx_time_count] = {
-                'holders': [],
-                'total_alpha': 0
-            }
-        tx_time_stats[tx_time_count]['holders'].append(holder)
-        tx_time_stats[tx_time_count]['total_alpha'] += holder['total_alpha_value_tao']
-    
-    # Convert to DataFrame
-    tx_time_data = []
-    for tx_time_count, stats in sorted(tx_time_stats.items()):
-        tx_time_data.append({
-            'Sessions Count': tx_time_count,
-            'Coldkeys': len(stats['holders']),
-            'Total Alpha (TAO)': stats['total_alpha']
-        })
-    
-    df = pd.DataFrame(tx_time_data)
-    
-    # Calculate percentages
-    total_alpha = df['Total Alpha (TAO)'].sum()
-    total_coldkeys = df['Coldkeys'].sum()
-    df['Pct_Alpha'] = (df['Total Alpha (TAO)'] / total_alpha * 100).round(1)
-    df['Pct_Coldkeys'] = (df['Coldkeys'] / total_coldkeys * 100).round(1)
+    df = cached_aggregate(selection, 'tx_time_detailed', lambda: get_engine().distribution(selection, 'tx_time', 'Sessions Count'))
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Alpha value by TX sessions count
-        fig = px.bar(
-            df,
-            x='Sessions Count',
-            y='Total Alpha (TAO)',
-            title='Alpha Value by Transaction Sessions Count (Log Scale)',
-            color='Total Alpha (TAO)',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            log_y=True,
-            text='Pct_Alpha'
+        fig = cached_figure(
+            bar_chart, df, 'Sessions Count', 'Total Alpha (TAO)', 'Alpha Value by Transaction Sessions Count (Log Scale)', 'Pct_Alpha',
+            'Sessions: %{x}<br>%{y:.1f} TAO<extra></extra>', log_y=True
         )
-        fig.update_traces(
-            hovertemplate='Sessions: %{x}<br>%{y:.1f} TAO<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
-        )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         # Number of coldkeys by TX sessions count
-        fig = px.bar(
-            df,
-            x='Sessions Count',
-            y='Coldkeys',
-            title='Number of Coldkeys by Transaction Sessions Count (Log Scale)',
-            color='Coldkeys',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            log_y=True,
-            text='Pct_Coldkeys'
-        )
-        fig.update_traces(
-            hovertemplate='Sessions: %{x}<br>%{y:.0f} Coldkeys<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
+        fig = cached_figure(
+            bar_chart, df, 'Sessions Count', 'Coldkeys', 'Number of Coldkeys by Transaction Sessions Count (Log Scale)', 'Pct_Coldkeys',
+            'Sessions: %{x}<br>%{y:.0f} Coldkeys<extra></extra>', log_y=True
         )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
-def create_breakdown_by_tokens(data: List[Dict]):
+@st.fragment(key="breakdown_by_tokens")
+@traced
+def create_breakdown_by_tokens(snapshot: Snapshot):
     """Create breakdown by number of unique tokens held (10 categories)"""
+    selection = current_selection(snapshot)
     st.markdown("<h2>🎯 Breakdown by Number of Tokens Held</h2>", unsafe_allow_html=True)
     
-    # Define 10 token categories
-    categories = [
-        ('1', 1, 1),
-        ('2-3', 2, 3),
-        ('4-5', 4, 5),
-        ('6-8', 6, 8),
-        ('9-12', 9, 12),
-        ('13-16', 13, 16),
-        ('17-20', 17, 20),
-        ('21-30', 21, 30),
-        ('31-50', 31, 50),
-        ('50+', 51, float('inf'))
-    ]
-    
-    # Aggregate stats
-    token_stats = []
-    for cat_name, min_tokens, max_tokens in categories:
-        holders = [h for h in data if min_tokens <= h.get('unique_alpha_tokens', 0) <= max_tokens]
-        total_alpha = sum(h['total_alpha_value_tao'] for h in holders)
-        token_stats.append({
-            'Category': cat_name,
-            'Coldkeys': len(holders),
-            'Total Alpha (TAO)': total_alpha
-        })
-    
-    df = pd.DataFrame(token_stats)
-    
-    # Calculate percentages
-    total_alpha = df['Total Alpha (TAO)'].sum()
-    total_coldkeys = df['Coldkeys'].sum()
-    df['Pct_Alpha'] = (df['Total Alpha (TAO)'] / total_alpha * 100).round(1)
-    df['Pct_Coldkeys'] = (df['Coldkeys'] / total_coldkeys * 100).round(1)
+    # Aggregate stats (bucket edges live in dashboard.binning)
+    df = cached_aggregate(selection, 'tokens', lambda: get_engine().breakdown(selection, 'tokens'))
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Alpha value by token category
-        fig = px.bar(
-            df,
-            x='Category',
-            y='Total Alpha (TAO)',
-            title='Alpha Value by Number of Tokens',
-            color='Total Alpha (TAO)',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Pct_Alpha'
+        fig = cached_figure(
+            bar_chart, df, 'Category', 'Total Alpha (TAO)', 'Alpha Value by Number of Tokens', 'Pct_Alpha',
+            '%{x}<br>%{y:.1f} TAO<extra></extra>'
         )
-        fig.update_traces(
-            hovertemplate='%{x}<br>%{y:.1f} TAO<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
-        )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         # Number of coldkeys by token category
-        fig = px.bar(
-            df,
-            x='Category',
-            y='Coldkeys',
-            title='Number of Coldkeys by Token Count',
-            color='Coldkeys',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Pct_Coldkeys'
-        )
-        fig.update_traces(
-            hovertemplate='%{x}<br>%{y:.0f} Coldkeys<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
+        fig = cached_figure(
+            bar_chart, df, 'Category', 'Coldkeys', 'Number of Coldkeys by Token Count', 'Pct_Coldkeys',
+            '%{x}<br>%{y:.0f} Coldkeys<extra></extra>'
         )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
-def create_breakdown_by_tokens_detailed(data: List[Dict]):
+@traced
+def create_breakdown_by_tokens_detailed(selection: Selection):
     """Create breakdown by number of unique tokens held (all values with log scale)"""
     st.markdown("<h3>📊 Detailed Token Count Distribution</h3>", unsafe_allow_html=True)
     
     # Group by exact token count
-    token_stats = {}
-    for holder in data:
-        token_count = holder.get('unique_alpha_tokens', 0)
-        if token_count not in token_stats:
-            token_stats[token_count] = {
-                'holders': [],
-                'total_alpha': 0
-            }
-        token_stats[token_count]['holders'].append(holder)
-        token_stats[token_count]['total_alpha'] += holder['total_alpha_value_tao']
-    
-    # Convert to DataFrame
-    token_data = []
-    for token_count, stats in sorted(token_stats.items()):
-        token_data.append({
-            'Token Count': token_count,
-            'Coldkeys': len(stats['holders']),
-            'Total Alpha (TAO)': stats['total_alpha']
-        })
-    
-    df = pd.DataFrame(token_data)
-    
-    # Calculate percentages
-    total_alpha = df['Total Alpha (TAO)'].sum()
-    total_coldkeys = df['Coldkeys'].sum()
-    df['Pct_Alpha'] = (df['Total Alpha (TAO)'] / total_alpha * 100).round(1)
-    df['Pct_Coldkeys'] = (df['Coldkeys'] / total_coldkeys * 100).round(1)
+    df = cached_aggregate(selection, 'tokens_detailed', lambda: get_engine().distribution(selection, 'unique_alpha_tokens', 'Token Count'))
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Alpha value by token count
-        fig = px.bar(
-            df,
-            x='Token Count',
-            y='Total Alpha (TAO)',
-            title='Alpha Value by Number of Tokens (Log Scale)',
-            color='Total Alpha (TAO)',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            log_y=True,
-            text='Pct_Alpha'
+        fig = cached_figure(
+            bar_chart, df, 'Token Count', 'Total Alpha (TAO)', 'Alpha Value by Number of Tokens (Log Scale)', 'Pct_Alpha',
+            'Tokens: %{x}<br>%{y:.1f} TAO<extra></extra>', log_y=True
         )
-        fig.update_traces(
-            hovertemplate='Tokens: %{x}<br>%{y:.1f} TAO<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
-        )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         # Number of coldkeys by token count
-        fig = px.bar(
-            df,
-            x='Token Count',
-            y='Coldkeys',
-            title='Number of Coldkeys by Token Count (Log Scale)',
-            color='Coldkeys',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            log_y=True,
-            text='Pct_Coldkeys'
-        )
-        fig.update_traces(
-            hovertemplate='Tokens: %{x}<br>%{y:.0f} Coldkeys<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
+        fig = cached_figure(
+            bar_chart, df, 'Token Count', 'Coldkeys', 'Number of Coldkeys by Token Count (Log Scale)', 'Pct_Coldkeys',
+            'Tokens: %{x}<br>%{y:.0f} Coldkeys<extra></extra>', log_y=True
         )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
-def create_breakdown_by_alpha_percentage(data: List[Dict]):
+@st.fragment(key="breakdown_by_alpha_percentage")
+@traced
+def create_breakdown_by_alpha_percentage(snapshot: Snapshot):
     """Create breakdown by alpha percentage"""
+    selection = current_selection(snapshot)
     st.markdown("<h2>📈 Breakdown by Alpha Percentage</h2>", unsafe_allow_html=True)
     
-    # Define alpha % categories
-    categories = [
-        ('0-25%', lambda h: h.get('alpha_percentage', 0) < 25),
-        ('25-50%', lambda h: 25 <= h.get('alpha_percentage', 0) < 50),
-        ('50-75%', lambda h: 50 <= h.get('alpha_percentage', 0) < 75),
-        ('75-90%', lambda h: 75 <= h.get('alpha_percentage', 0) < 90),
-        ('90-95%', lambda h: 90 <= h.get('alpha_percentage', 0) < 95),
-        ('95-99%', lambda h: 95 <= h.get('alpha_percentage', 0) < 99),
-        ('99-100%', lambda h: h.get('alpha_percentage', 0) >= 99)
-    ]
-    
-    # Aggregate stats
-    alpha_stats = []
-    for cat_name, cat_filter in categories:
-        holders = [h for h in data if cat_filter(h)]
-        total_alpha = sum(h['total_alpha_value_tao'] for h in holders)
-        alpha_stats.append({
-            'Category': cat_name,
-            'Coldkeys': len(holders),
-            'Total Alpha (TAO)': total_alpha
-        })
-    
-    df = pd.DataFrame(alpha_stats)
-    
-    # Calculate percentages
-    total_alpha = df['Total Alpha (TAO)'].sum()
-    total_coldkeys = df['Coldkeys'].sum()
-    df['Pct_Alpha'] = (df['Total Alpha (TAO)'] / total_alpha * 100).round(1)
-    df['Pct_Coldkeys'] = (df['Coldkeys'] / total_coldkeys * 100).round(1)
+    # Aggregate stats (bucket edges live in dashboard.binning)
+    df = cached_aggregate(selection, 'alpha_percentage', lambda: get_engine().breakdown(selection, 'alpha_percentage'))
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Alpha value by alpha %
-        fig = px.bar(
-            df,
-            x='Category',
-            y='Total Alpha (TAO)',
-            title='Alpha Value by Alpha Percentage Range',
-            color='Total Alpha (TAO)',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Pct_Alpha'
-        )
-        fig.update_traces(
-            hovertemplate='%{x}<br>%{y:.1f} TAO<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
+        fig = cached_figure(
+            bar_chart, df, 'Category', 'Total Alpha (TAO)', 'Alpha Value by Alpha Percentage Range', 'Pct_Alpha',
+            '%{x}<br>%{y:.1f} TAO<extra></extra>'
         )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         # Number of coldkeys by alpha %
-        fig = px.bar(
-            df,
-            x='Category',
-            y='Coldkeys',
-            title='Number of Coldkeys by Alpha Percentage',
-            color='Coldkeys',
-            color_continuous_scale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            text='Pct_Coldkeys'
+        fig = cached_figure(
+            bar_chart, df, 'Category', 'Coldkeys', 'Number of Coldkeys by Alpha Percentage', 'Pct_Coldkeys',
+            '%{x}<br>%{y:.0f} Coldkeys<extra></extra>'
         )
-        fig.update_traces(
-            hovertemplate='%{x}<br>%{y:.0f} Coldkeys<extra></extra>',
-            texttemplate='%{text:.1f}%',
-            textposition='outside'
+        show_chart(fig)
+
+@st.fragment(key="top_holders_table")
+@traced
+def create_top_holders_table(snapshot: Snapshot, n: int = 20, page_size: int = 20):
+    """Create paged table of top holders, ranked by any numeric column
+
+    Running as a fragment, ranking and paging rerun this table alone.
+    """
+    selection = current_selection(snapshot)
+    header = st.empty()  # Filled in once the ranking controls are read
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        rank_by = st.selectbox("Rank by", options=list(RANK_COLUMNS), index=0, key="top_rank_by")
+    with col2:
+        n = int(st.number_input("Top N", min_value=1, max_value=10_000, value=n, step=10, key="top_n"))
+    
+    # Only the requested top N are selected (argpartition), never the whole population
+    column = RANK_COLUMNS[rank_by]
+    positions = cached_aggregate(selection, 'top_holders', lambda: get_engine().top_positions(selection, column, n), column, n)
+    
+    num_pages = page_count(len(positions), page_size)
+    with col3:
+        page = int(st.number_input(f"Page (of {num_pages})", min_value=1, max_value=num_pages, value=1, step=1, key="top_page"))
+    
+    title = f"Top {n} Alpha Holders" if rank_by == 'Alpha Value (TAO)' else f"Top {n} Holders by {rank_by}"
+    header.markdown(f"<h2>🏆 {title}</h2>", unsafe_allow_html=True)
+    
+    start = (page - 1) * page_size
+    top = table_page(selection.snapshot.holders, positions, page, page_size)
+    roles = top['roles'].to_numpy()
+    coldkeys = pd.Series(pd.arrays.ArrowStringArray(selection.snapshot.coldkeys.text(positions[start:start + page_size])))
+    
+    # Numeric columns stay numeric, formatted in the browser
+    df = pd.DataFrame({
+        "Rank": np.arange(start + 1, start + len(top) + 1),
+        "Coldkey": coldkeys.str[:20].to_numpy() + "...",
+        "Alpha Value (TAO)": to_tao(top['total_alpha_value_rao'].to_numpy()),
+        "Total Value (TAO)": to_tao(top['total_wallet_value_rao'].to_numpy()),
+        "Alpha %": top['alpha_percentage'].to_numpy(),
+        "Unique Tokens": top['unique_alpha_tokens'].to_numpy(),
+        "Transactions": top['number_tx'].to_numpy(),
+        "Staking Proxy": top['has_staking_proxy'].to_numpy(dtype=bool),
+        "Roles": [", ".join(decode_roles(int(bits))) for bits in roles]
+    })
+    show_table(
+        df,
+        width="stretch",
+        hide_index=True,
+        column_config={
+            **number_columns(**{
+                "Alpha Value (TAO)": TAO_FORMAT,
+                "Total Value (TAO)": TAO_FORMAT,
+                "Unique Tokens": COUNT_FORMAT,
+                "Transactions": COUNT_FORMAT,
+            }),
+            "Alpha %": st.column_config.NumberColumn(format="%.2f%%"),
+            "Staking Proxy": st.column_config.CheckboxColumn(),
+        }
+    )
+
+@st.fragment
+@traced
+def create_coldkey_lookup(snapshot: Snapshot):
+    """Search box and drill-down into one coldkey (searches all holders, the filters don't apply)
+
+    Running as a fragment, searching reruns this section alone.
+    """
+    st.markdown("<h2>🔎 Coldkey Lookup</h2>", unsafe_allow_html=True)
+    
+    query = st.text_input("Coldkey (full SS58 address or prefix)", key="coldkey_search")
+    if not query.strip():
+        return
+    
+    matches = search_coldkeys(snapshot, query)
+    if len(matches) == 0:
+        st.warning(f"No coldkey matches '{query.strip()}'")
+        return
+    
+    position = matches[0]
+    if len(matches) > 1:
+        position = st.selectbox(
+            f"{len(matches)} matching coldkeys" + (f" (first {MAX_MATCHES} shown, refine the prefix)" if len(matches) >= MAX_MATCHES else ""),
+            options=matches.tolist(),
+            format_func=snapshot.coldkeys.decode,
+            key="coldkey_match"
         )
-        fig.update_coloraxes(showscale=False)
-        fig.update_xaxes(title_text='')
-        fig = apply_chart_theme(fig)
-        st.plotly_chart(fig, use_container_width=True)
-
-def create_top_holders_table(data: List[Dict], n: int = 20):
-    """Create table of top holders"""
-    st.markdown(f"<h2>🏆 Top {n} Alpha Holders</h2>", unsafe_allow_html=True)
-    
-    # Sort by total alpha value
-    sorted_data = sorted(data, key=lambda x: x['total_alpha_value_tao'], reverse=True)[:n]
-    
-    # Create dataframe
-    table_data = []
-    for i, holder in enumerate(sorted_data, 1):
-        table_data.append({
-            "Rank": i,
-            "Coldkey": holder['coldkey'][:20] + "...",
-            "Alpha Value (TAO)": f"{holder['total_alpha_value_tao']:,.2f}",
-            "Total Value (TAO)": f"{holder['total_wallet_value_tao']:,.2f}",
-            "Alpha %": f"{holder['alpha_percentage']:.2f}%",
-            "Unique Tokens": holder['unique_alpha_tokens'],
-            "Staking Proxy": "✅" if holder.get('has_staking_proxy', False) else "❌",
-            "Roles": ", ".join(holder.get('roles', []))
-        })
     
-    df = pd.DataFrame(table_data)
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    holder = holder_detail(snapshot, position)
+    st.markdown(f"**`{holder['coldkey']}`**")
+    st.markdown(f"Roles: {', '.join(holder['roles'])} | Staking Proxy: {'✅' if holder['has_staking_proxy'] else '❌'}")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric(label="💎 Alpha Value", value=f"{to_tao(holder['total_alpha_value_rao']):,.2f} TAO")
+        st.metric(label="🎯 Unique Tokens", value=f"{holder['unique_alpha_tokens']:,}")
+    with col2:
+        st.metric(label="💰 Total Wallet Value", value=f"{to_tao(holder['total_wallet_value_rao']):,.2f} TAO")
+        st.metric(label="📊 Alpha %", value=f"{holder['alpha_percentage']:.2f}%")
+    with col3:
+        st.metric(label="🔒 Staked", value=f"{to_tao(holder['total_staked_rao']):,.2f} TAO")
+        st.metric(label="💸 Transactions", value=f"{holder['number_tx']:,}")
+    with col4:
+        st.metric(label="🪙 Free", value=f"{to_tao(holder['free_rao']):,.2f} TAO")
+        st.metric(label="⏰ Transaction Sessions", value=f"{holder['tx_time']:,}")
+    
+    st.markdown("### 📋 Alpha Holdings")
+    show_table(
+        holder_holdings(snapshot, position),
+        width="stretch",
+        hide_index=True,
+        column_config={
+            **number_columns(**{"Balance (Alpha)": TAO_FORMAT, "Value (TAO)": TAO_FORMAT}),
+            "% of Portfolio": st.column_config.NumberColumn(format="%.2f%%"),
+        }
+    )
 
-def create_subnet_breakdown(data: List[Dict]):
+@st.fragment(key="subnet_breakdown")
+@traced
+def create_subnet_breakdown(snapshot: Snapshot):
     """Create subnet-level breakdown of alpha stakes"""
+    selection = current_selection(snapshot)
     st.markdown("<h2>🌐 Complete Subnet Breakdown</h2>", unsafe_allow_html=True)
     
-    # Aggregate alpha holdings by subnet
-    subnet_stats = {}
-    
-    for holder in data:
-        for holding in holder.get('alpha_holdings', []):
-            netuid = holding['netuid']
-            subnet_name = holding['subnet_name']
-            balance_alpha = holding['balance_alpha']
-            value_tao = holding['value_tao']
-            
-            if netuid not in subnet_stats:
-                subnet_stats[netuid] = {
-                    'netuid': netuid,
-                    'subnet_name': subnet_name,
-                    'total_alpha_staked': 0,
-                    'total_value_tao': 0,
-                    'staker_count': set()
-                }
-            
-            subnet_stats[netuid]['total_alpha_staked'] += balance_alpha
-            subnet_stats[netuid]['total_value_tao'] += value_tao
-            subnet_stats[netuid]['staker_count'].add(holder['coldkey'])
-    
-    # Convert to DataFrame
-    subnet_data = []
-    for netuid, stats in subnet_stats.items():
-        subnet_data.append({
-            'Netuid': netuid,
-            'Subnet Name': stats['subnet_name'],
-            'Total Alpha Staked': stats['total_alpha_staked'],
-            'Total Value (TAO)': stats['total_value_tao'],
-            'Number of Stakers': len(stats['staker_count'])
-        })
-    
-    subnet_df = pd.DataFrame(subnet_data).sort_values('Total Value (TAO)', ascending=False)
-    
-    # Create horizontal bar chart with dynamic height
-    num_subnets = len(subnet_df)
-    chart_height = max(600, num_subnets * 20)  # Minimum 600px, 20px per subnet
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        y=subnet_df['Subnet Name'],
-        x=subnet_df['Total Value (TAO)'],
-        orientation='h',
-        text=subnet_df['Total Value (TAO)'].apply(lambda x: f"{x:,.0f} TAO"),
-        textposition='auto',
-        marker=dict(
-            color=subnet_df['Total Value (TAO)'],
-            colorscale=[[0, '#E8EAFF'], [0.5, '#868BFF'], [1, '#282AE6']],
-            showscale=False
-        ),
-        hovertemplate='<b>%{y}</b><br>Total Value: %{x:,.2f} TAO<br>Stakers: %{customdata}<extra></extra>',
-        customdata=subnet_df['Number of Stakers']
-    ))
-    
-    fig.update_layout(
-        title=f'Alpha Value Distribution Across All Subnets ({len(subnet_df)} subnets)',
-        xaxis_title='Total Alpha Value (TAO)',
-        yaxis_title='Subnet',
-        height=chart_height,
-        showlegend=False,
-        yaxis=dict(autorange="reversed"),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)'
+    # Aggregate alpha holdings by subnet over the selected holders only
+    subnet_df = cached_aggregate(
+        selection,
+        'subnets',
+        lambda: get_engine().subnet_totals(selection).sort_values('Total Value (TAO)', ascending=False)
     )
     
-    fig = apply_chart_theme(fig)
-    st.plotly_chart(fig, use_container_width=True)
+    # Horizontal bar chart with dynamic height
+    fig = cached_figure(subnet_chart, subnet_df)
+    show_chart(fig)
     
     # Display detailed table
     st.markdown("### 📋 Detailed Subnet Data")
+    create_subnet_table(selection, subnet_df)
+
+@st.fragment
+@traced
+def create_subnet_table(selection: Selection, subnet_df: pd.DataFrame):
+    """Subnet totals sorted server-side and sent one page at a time
+
+    Running as a fragment, sorting and paging rerun this table alone.
+    """
+    show_paged_table(
+        selection,
+        'subnet',
+        subnet_df,
+        sort_index=3,
+        column_config=number_columns(**{
+            "Total Alpha Staked": TAO_FORMAT,
+            "Total Value (TAO)": TAO_FORMAT,
+            "Number of Stakers": COUNT_FORMAT,
+        })
+    )
+
+def show_paged_table(selection: Selection, name: str, df: pd.DataFrame, sort_index: int = 0, column_config=None):
+    """Sort and page controls over df, sending only the current page (widget keys start with name)"""
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        sort_by = st.selectbox("Sort by", options=list(df.columns), index=sort_index, key=f"{name}_sort_by")
+    with col2:
+        descending = st.toggle("Descending", value=True, key=f"{name}_sort_desc")
+    num_pages = page_count(len(df))
+    with col3:
+        page = int(st.number_input(f"Page (of {num_pages})", min_value=1, max_value=num_pages, value=1, step=1, key=f"{name}_page"))
+    
+    order = cached_aggregate(
+        selection, f'{name}_order', lambda: sort_order(df[sort_by].to_numpy(), not descending), sort_by, descending
+    )
+    show_table(table_page(df, order, page), width="stretch", hide_index=True, column_config=column_config)
+
+@st.fragment(key="concentration_analysis")
+@traced
+def create_concentration_analysis(snapshot: Snapshot):
+    """Create concentration metrics for the filtered holders and per subnet"""
+    selection = current_selection(snapshot)
+    st.markdown("<h2>📐 Concentration of Holdings</h2>", unsafe_allow_html=True)
+    
+    engine = get_engine()
+    metrics = cached_aggregate(selection, 'concentration', lambda: engine.concentration(selection))
+    lorenz_df = cached_aggregate(selection, 'lorenz', lambda: engine.lorenz(selection))
+    
+    cols = st.columns(1 + len(TOP_SHARES))
+    with cols[0]:
+        st.metric(label="⚖️ Gini (Total Wallet Value)", value=f"{metrics['gini']:.3f}")
+    for col, percent in zip(cols[1:], TOP_SHARES):
+        with col:
+            st.metric(label=f"🏔️ Top {percent}% Hold", value=f"{metrics[f'top_{percent}_share']:.1f}%")
     
-    display_df = subnet_df.copy()
-    display_df['Total Alpha Staked'] = display_df['Total Alpha Staked'].apply(lambda x: f"{x:,.2f}")
-    display_df['Total Value (TAO)'] = display_df['Total Value (TAO)'].apply(lambda x: f"{x:,.2f}")
-    display_df['Number of Stakers'] = display_df['Number of Stakers'].apply(lambda x: f"{x:,}")
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = cached_figure(lorenz_chart, lorenz_df)
+        show_chart(fig)
+    with col2:
+        percentiles_df = pd.DataFrame({
+            'Percentile': [f"P{percentile}" for percentile in PERCENTILES],
+            'Total Wallet Value (TAO)': [metrics[f'p{percentile}'] for percentile in PERCENTILES],
+        })
+        show_table(
+            percentiles_df,
+            width="stretch",
+            hide_index=True,
+            column_config=number_columns(**{'Total Wallet Value (TAO)': TAO_FORMAT})
+        )
     
-    st.dataframe(display_df, use_container_width=True, hide_index=True, height=600)
+    st.markdown("### 📋 Concentration per Subnet")
+    st.caption("Gini and top shares of the selected stakers' holding values in each subnet")
+    per_subnet = cached_aggregate(selection, 'concentration_subnets', lambda: engine.subnet_concentration(selection))
+    create_concentration_table(selection, per_subnet)
 
-def main():
-    """Main application"""
-    st.markdown("<h1 class='main-header'>🔷 Bittensor Alpha Holders Analysis</h1>", unsafe_allow_html=True)
+@st.fragment
+@traced
+def create_concentration_table(selection: Selection, per_subnet: pd.DataFrame):
+    """Per-subnet concentration, sorted server-side and sent one page at a time
+
+    Running as a fragment, sorting and paging rerun this table alone.
+    """
+    show_paged_table(
+        selection,
+        'concentration',
+        per_subnet,
+        sort_index=4,
+        column_config={
+            **number_columns(**{
+                'Stakers': COUNT_FORMAT,
+                'Total Value (TAO)': TAO_FORMAT,
+                'Median Holding (TAO)': dict(format="localized", step=0.0001),
+            }),
+            'Gini': st.column_config.NumberColumn(format="%.3f"),
+            **{f'Top {percent}% Share (%)': st.column_config.NumberColumn(format="%.1f%%") for percent in TOP_SHARES},
+        }
+    )
+
+@st.fragment
+@traced
+def create_run_comparison(snapshot: Snapshot, runs: list, top_n: int = 20):
+    """Per-coldkey changes between the displayed snapshot and an earlier registered run
+
+    Running as a fragment, picking another baseline reruns this section alone.
+    """
+    baselines = [run for run in runs if run.version != snapshot.version]
+    if not baselines:
+        st.caption("Register another analysis run (python -m dashboard.registry register) to compare against it.")
+        return
+    
+    baseline: RunInfo = st.selectbox(
+        "Compare against", options=baselines, format_func=lambda run: run.label, key="compare_baseline"
+    )
+    old = load_run(baseline.run_id)
     
-    # Load data
-    try:
-        data = load_data()
-        st.success(f"✅ Loaded {len(data):,} alpha holders")
-    except Exception as e:
-        st.error(f"❌ Error loading data: {str(e)}")
-        st.stop()
+    # Unfiltered: both sides of the comparison have to describe the same population
+    key = cache_key('deltas', old.version, snapshot.version)
+    with phase('aggregate') as span:
+        deltas = traced_lookup(get_aggregate_cache(), key, lambda: coldkey_deltas(old, snapshot), span)
+        span.rows = len(deltas)
+    summary = delta_summary(deltas)
     
-    # ============ GLOBAL FILTERS (Sidebar) ============
-    st.sidebar.header("🔍 Global Filters")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric(label="🆕 New Coldkeys", value=f"{summary['New']:,}")
+    with col2:
+        st.metric(label="🚪 Exited Coldkeys", value=f"{summary['Exited']:,}")
+    with col3:
+        st.metric(label="🔄 Changed Coldkeys", value=f"{summary['Changed']:,}")
+    with col4:
+        st.metric(label="💎 Net Alpha Change", value=f"{summary['net_alpha']:+,.1f} TAO")
+    
+    measure = st.selectbox("Change in", options=list(DELTA_COLUMNS), index=0, key="compare_measure")
+    delta = deltas[f'{measure} Δ'].to_numpy()
+    columns = ['Coldkey', f'{measure} Before', f'{measure} After', f'{measure} Δ', 'Status']
+    increased = np.flatnonzero(delta > 0)
+    decreased = np.flatnonzero(delta < 0)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"**📈 Largest Increases ({measure})**")
+        show_table(deltas[columns].take(increased[top_k(delta[increased], top_n)]), width="stretch", hide_index=True)
+    with col2:
+        st.markdown(f"**📉 Largest Decreases ({measure})**")
+        show_table(deltas[columns].take(decreased[top_k(-delta[decreased], top_n)]), width="stretch", hide_index=True)
+
+@st.fragment(key="annexe")
+@traced
+def create_annexe(snapshot: Snapshot):
+    """Detailed distributions, only computed and sent once the user asks for them
+
+    Running as a fragment, flipping the toggle reruns this section alone.
+    """
+    if not st.toggle("🔍 View Detailed Transaction & Token Distributions", value=False, key="show_annexe"):
+        st.caption("Turn on to build the per-value distributions for the current filters.")
+        return
+    
+    selection = current_selection(snapshot)
+    create_breakdown_by_tx_detailed(selection)
+    st.divider()
+    create_breakdown_by_tx_time_detailed(selection)
+    st.divider()
+    create_breakdown_by_tokens_detailed(selection)
+
+def rerun_filtered_sections():
+    """Callback of every filter widget: rerun only the sections that read the filters"""
+    st.rerun(downstream(FILTERS))
+
+def filter_key(name: str, snapshot: Snapshot) -> str:
+    """Key of a filter widget whose bounds come from the snapshot, so another run starts at its own full range"""
+    return f"filter_{name}_{snapshot.version}"
+
+def get_filter_extents(snapshot: Snapshot) -> dict:
+    """Bounds of the filter widgets, from the column statistics kept with the snapshot"""
+    bounds = snapshot.column_index.bounds
+    min_wallet_value, max_wallet_value = bounds('total_wallet_value_rao')
+    return {
+        'wallet_value': (float(to_tao(min_wallet_value)), float(to_tao(max_wallet_value))),
+        'max_tokens': int(bounds('unique_alpha_tokens')[1]),
+        'max_tx': max(int(bounds('number_tx')[1]), 1),
+        'max_sessions': max(int(bounds('tx_time')[1]), 1),
+    }
+
+@st.fragment(key="filters")
+@traced
+def create_filters(snapshot: Snapshot):
+    """Sidebar filters, rendered inside st.sidebar
+
+    Running as a fragment whose widgets rerun it and the sections downstream
+    of the filters (dashboard/sections.py) rather than the whole page.
+    """
+    extents = get_filter_extents(snapshot)
+    st.header("🔍 Global Filters")
     
     # Filter by role
-    role_filter = st.sidebar.selectbox(
+    st.selectbox(
         "Filter by Role",
         options=["All", "Subnet Owner", "Investor", "Miner"],
-        index=0
+        index=0,
+        key="filter_role",
+        on_change=rerun_filtered_sections
     )
     
     # Filter by staking proxy
-    proxy_filter = st.sidebar.selectbox(
+    st.selectbox(
         "Filter by Staking Proxy",
         options=["All", "True", "False"],
-        index=0
+        index=0,
+        key="filter_proxy",
+        on_change=rerun_filtered_sections
     )
     
     # Filter by wallet value (TAO)
-    st.sidebar.divider()
-    st.sidebar.markdown("**💰 Filter by Total Wallet Value (TAO)**")
-    
-    # Get min and max wallet values
-    wallet_values = [h.get('total_wallet_value_tao', 0) for h in data]
-    min_wallet_value = min(wallet_values)
-    max_wallet_value = max(wallet_values)
+    st.divider()
+    st.markdown("**💰 Filter by Total Wallet Value (TAO)**")
     
     # Number inputs for wallet value range
-    col1, col2 = st.sidebar.columns(2)
+    min_wallet_value, max_wallet_value = extents['wallet_value']
+    col1, col2 = st.columns(2)
     with col1:
-        min_value_input = st.number_input(
+        st.number_input(
             "Min (TAO)",
-            min_value=float(min_wallet_value),
-            max_value=float(max_wallet_value),
-            value=float(min_wallet_value),
+            min_value=min_wallet_value,
+            max_value=max_wallet_value,
+            value=min_wallet_value,
             step=1.0,
-            format="%.0f"
+            format="%.0f",
+            key=filter_key('wallet_min', snapshot),
+            on_change=rerun_filtered_sections
         )
     with col2:
-        max_value_input = st.number_input(
+        st.number_input(
             "Max (TAO)",
-            min_value=float(min_wallet_value),
-            max_value=float(max_wallet_value),
-            value=float(max_wallet_value),
+            min_value=min_wallet_value,
+            max_value=max_wallet_value,
+            value=max_wallet_value,
             step=1.0,
-            format="%.0f"
+            format="%.0f",
+            key=filter_key('wallet_max', snapshot),
+            on_change=rerun_filtered_sections
         )
     
-    value_range = (min_value_input, max_value_input)
-    
     # Filter by number of tokens held
-    st.sidebar.divider()
-    st.sidebar.markdown("**🎯 Filter by Number of Tokens Held**")
-    
-    # Get min and max token counts
-    token_counts = [h.get('unique_alpha_tokens', 0) for h in data]
-    min_token_count = max(1, min(token_counts))  # Minimum is 1, not 0
-    max_token_count = max(token_counts)
+    st.divider()
+    st.markdown("**🎯 Filter by Number of Tokens Held**")
     
-    # Number inputs for token count range
-    col1, col2 = st.sidebar.columns(2)
+    # Number inputs for token count range (the minimum is 1, not 0)
+    max_token_count = extents['max_tokens']
+    col1, col2 = st.columns(2)
     with col1:
-        min_tokens_input = st.number_input(
+        st.number_input(
             "Min Tokens",
             min_value=1,
-            max_value=int(max_token_count),
+            max_value=max_token_count,
             value=1,
-            step=1
+            step=1,
+            key=filter_key('tokens_min', snapshot),
+            on_change=rerun_filtered_sections
         )
     with col2:
-        max_tokens_input = st.number_input(
+        st.number_input(
             "Max Tokens",
             min_value=1,
-            max_value=int(max_token_count),
-            value=int(max_token_count),
-            step=1
+            max_value=max_token_count,
+            value=max_token_count,
+            step=1,
+            key=filter_key('tokens_max', snapshot),
+            on_change=rerun_filtered_sections
         )
     
-    token_range = (min_tokens_input, max_tokens_input)
-    
-    st.sidebar.divider()
-    st.sidebar.info("Filters apply to all sections EXCEPT 'Global Analysis by Role'")
-    
-    # ============ SECTION 1: GLOBAL ANALYSIS (NO FILTERS) ============
-    st.markdown("---")
-    st.markdown("## 📍 Section 1: Global Overview (Unfiltered)")
-    st.info("⚠️ This section shows ALL data without any filters applied")
-    
-    create_global_role_analysis(data)
-    
-    # ============ APPLY FILTERS FOR ALL FOLLOWING SECTIONS ============
-    st.markdown("---")
-    st.markdown("## 📍 Section 2+: Filtered Analysis")
-    st.warning(f"🔍 Filters Active: Role = {role_filter} | Staking Proxy = {proxy_filter} | Wallet Value = {value_range[0]:.0f}-{value_range[1]:.0f} TAO | Tokens = {token_range[0]}-{token_range[1]}")
-    
-    # Apply role filter
-    filtered_data = filter_data_by_role(data, role_filter)
+    # Filter by subnet (resolved through the snapshot's netuid -> holders index)
+    st.divider()
+    st.markdown("**🌐 Filter by Subnet**")
+    subnet_names = snapshot.subnet_names
+    selected_netuids = st.multiselect(
+        "Subnets",
+        options=subnet_names.index.tolist(),
+        format_func=lambda netuid: f"{netuid} · {subnet_names.get(netuid, '')}",
+        placeholder="All subnets",
+        key=filter_key('netuids', snapshot),
+        on_change=rerun_filtered_sections
+    )
+    st.radio(
+        "Holders staked in",
+        options=["Any", "All"],
+        format_func=lambda match: "any selected subnet" if match == "Any" else "all selected subnets",
+        horizontal=True,
+        disabled=len(selected_netuids) < 2,
+        key="filter_subnet_match",
+        on_change=rerun_filtered_sections
+    )
     
-    # Apply staking proxy filter
-    filtered_data = filter_data_by_staking_proxy(filtered_data, proxy_filter)
+    # Activity and composition filters (inactive while left at their full range)
+    st.divider()
+    with st.expander("⚙️ More Filters", expanded=False):
+        max_tx, max_sessions = extents['max_tx'], extents['max_sessions']
+        st.slider("Transaction Count", 0, max_tx, (0, max_tx),
+                  key=filter_key('tx', snapshot), on_change=rerun_filtered_sections)
+        st.slider("Transaction Sessions", 0, max_sessions, (0, max_sessions),
+                  key=filter_key('sessions', snapshot), on_change=rerun_filtered_sections)
+        st.slider("Alpha Percentage", 0.0, 100.0, (0.0, 100.0), step=1.0,
+                  key="filter_alpha_percentage", on_change=rerun_filtered_sections)
     
-    # Apply wallet value filter
-    filtered_data = filter_data_by_wallet_value(filtered_data, value_range[0], value_range[1])
+    st.divider()
+    st.info("Filters apply to all sections EXCEPT 'Global Analysis by Role'")
+
+def read_filters(snapshot: Snapshot) -> FilterState:
+    """Normalized state of the filter widgets, as last set in this session"""
+    extents = get_filter_extents(snapshot)
+    widgets = st.session_state
+    tx_range = tuple(widgets[filter_key('tx', snapshot)])
+    sessions_range = tuple(widgets[filter_key('sessions', snapshot)])
+    alpha_pct_range = tuple(widgets['filter_alpha_percentage'])
+    selected_netuids = widgets[filter_key('netuids', snapshot)]
+    return FilterState(
+        role=widgets['filter_role'],
+        staking_proxy=widgets['filter_proxy'],
+        wallet_value=(widgets[filter_key('wallet_min', snapshot)], widgets[filter_key('wallet_max', snapshot)]),
+        tokens=(widgets[filter_key('tokens_min', snapshot)], widgets[filter_key('tokens_max', snapshot)]),
+        number_tx=None if tx_range == (0, extents['max_tx']) else tx_range,
+        tx_time=None if sessions_range == (0, extents['max_sessions']) else sessions_range,
+        alpha_percentage=None if alpha_pct_range == (0.0, 100.0) else alpha_pct_range,
+        netuids=tuple(sorted(selected_netuids)),
+        subnet_match=widgets['filter_subnet_match'] if selected_netuids else "Any"
+    )
+
+def current_selection(snapshot: Snapshot) -> Selection:
+    """Holders matching the sidebar filters; every filtered section starts from this"""
+    return get_selection(snapshot.version, read_filters(snapshot), snapshot)
+
+@st.fragment(key="filter_summary")
+@traced
+def create_filter_summary(snapshot: Snapshot):
+    """Active filters and headline numbers of the filtered holders"""
+    selection = current_selection(snapshot)
+    st.warning(f"🔍 Filters Active: {selection.filters.describe()}")
     
-    # Apply token count filter
-    filtered_data = filter_data_by_token_count(filtered_data, token_range[0], token_range[1])
+    # All filters resolve to one mask, computed only if some aggregate isn't cached yet
+    metrics = cached_aggregate(selection, 'summary', lambda: get_engine().summary(selection))
     
-    st.info(f"Showing {len(filtered_data):,} / {len(data):,} holders after filtering")
+    st.info(f"Showing {metrics['holders']:,} / {len(snapshot.holders):,} holders after filtering")
     
     # Display filtered data metrics
     col1, col2, col3 = st.columns(3)
     
     # Calculate metrics
-    total_alpha_value = sum(h.get('total_alpha_value_tao', 0) for h in filtered_data)
-    num_proxy_set = sum(1 for h in filtered_data if h.get('has_staking_proxy', False))
+    total_alpha_value = metrics['total_alpha_value']
+    num_proxy_set = metrics['proxy_count']
     
     with col1:
         st.metric(
@@ -1068,7 +927,7 @@ def main():
     with col2:
         st.metric(
             label="👥 Number of Addresses",
-            value=f"{len(filtered_data):,}"
+            value=f"{metrics['holders']:,}"
         )
     
     with col3:
@@ -1076,51 +935,171 @@ def main():
             label="🔒 Proxy Set",
             value=f"{num_proxy_set:,}"
         )
+
+def main():
+    """Main application"""
+    st.markdown("<h1 class='main-header'>🔷 Bittensor Alpha Holders Analysis</h1>", unsafe_allow_html=True)
+    
+    # Load data
+    runs = list_runs()
+    try:
+        with section('load_data'), phase('load') as span:
+            run_id = None
+            if runs:
+                # Earlier analysis runs kept by dashboard.registry; None is the latest JSON
+                run_id = st.sidebar.selectbox(
+                    "🗂️ Snapshot",
+                    options=[None] + [run.run_id for run in runs],
+                    format_func=lambda rid: "Latest analysis" if rid is None else next(r.label for r in runs if r.run_id == rid),
+                    key="snapshot_run"
+                )
+            if run_id is not None:
+                snapshot = load_run(run_id)
+            else:
+                if not get_snapshot_watcher().loaded and not is_fresh(SNAPSHOT_JSON):
+                    convert_with_progress()
+                snapshot = load_data()
+            span.rows = len(snapshot.holders)
+        data = snapshot.holders
+        st.success(f"✅ Loaded {len(data):,} alpha holders")
+        watcher = get_snapshot_watcher()
+        if watcher.building:
+            st.info("🔄 A new analysis run is loading in the background; it will show on a later rerun.")
+        elif watcher.error:
+            st.warning(f"⚠️ The latest analysis output could not be loaded, still showing the previous run ({watcher.error})")
+    except Exception as e:
+        st.error(f"❌ Error loading data: {str(e)}")
+        st.stop()
+    
+    # ============ GLOBAL FILTERS (Sidebar) ============
+    # A fragment: a filter change reruns it and the filtered sections, nothing else
+    with st.sidebar:
+        create_filters(snapshot)
+    
+    # ============ SECTION 1: GLOBAL ANALYSIS (NO FILTERS) ============
+    st.markdown("---")
+    st.markdown("## 📍 Section 1: Global Overview (Unfiltered)")
+    st.info("⚠️ This section shows ALL data without any filters applied")
+    
+    create_global_role_analysis(Selection(snapshot, FilterState()))
+    
+    # ============ APPLY FILTERS FOR ALL FOLLOWING SECTIONS ============
+    # Every filtered section reads the filters itself (current_selection), so it can rerun on its own
+    st.markdown("---")
+    st.markdown("## 📍 Section 2+: Filtered Analysis")
+    create_filter_summary(snapshot)
     
     st.divider()
     
     # ============ SECTION 2: BREAKDOWN BY TRANSACTION COUNT ============
-    create_breakdown_by_tx(filtered_data)
+    create_breakdown_by_tx(snapshot)
     
     # ============ SECTION 2b: BREAKDOWN BY TRANSACTION SESSIONS (tx_time) ============
     st.divider()
-    create_breakdown_by_tx_time(filtered_data)
+    create_breakdown_by_tx_time(snapshot)
     
     # ============ SECTION 3: BREAKDOWN BY NUMBER OF TOKENS ============
     st.divider()
-    create_breakdown_by_tokens(filtered_data)
+    create_breakdown_by_tokens(snapshot)
     
     # ============ SECTION 4: BREAKDOWN BY ALPHA PERCENTAGE ============
     st.divider()
-    create_breakdown_by_alpha_percentage(filtered_data)
+    create_breakdown_by_alpha_percentage(snapshot)
     
     # ============ ADDITIONAL: TOP HOLDERS TABLE ============
     st.divider()
-    create_top_holders_table(filtered_data, n=20)
+    create_top_holders_table(snapshot, n=20)
+    
+    # ============ COLDKEY LOOKUP ============
+    st.divider()
+    create_coldkey_lookup(snapshot)
     
     # ============ SECTION 5: COMPLETE SUBNET BREAKDOWN ============
     st.divider()
-    create_subnet_breakdown(filtered_data)
+    create_subnet_breakdown(snapshot)
+    
+    # ============ SECTION 5b: CONCENTRATION ============
+    st.divider()
+    create_concentration_analysis(snapshot)
+    
+    # ============ SECTION 6: CHANGES BETWEEN ANALYSIS RUNS ============
+    if runs:
+        st.markdown("---")
+        st.markdown("## 📈 Changes Between Analysis Runs")
+        create_run_comparison(snapshot, runs)
     
     # ============ ANNEXE: DETAILED DISTRIBUTIONS ============
     st.markdown("---")
     st.markdown("## 📑 Annexe: Detailed Distributions (Log Scale)")
     st.info("ℹ️ These charts show the complete distribution with logarithmic scale for better visibility of all values")
     
-    with st.expander("🔍 View Detailed Transaction & Token Distributions", expanded=False):
-        create_breakdown_by_tx_detailed(filtered_data)
-        st.divider()
-        create_breakdown_by_tx_time_detailed(filtered_data)
-        st.divider()
-        create_breakdown_by_tokens_detailed(filtered_data)
+    create_annexe(snapshot)
     
     # Footer
+    cache_stats = get_aggregate_cache().stats()
     st.markdown("---")
     st.markdown(
         "<p style='text-align: center; color: gray;'>Bittensor Alpha Holders Analysis Dashboard | "
-        f"Data contains {len(data):,} unique coldkeys</p>",
+        f"Data contains {len(data):,} unique coldkeys | "
+        f"Aggregate cache: {cache_stats['hits']:,} hits / {cache_stats['misses']:,} misses</p>",
         unsafe_allow_html=True
     )
 
+# Finished traces (full and fragment reruns) the performance panel keeps per session
+RECENT_TRACES = 50
+
+def remember_trace(trace: Trace):
+    """Keep a finished trace in the session that ran it, for the performance panel"""
+    recent = st.session_state.setdefault('perf_traces', [])
+    recent.append(trace)
+    del recent[:-RECENT_TRACES]
+
+@st.cache_resource
+def subscribe_traces():
+    """Hand every finished trace to remember_trace, subscribed once per process"""
+    subscribe(remember_trace)
+
+def show_performance_panel(trace: Trace):
+    """Optional sidebar breakdown of where each section last spent its time"""
+    with st.sidebar:
+        st.divider()
+        create_performance_panel(trace)
+
+@st.fragment(key="performance_panel")
+def create_performance_panel(trace: Trace):
+    """Running as a fragment, turning the panel on or off doesn't rerun (and re-send) the whole page
+
+    It reruns with the filtered sections on a filter change (see dashboard/sections.py), so their
+    fragment reruns are listed as soon as they finish.
+    """
+    if not st.toggle("⏱️ Performance panel", value=False, key="perf_panel"):
+        return
+    
+    elapsed = trace.seconds or time.time() - trace.started  # A full rerun's trace only ends after the panel
+    # This full rerun's trace is still open, so it isn't among the finished ones yet
+    traces = [recent for recent in st.session_state.get('perf_traces', []) if recent is not trace]
+    table = latest_sections([*traces, trace])
+    phase_columns = [f'{phase.title()} (ms)' for phase in PHASES]
+    with st.expander("⏱️ Performance", expanded=True):
+        st.metric(label="Last full rerun", value=f"{elapsed * 1000:,.0f} ms")
+        st.dataframe(
+            table,
+            hide_index=True,
+            column_config={
+                **{name: st.column_config.NumberColumn(format="%.1f") for name in ['Wall (ms)', *phase_columns]},
+                'Age (s)': st.column_config.NumberColumn(format="%.0f"),
+            }
+        )
+        aggregate_stats, figure_stats = get_aggregate_cache().stats(), get_figure_cache().stats()
+        st.caption(
+            f"Aggregate cache {aggregate_stats['hits']:,} hits / {aggregate_stats['misses']:,} misses · "
+            f"figure cache {figure_stats['hits']:,} hits / {figure_stats['misses']:,} misses. "
+            "Each section shows its latest timing, from a full rerun or from a fragment rerunning on its own; "
+            "every rerun is also logged to the trace log (dashboard/tracing.py)."
+        )
+
 if __name__ == "__main__":
-    main()
+    subscribe_traces()
+    with trace_run() as trace:
+        main()
+        show_performance_panel(trace)
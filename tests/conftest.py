@@ -0,0 +1,63 @@
+"""Shared fixtures: a small synthetic analysis JSON and its snapshot"""
+import os
+import shutil
+
+import pytest
+
+from benchmarks.synthetic import write_snapshot_json
+from dashboard.rao import to_tao
+from dashboard.snapshot import (
+    LEGACY_TAO_COLUMNS,
+    TABLE_FILES,
+    VERSION_KEY,
+    _write_table,
+    load_snapshot,
+    parse_json,
+    read_tables,
+    write_tables,
+)
+
+NUM_COLDKEYS = 400
+
+
+@pytest.fixture(scope='session')
+def synthetic_json(tmp_path_factory) -> str:
+    """Pristine synthetic alpha_holders_analysis.json, shared by the whole session (never modify it)"""
+    path = str(tmp_path_factory.mktemp('synthetic') / 'alpha_holders_analysis.json')
+    write_snapshot_json(NUM_COLDKEYS, path)
+    return path
+
+
+@pytest.fixture
+def analysis_json(synthetic_json, tmp_path) -> str:
+    """Private copy of the synthetic JSON in its own output directory"""
+    path = str(tmp_path / 'alpha_holders_analysis.json')
+    shutil.copy(synthetic_json, path)
+    return path
+
+
+@pytest.fixture(scope='session')
+def parsed_snapshot(synthetic_json):
+    """Snapshot parsed straight from the JSON, held in memory"""
+    return parse_json(synthetic_json)
+
+
+@pytest.fixture(scope='session')
+def mapped_snapshot(synthetic_json, tmp_path_factory):
+    """Snapshot converted to binary tables and memory-mapped back"""
+    path = str(tmp_path_factory.mktemp('mapped') / 'alpha_holders_analysis.json')
+    shutil.copy(synthetic_json, path)
+    return load_snapshot(path)
+
+
+@pytest.fixture(scope='session')
+def legacy_snapshot(parsed_snapshot, tmp_path_factory):
+    """A registered run written while balances were stored as TAO floats, read back"""
+    directory = str(tmp_path_factory.mktemp('legacy'))
+    write_tables(parsed_snapshot, directory)
+    legacy_columns = {rao: tao for tao, rao in LEGACY_TAO_COLUMNS.items()}
+    for table, frame in [('holders', parsed_snapshot.holders), ('holdings', parsed_snapshot.holdings)]:
+        rao = [name for name in frame.columns if name in legacy_columns]
+        legacy = frame.drop(columns=rao).assign(**{legacy_columns[name]: to_tao(frame[name].to_numpy()) for name in rao})
+        _write_table(legacy, os.path.join(directory, TABLE_FILES[table]), {VERSION_KEY: b'legacy'})
+    return read_tables(directory)
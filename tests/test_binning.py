@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from dashboard.binning import (
+    ALPHA_PERCENTAGE_BUCKETS,
+    TOKEN_BUCKETS,
+    TX_BUCKETS,
+    TX_TIME_BUCKETS,
+    Buckets,
+    assign_buckets,
+    bucket_table,
+    exact_value_table,
+)
+from dashboard.rao import to_tao
+
+
+@pytest.mark.parametrize('buckets,value,label', [
+    (TX_TIME_BUCKETS, 0, '0'),
+    (TX_TIME_BUCKETS, 5, '1-5'),
+    (TX_TIME_BUCKETS, 6, '6-12'),
+    (TX_TIME_BUCKETS, 12, '6-12'),
+    (TX_TIME_BUCKETS, 13, '13-25'),
+    (TX_TIME_BUCKETS, 100, '51-100'),
+    (TX_TIME_BUCKETS, 101, '100+'),
+    (TX_BUCKETS, 500, '201-500'),
+    (TX_BUCKETS, 501, '500+'),
+    (TOKEN_BUCKETS, 3, '2-3'),
+    (TOKEN_BUCKETS, 50, '31-50'),
+    (ALPHA_PERCENTAGE_BUCKETS, 24.99, '0-25%'),
+    (ALPHA_PERCENTAGE_BUCKETS, 25.0, '25-50%'),
+    (ALPHA_PERCENTAGE_BUCKETS, 100.0, '99-100%'),
+])
+def test_edges_are_half_open(buckets, value, label):
+    index = assign_buckets(np.array([value]), buckets)[0]
+    assert buckets.labels[index] == label
+
+
+def test_values_outside_every_bucket():
+    assert assign_buckets(np.array([-1, 0]), TX_BUCKETS).tolist() == [-1, 0]
+    assert assign_buckets(np.array([0, 6]), Buckets(labels=('1-5',), edges=(1, 6))).tolist() == [-1, -1]
+
+
+@pytest.mark.parametrize('labels,edges', [(('a', 'b'), (0, 1)), (('a', 'b'), (0, 2, 1)), (('a',), (1, 1))])
+def test_invalid_buckets(labels, edges):
+    with pytest.raises(ValueError):
+        Buckets(labels=labels, edges=edges)
+
+
+def test_bucket_table_matches_a_per_row_count():
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 700, 1000)
+    alpha = rng.integers(0, 10**15, 1000)
+    table = bucket_table(values, alpha, TX_BUCKETS)
+    index = assign_buckets(values, TX_BUCKETS)
+    for i, row in table.iterrows():
+        assert row['Coldkeys'] == (index == i).sum()
+        assert row['Total Alpha (TAO)'] == to_tao(int(alpha[index == i].sum()))
+    assert table['Coldkeys'].sum() == len(values)
+
+
+@pytest.mark.parametrize('values', [np.array([3, 0, 3, 7]), np.array([-2, 5, -2, 5])])
+def test_exact_value_table(values):
+    table = exact_value_table(values, np.full(len(values), 10**9), 'Value')
+    present, counts = np.unique(values, return_counts=True)
+    assert table['Value'].tolist() == present.tolist()
+    assert table['Coldkeys'].tolist() == counts.tolist()
+    assert table['Total Alpha (TAO)'].tolist() == counts.astype(float).tolist()
@@ -0,0 +1,43 @@
+from dashboard.cache import AggregateCache, cache_key
+from dashboard.filters import FilterState
+
+
+def test_cache_key_normalizes_filter_states():
+    assert cache_key('roles', 'v1', FilterState(role="Miner")) == cache_key('roles', 'v1', FilterState(role="Miner"))
+    assert cache_key('roles', 'v1', FilterState(role="Miner")) != cache_key('roles', 'v1', FilterState())
+    assert cache_key('roles', 'v1', FilterState()) != cache_key('roles', 'v2', FilterState())
+    assert cache_key('roles', 'v1') != cache_key('tx', 'v1')
+    assert cache_key({'b': 1, 'a': 2}) == cache_key({'a': 2, 'b': 1})
+
+
+def test_hits_and_misses():
+    cache = AggregateCache(maxsize=4)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute('a', compute) == 1
+    assert cache.get_or_compute('a', compute) == 1
+    assert cache.get_or_compute('b', compute) == 2
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'size': 2, 'maxsize': 4}
+
+
+def test_least_recently_used_is_evicted():
+    cache = AggregateCache(maxsize=2)
+    cache.get_or_compute('a', lambda: 'a')
+    cache.get_or_compute('b', lambda: 'b')
+    cache.get_or_compute('a', lambda: 'stale')  # Refreshes 'a'
+    cache.get_or_compute('c', lambda: 'c')      # Evicts 'b'
+    assert cache.get_or_compute('a', lambda: 'recomputed') == 'a'
+    assert cache.get_or_compute('b', lambda: 'recomputed') == 'recomputed'
+    assert cache.stats()['size'] == 2
+
+
+def test_clear_keeps_counters():
+    cache = AggregateCache()
+    cache.get_or_compute('a', lambda: 1)
+    cache.clear()
+    assert cache.get_or_compute('a', lambda: 2) == 2
+    assert cache.stats() == {'hits': 0, 'misses': 2, 'size': 1, 'maxsize': 256}
@@ -0,0 +1,28 @@
+import copy
+import json
+
+from dashboard.compare import STATUSES, coldkey_deltas, delta_summary
+from dashboard.holders import build_snapshot
+from dashboard.rao import to_tao
+
+
+def test_deltas_between_runs(synthetic_json):
+    with open(synthetic_json) as f:
+        records = json.load(f)
+    old = build_snapshot(records)
+
+    changed = copy.deepcopy(records[10:])  # The first 10 coldkeys exit
+    for record in changed[:25]:
+        # Amounts whose TAO floats don't add up exactly
+        record['total_alpha_value_tao'] += 0.1 + 1e-9
+    changed.append({**changed[-1], 'coldkey': '5' + 'N' * 47})
+    new = build_snapshot(changed)
+
+    deltas = coldkey_deltas(old, new)
+    summary = delta_summary(deltas)
+    assert {status: summary[status] for status in STATUSES} == {
+        'New': 1, 'Exited': 10, 'Changed': 25, 'Unchanged': len(records) - 10 - 25,
+    }
+    exact = new.holders['total_alpha_value_rao'].sum() - old.holders['total_alpha_value_rao'].sum()
+    assert deltas['total_alpha_value_rao_delta'].sum() == exact
+    assert summary['net_alpha'] == float(to_tao(exact))
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from dashboard.concentration import gini, lorenz_curve, lorenz_ranks, lorenz_table
+
+
+def test_gini_of_equal_and_single_holdings():
+    assert gini(np.full(5, 7, dtype=np.int64)) == pytest.approx(0.0, abs=1e-12)
+    assert gini(np.array([0, 0, 0, 10], dtype=np.int64)) == pytest.approx(0.75)
+    assert gini(np.zeros(0, dtype=np.int64)) == 0.0
+
+
+def test_gini_does_not_overflow_on_large_totals():
+    # n * total is far beyond int64 here
+    values = np.full(1000, 10**15, dtype=np.int64)
+    assert gini(values) == pytest.approx(0.0, abs=1e-12)
+
+
+@pytest.mark.parametrize('n', [0, 1, 2, 7, 100, 1234])
+def test_lorenz_from_the_interpolated_ranks_only(n):
+    values = np.sort(np.random.default_rng(n).integers(0, 10**12, n))
+    cumulative = np.concatenate([[0], np.cumsum(values)])
+    ranks = lorenz_ranks(n)
+    assert ranks[0] == 0 and ranks[-1] <= n
+    np.testing.assert_array_equal(lorenz_table(n, ranks, cumulative[ranks]).to_numpy(), lorenz_curve(values).to_numpy())
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.cube import CUBE_SECTIONS
+from dashboard.engine import DuckDBEngine, MemoryEngine
+from dashboard.filters import FilterState, Selection
+
+pytest.importorskip('duckdb')
+
+FILTER_STATES = [
+    FilterState(),
+    FilterState(role="Miner"),
+    FilterState(staking_proxy="True", wallet_value=(1.0, 500.0)),
+    FilterState(staking_proxy="False", tokens=(2, 7), number_tx=(1, 50)),
+    FilterState(wallet_value=(0.0, 1e12)),
+    FilterState(netuids=(1, 2, 3)),
+    FilterState(netuids=(1, 2), subnet_match="All", role="Investor"),
+    FilterState(tx_time=(1, 12), alpha_percentage=(50.0, 100.0)),
+    FilterState(role="Subnet Owner", wallet_value=(1e9, 2e9)),  # Nobody
+]
+
+DISTRIBUTIONS = [('number_tx', 'TX Count'), ('tx_time', 'Sessions Count'), ('unique_alpha_tokens', 'Token Count')]
+
+# Every section's query, as (name, call) over an engine and a selection
+SECTIONS = [
+    ('summary', lambda engine, selection: engine.summary(selection)),
+    ('role_totals', lambda engine, selection: engine.role_totals(selection)),
+    *[(f'breakdown_{name}', lambda engine, selection, name=name: engine.breakdown(selection, name))
+      for name in CUBE_SECTIONS],
+    *[(f'distribution_{column}', lambda engine, selection, column=column, label=label:
+       engine.distribution(selection, column, label)) for column, label in DISTRIBUTIONS],
+    ('subnet_totals', lambda engine, selection: engine.subnet_totals(selection)),
+    *[(f'top_{column}', lambda engine, selection, column=column: engine.top_positions(selection, column, 50))
+      for column in ['total_alpha_value_rao', 'number_tx', 'unique_alpha_tokens']],
+    ('concentration', lambda engine, selection: engine.concentration(selection)),
+    ('lorenz', lambda engine, selection: engine.lorenz(selection)),
+    ('subnet_concentration', lambda engine, selection: engine.subnet_concentration(selection)),
+]
+
+
+@pytest.fixture(scope='module')
+def engines():
+    return MemoryEngine(), DuckDBEngine()
+
+
+@pytest.fixture(params=['mapped', 'parsed', 'legacy'])
+def snapshot(request):
+    return request.getfixturevalue(f'{request.param}_snapshot')
+
+
+def assert_same(expected, actual):
+    if isinstance(expected, dict):
+        assert expected == pytest.approx(actual, rel=1e-12)
+    elif isinstance(expected, np.ndarray):
+        np.testing.assert_array_equal(actual, expected)
+    else:
+        pd.testing.assert_frame_equal(actual.reset_index(drop=True), expected.reset_index(drop=True),
+                                      check_dtype=len(expected) > 0, check_exact=False, rtol=1e-12, atol=1e-9)
+
+
+@pytest.mark.parametrize('state', FILTER_STATES, ids=FilterState.describe)
+@pytest.mark.parametrize('name,section', SECTIONS, ids=[name for name, _ in SECTIONS])
+def test_engines_agree(engines, snapshot, state, name, section):
+    memory, duckdb = engines
+    selection = Selection(snapshot, state)
+    assert_same(section(memory, selection), section(duckdb, selection))
+
+
+def test_duckdb_tables_share_the_snapshot_buffers(engines, mapped_snapshot):
+    holders, holdings = engines[1].tables(mapped_snapshot)
+    column = mapped_snapshot.holdings['value_rao'].to_numpy()
+    assert holdings.column('value_rao').chunk(0).buffers()[1].address == column.ctypes.data
+    assert holders.num_rows == len(mapped_snapshot.holders)
+
+
+def test_duckdb_table_cache_is_bounded(mapped_snapshot, parsed_snapshot, legacy_snapshot):
+    engine = DuckDBEngine()
+    for snapshot in [mapped_snapshot, parsed_snapshot, legacy_snapshot]:
+        engine.tables(snapshot)
+    assert engine._tables.stats()['size'] == 2
@@ -0,0 +1,74 @@
+import json
+
+import numpy as np
+import pytest
+
+from dashboard.filters import FilterState, Selection, build_mask
+
+# One state per predicate plus combinations; wallet bounds sit between amounts, never on one
+FILTER_STATES = [
+    FilterState(),
+    FilterState(role="Subnet Owner"),
+    FilterState(role="Investor"),
+    FilterState(role="Miner"),
+    FilterState(staking_proxy="True"),
+    FilterState(staking_proxy="False"),
+    FilterState(wallet_value=(10.5, 2000.5)),
+    FilterState(wallet_value=(0.0, 1e12)),
+    FilterState(tokens=(2, 5)),
+    FilterState(number_tx=(1, 20)),
+    FilterState(tx_time=(0, 3)),
+    FilterState(alpha_percentage=(50.0, 100.0)),
+    FilterState(netuids=(1, 2, 3)),
+    FilterState(netuids=(1, 2), subnet_match="All"),
+    FilterState(role="Investor", staking_proxy="False", wallet_value=(1.5, 500.5), tokens=(1, 3)),
+    FilterState(role="Miner", tokens=(2, 64), netuids=(1, 5), subnet_match="Any"),
+]
+
+
+def reference_filter(records, state: FilterState):
+    """The dashboard's original per-record filter passes, extended to every FilterState field"""
+    def keep(record):
+        if state.role != "All" and state.role not in record.get('roles', []):
+            return False
+        if state.staking_proxy != "All" and record.get('has_staking_proxy', False) != (state.staking_proxy == "True"):
+            return False
+        for field, key in [('wallet_value', 'total_wallet_value_tao'), ('tokens', 'unique_alpha_tokens'),
+                           ('number_tx', 'number_tx'), ('tx_time', 'tx_time'), ('alpha_percentage', 'alpha_percentage')]:
+            bounds = getattr(state, field)
+            if bounds is not None and not bounds[0] <= record.get(key, 0) <= bounds[1]:
+                return False
+        if state.netuids:
+            staked = {holding['netuid'] for holding in record.get('alpha_holdings', [])}
+            matched = staked.issuperset(state.netuids) if state.subnet_match == "All" else staked & set(state.netuids)
+            if not matched:
+                return False
+        return True
+    return [record['coldkey'] for record in records if keep(record)]
+
+
+@pytest.fixture(scope='module')
+def records(synthetic_json):
+    with open(synthetic_json) as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize('state', FILTER_STATES, ids=FilterState.describe)
+def test_mask_matches_reference_filters(records, mapped_snapshot, state):
+    mask = build_mask(mapped_snapshot, state)
+    selected = mapped_snapshot.coldkeys.text(np.flatnonzero(mask)).to_pylist()
+    assert selected == reference_filter(records, state)
+
+
+@pytest.mark.parametrize('state', FILTER_STATES, ids=FilterState.describe)
+def test_selection_views_agree(mapped_snapshot, state):
+    selection = Selection(mapped_snapshot, state)
+    np.testing.assert_array_equal(selection.positions, np.flatnonzero(selection.mask))
+    assert len(selection.holders) == selection.mask.sum()
+
+
+@pytest.mark.parametrize('netuids', [(), (1,), (1, 2, 3), (3, 1, 999), tuple(range(1, 129))])
+def test_subnet_mask_any_matches_the_union(mapped_snapshot, netuids):
+    index = mapped_snapshot.subnet_index
+    rows = len(mapped_snapshot.holders)
+    np.testing.assert_array_equal(np.flatnonzero(index.mask_any(netuids, rows)), index.any_of(netuids))
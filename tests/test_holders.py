@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from dashboard.holders import ROLE_BITS, KeyTable, SnapshotBuilder, decode_roles, encode_roles
+from dashboard.snapshot import read_tables, write_tables
+
+COLDKEYS = ['5Gb', '5Ca', '5Gb2', 'abc', '5C']
+HOLDING = {'netuid': 1, 'subnet_name': 'subnet-1', 'balance_alpha': 2.0, 'value_tao': 1.0, 'percentage_of_portfolio': 50.0}
+
+
+def test_key_table_round_trip():
+    table = KeyTable.from_strings(COLDKEYS)
+    assert len(table) == len(COLDKEYS)
+    assert [table.decode(i) for i in range(len(table))] == COLDKEYS
+    assert table.text(np.arange(len(table))).to_pylist() == COLDKEYS
+    assert [table.find(coldkey) for coldkey in COLDKEYS] == list(range(len(COLDKEYS)))
+    assert table.keys[table.order].tolist() == sorted(key.encode() for key in COLDKEYS)
+
+
+def test_unknown_keys():
+    table = KeyTable.from_strings(COLDKEYS)
+    assert table.find('5G') == -1 and table.find('zzz') == -1 and table.find('') == -1
+    ids = table.ids(np.array([b'abc', b'nope', b'5C']))
+    assert ids.tolist() == [3, -1, 4] and ids.dtype == np.int32
+    assert KeyTable.from_strings([]).ids(np.array([b'5C'])).tolist() == [-1]
+
+
+@pytest.mark.parametrize('prefix,expected', [('5C', ['5C', '5Ca']), ('5G', ['5Gb', '5Gb2']), ('x', []), ('', sorted(COLDKEYS))])
+def test_prefix_lookup(prefix, expected):
+    table = KeyTable.from_strings(COLDKEYS)
+    assert table.text(table.with_prefix(prefix, 10)).to_pylist() == expected
+    assert table.text(table.with_prefix(prefix, 1)).to_pylist() == expected[:1]
+
+
+@pytest.mark.parametrize('coldkeys', [COLDKEYS, ['5' * 48, '4' * 48, '6' * 48]], ids=['mixed_width', 'ss58_width'])
+def test_key_table_survives_the_binary_tables(coldkeys, tmp_path):
+    builder = SnapshotBuilder()
+    for coldkey in coldkeys:
+        builder.add({'coldkey': coldkey, 'roles': ['Investor'], 'alpha_holdings': [HOLDING]})
+    snapshot = builder.build(version='keys')
+    write_tables(snapshot, str(tmp_path))
+    mapped = read_tables(str(tmp_path)).coldkeys
+
+    assert mapped.text(np.arange(len(coldkeys))).to_pylist() == coldkeys
+    np.testing.assert_array_equal(mapped.order, snapshot.coldkeys.order)
+    assert [mapped.find(coldkey) for coldkey in coldkeys] == list(range(len(coldkeys)))
+
+
+@pytest.mark.parametrize('roles', [[], ['Miner'], ['Subnet Owner', 'Validator'], list(ROLE_BITS)])
+def test_roles_round_trip(roles):
+    assert decode_roles(encode_roles(roles)) == roles
+
+
+def test_unrecognized_roles_are_unknown():
+    assert decode_roles(encode_roles(['Miner', 'Whale'])) == ['Miner', 'Unknown']
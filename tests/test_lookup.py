@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from dashboard.lookup import holder_detail, holder_holdings, search_coldkeys
+from dashboard.rao import to_rao, to_tao
+
+
+@pytest.fixture(scope='module')
+def records(synthetic_json):
+    with open(synthetic_json) as f:
+        return json.load(f)
+
+
+def coldkeys_at(snapshot, positions):
+    return snapshot.coldkeys.text(positions).to_pylist()
+
+
+def test_exact_match(mapped_snapshot, records):
+    coldkey = records[123]['coldkey']
+    assert coldkeys_at(mapped_snapshot, search_coldkeys(mapped_snapshot, f"  {coldkey} ")) == [coldkey]
+
+
+@pytest.mark.parametrize('prefix', ['5', '5C', '5Gx', 'zzz'])
+@pytest.mark.parametrize('limit', [3, 50])
+def test_prefix_matches(mapped_snapshot, records, prefix, limit):
+    expected = sorted(record['coldkey'] for record in records if record['coldkey'].startswith(prefix))[:limit]
+    assert coldkeys_at(mapped_snapshot, search_coldkeys(mapped_snapshot, prefix, limit)) == expected
+
+
+def test_empty_query(mapped_snapshot):
+    assert len(search_coldkeys(mapped_snapshot, '   ')) == 0
+
+
+@pytest.mark.parametrize('position', [0, 1, 200, 399])
+def test_drill_down(mapped_snapshot, records, position):
+    record = records[position]
+    detail = holder_detail(mapped_snapshot, position)
+    assert detail['coldkey'] == record['coldkey']
+    assert set(detail['roles']) == set(record['roles'])
+    assert detail['total_wallet_value_rao'] == to_rao(record['total_wallet_value_tao'])
+    assert detail['number_tx'] == record['number_tx']
+
+    holdings = holder_holdings(mapped_snapshot, position)
+    expected = sorted(record['alpha_holdings'], key=lambda holding: -holding['value_tao'])
+    assert holdings['Netuid'].tolist() == [holding['netuid'] for holding in expected]
+    assert holdings['Subnet Name'].tolist() == [holding['subnet_name'] for holding in expected]
+    # Rounded to whole RAO when the snapshot was built
+    assert holdings['Value (TAO)'].tolist() == [float(to_tao(to_rao(holding['value_tao']))) for holding in expected]
@@ -0,0 +1,97 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.holders import build_snapshot
+from dashboard.snapshot import iter_json_records, parse_json
+
+RECORDS = [
+    {'coldkey': '5Alpha', 'roles': ['Investor'], 'note': 'comma, bracket ] and brace } inside a string'},
+    {'coldkey': '5Bêta', 'roles': ['Miner', 'Validator'], 'alpha_holdings': [{'netuid': 1}, {'netuid': 2}]},
+    {'coldkey': '5Gamma', 'roles': [], 'nested': {'deep': [[], {}, [1, 2, {'x': 'y'}]]}},
+]
+
+
+def write(tmp_path, text: str) -> str:
+    path = tmp_path / 'analysis.json'
+    path.write_bytes(text.encode())
+    return str(path)
+
+
+@pytest.mark.parametrize('indent', [None, 2])
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1 << 20])
+def test_records_across_chunk_boundaries(tmp_path, indent, chunk_size):
+    """Every chunk size, down to one byte (splitting multi-byte UTF-8), yields the records json.load gives"""
+    path = write(tmp_path, json.dumps(RECORDS, indent=indent, ensure_ascii=False))
+    assert list(iter_json_records(path, chunk_size=chunk_size)) == RECORDS
+
+
+@pytest.mark.parametrize('text', ['[]', ' [ ] ', '\n[\n]\n'])
+def test_empty_array(tmp_path, text):
+    assert list(iter_json_records(write(tmp_path, text), chunk_size=1)) == []
+
+
+@pytest.mark.parametrize('text', [
+    '',
+    '   ',
+    '[',
+    '[{"a": 1}',
+    '[{"a": 1},',
+    '[{"a": 1}, ]',
+    '[,{"a": 1}]',
+    '[{"a": 1},,{"b": 2}]',
+    '[{"a": 1} {"b": 2}]',
+    '[{"a": 1}] trailing',
+    '[{"a": 1}][]',
+    '[{"a": }]',
+    '[{"a": 1]',
+])
+@pytest.mark.parametrize('chunk_size', [1, 4, 1 << 20])
+def test_malformed_input_raises_like_json_load(tmp_path, text, chunk_size):
+    path = write(tmp_path, text)
+    with pytest.raises(ValueError):
+        json.loads(text)
+    with pytest.raises(ValueError):
+        list(iter_json_records(path, chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize('text', ['{"a": 1}', '[{"a": 1}, 2]', '[[1]]'])
+def test_not_an_array_of_records_raises(tmp_path, text):
+    with pytest.raises(ValueError):
+        list(iter_json_records(write(tmp_path, text)))
+
+
+def test_malformed_record_does_not_buffer_the_rest_of_the_file(tmp_path):
+    """A record that can't decode is reported once it spans max_record_size, not at end of file"""
+    filler = ',\n'.join(json.dumps({'coldkey': f'5Key{i}', 'pad': 'x' * 100}) for i in range(2000))
+    path = write(tmp_path, '[{"coldkey": "5Bad", "value": oops},\n' + filler + ']')
+    read = []
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_records(path, progress=lambda done, total: read.append(done), chunk_size=256, max_record_size=4096))
+    assert read[-1] <= 4096 + 2 * 256 < len(filler)
+
+
+def test_progress_reaches_file_size(tmp_path):
+    path = write(tmp_path, json.dumps(RECORDS))
+    calls = []
+    list(iter_json_records(path, progress=lambda done, total: calls.append((done, total)), chunk_size=16))
+    assert calls[-1][0] == calls[-1][1] == len(json.dumps(RECORDS))
+
+
+def test_parse_json_matches_json_load(synthetic_json):
+    with open(synthetic_json) as f:
+        records = json.load(f)
+    snapshot = parse_json(synthetic_json)
+    assert snapshot.coldkeys.text(range(len(records))).to_pylist() == [record['coldkey'] for record in records]
+    assert len(snapshot.holdings) == sum(len(record['alpha_holdings']) for record in records)
+
+
+def test_parse_json_matches_building_from_the_loaded_records(synthetic_json, parsed_snapshot):
+    with open(synthetic_json) as f:
+        built = build_snapshot(json.load(f), version=parsed_snapshot.version)
+    pd.testing.assert_frame_equal(built.holders, parsed_snapshot.holders)
+    pd.testing.assert_frame_equal(built.holdings, parsed_snapshot.holdings)
+    pd.testing.assert_series_equal(built.subnet_names, parsed_snapshot.subnet_names)
+    np.testing.assert_array_equal(built.coldkeys.keys, parsed_snapshot.coldkeys.keys)
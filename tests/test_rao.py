@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from dashboard.rao import MAX_TAO, RAO_PER_TAO, group_sums, to_rao, to_tao
+
+
+@pytest.mark.parametrize('tao,rao', [
+    (0.0, 0),
+    (1.0, RAO_PER_TAO),
+    (0.1 + 0.2, 300_000_000),
+    (1e-9, 1),
+    (4e-10, 0),
+    (-2.5e-9, -2),
+    (21_000_000.125, 21_000_000_125_000_000),
+])
+def test_to_rao_rounds_to_whole_rao(tao, rao):
+    assert to_rao(tao) == rao
+
+
+@pytest.mark.parametrize('tao', [1e12, 1e300, np.inf])
+def test_to_rao_clamps_instead_of_wrapping(tao):
+    assert to_rao(tao) == MAX_TAO * RAO_PER_TAO
+    assert to_rao(-tao) == -MAX_TAO * RAO_PER_TAO
+    assert to_rao(tao) <= np.iinfo(np.int64).max
+
+
+def test_to_tao_inverts_to_rao():
+    tao = np.array([0.0, 1.5, 123.456789012, 20_999_999.999999999])
+    rao = to_rao(tao)
+    assert rao.dtype == np.int64
+    np.testing.assert_allclose(to_tao(rao), tao, rtol=0, atol=1e-9)
+
+
+def test_group_sums_are_exact():
+    rng = np.random.default_rng(3)
+    groups = rng.integers(0, 7, 5_000)
+    rao = to_rao(rng.lognormal(10.0, 3.0, 5_000))
+    expected = [0] * 7
+    for group, amount in zip(groups.tolist(), rao.tolist()):
+        expected[group] += amount
+    sums = group_sums(groups, rao)
+    assert sums.dtype == np.int64 and sums.tolist() == expected
+
+
+def test_group_sums_minlength():
+    assert group_sums(np.array([1, 1]), np.array([2, 3]), minlength=4).tolist() == [0, 5, 0, 0]
+    assert group_sums(np.array([3]), np.array([7]), minlength=2).tolist() == [0, 0, 0, 7]
+    assert group_sums(np.array([], dtype=np.int64), np.array([], dtype=np.int64), minlength=3).tolist() == [0, 0, 0]
+    assert len(group_sums(np.array([], dtype=np.int64), np.array([], dtype=np.int64))) == 0
@@ -0,0 +1,27 @@
+import threading
+
+from dashboard.registry import list_runs, open_run, register_run
+from dashboard.snapshot import conversion_lock
+
+
+def test_register_and_open_a_run(analysis_json, tmp_path):
+    registry_dir = str(tmp_path / 'snapshots')
+    info = register_run(analysis_json, str(tmp_path / 'missing_recap.txt'), registry_dir)
+    assert register_run(analysis_json, str(tmp_path / 'missing_recap.txt'), registry_dir) == info
+    assert list_runs(registry_dir) == [info]
+
+    run = open_run(info.run_id, registry_dir)
+    assert run.version == info.version and len(run.holders) == info.coldkeys
+
+
+def test_register_waits_for_a_conversion_in_progress(analysis_json, tmp_path):
+    registered = []
+    worker = threading.Thread(
+        target=lambda: registered.append(register_run(analysis_json, '', str(tmp_path / 'snapshots')))
+    )
+    with conversion_lock(analysis_json):
+        worker.start()
+        worker.join(timeout=0.5)
+        assert worker.is_alive() and not registered
+    worker.join()
+    assert len(registered) == 1
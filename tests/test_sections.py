@@ -0,0 +1,54 @@
+import os
+import re
+
+import pytest
+
+from dashboard.sections import FILTERS, LOCAL, SECTIONS, SNAPSHOT, downstream
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'streamlit_app.py')
+
+
+def fragment_keys():
+    with open(APP) as f:
+        return re.findall(r'@st\.fragment\(key="(\w+)"\)', f.read())
+
+
+def test_filter_change_reruns_the_filtered_sections_in_page_order():
+    assert downstream(FILTERS) == [
+        'filters',
+        'filter_summary',
+        'breakdown_by_tx',
+        'breakdown_by_tx_time',
+        'breakdown_by_tokens',
+        'breakdown_by_alpha_percentage',
+        'top_holders_table',
+        'subnet_breakdown',
+        'concentration_analysis',
+        'annexe',
+        'performance_panel',
+    ]
+
+
+def test_unfiltered_sections_skip_a_filter_change():
+    for name in ('global_role_analysis', 'coldkey_lookup', 'run_comparison'):
+        assert name not in downstream(FILTERS)
+
+
+def test_snapshot_change_reruns_every_section():
+    assert downstream(SNAPSHOT) == list(SECTIONS)
+
+
+def test_local_sections():
+    assert downstream(LOCAL) == ['top_holders_table', 'coldkey_lookup', 'run_comparison', 'annexe', 'performance_panel']
+
+
+@pytest.mark.parametrize('changed', ['holders', ''])
+def test_unknown_input_reruns_nothing(changed):
+    assert downstream(changed) == []
+
+
+def test_filtered_sections_are_app_fragments():
+    # st.rerun(downstream(FILTERS)) fails on any key that isn't a fragment of the page
+    keys = fragment_keys()
+    assert set(downstream(FILTERS)) <= set(keys)
+    assert set(keys) <= set(SECTIONS)
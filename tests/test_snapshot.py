@@ -0,0 +1,101 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import write_snapshot_json
+from dashboard.cube import build_cube
+from dashboard.filters import RANGE_COLUMNS
+from dashboard.holders import ColumnIndex
+from dashboard.snapshot import (
+    TABLE_FILES,
+    is_fresh,
+    load_snapshot,
+    parse_json,
+    read_snapshot,
+    snapshot_dir,
+    source_version,
+    write_snapshot,
+)
+
+
+def test_round_trip_preserves_every_table(analysis_json):
+    parsed = parse_json(analysis_json)
+    write_snapshot(parsed, analysis_json)
+    mapped = read_snapshot(analysis_json)
+
+    pd.testing.assert_frame_equal(mapped.holders, parsed.holders)
+    pd.testing.assert_frame_equal(mapped.holdings, parsed.holdings)
+    pd.testing.assert_series_equal(mapped.subnet_names, parsed.subnet_names, check_index_type=False)
+    np.testing.assert_array_equal(mapped.coldkeys.keys, parsed.coldkeys.keys)
+    np.testing.assert_array_equal(mapped.coldkeys.order, parsed.coldkeys.order)
+    pd.testing.assert_frame_equal(mapped.cube.cells, build_cube(parsed).cells)
+    assert mapped.version == parsed.version == source_version(analysis_json)
+    assert mapped.directory == snapshot_dir(analysis_json)
+
+
+def test_fresh_once_converted(analysis_json):
+    assert not is_fresh(analysis_json)
+    load_snapshot(analysis_json)
+    assert is_fresh(analysis_json)
+
+
+def test_missing_table_is_stale(analysis_json):
+    load_snapshot(analysis_json)
+    os.remove(os.path.join(snapshot_dir(analysis_json), TABLE_FILES['cube']))
+    assert not is_fresh(analysis_json)
+
+
+def test_rewritten_json_is_stale(analysis_json):
+    old = load_snapshot(analysis_json)
+    write_snapshot_json(50, analysis_json, seed=7)
+    assert not is_fresh(analysis_json)
+    assert len(load_snapshot(analysis_json).holders) == 50 != len(old.holders)
+
+
+def test_backdated_json_is_stale(analysis_json, tmp_path):
+    """A new JSON whose mtime is older than the tables (cp -p, rsync -t, mv) still triggers a conversion"""
+    load_snapshot(analysis_json)
+    elsewhere = str(tmp_path / 'elsewhere.json')
+    write_snapshot_json(50, elsewhere, seed=7)
+    tables_mtime = os.path.getmtime(os.path.join(snapshot_dir(analysis_json), TABLE_FILES['holders']))
+    os.utime(elsewhere, (tables_mtime - 3600, tables_mtime - 3600))
+    shutil.move(elsewhere, analysis_json)
+
+    assert not is_fresh(analysis_json)
+    snapshot = load_snapshot(analysis_json)
+    assert len(snapshot.holders) == 50
+    assert snapshot.version == source_version(analysis_json)
+    assert is_fresh(analysis_json)
+
+
+def test_tables_without_json_are_fresh(analysis_json):
+    load_snapshot(analysis_json)
+    os.remove(analysis_json)
+    assert is_fresh(analysis_json)
+
+
+def test_column_index_is_mapped_with_the_tables(analysis_json):
+    mapped = load_snapshot(analysis_json)
+    built = ColumnIndex(mapped.holders)
+    for column in RANGE_COLUMNS.values():
+        assert mapped.column_index.bounds(column) == built.bounds(column)
+        order = mapped.column_index.sorted_order(column)
+        np.testing.assert_array_equal(order, built.sorted_order(column))
+        assert not order.flags.owndata  # A view over the mapped file, not a copy
+
+        values = np.sort(mapped.holders[column].to_numpy())
+        for lo, hi in [(values[0], values[-1]), (values[len(values) // 3], values[len(values) // 2]), (-1, -1)]:
+            expected = (np.searchsorted(values, lo, side='left'), np.searchsorted(values, hi, side='right'))
+            assert mapped.column_index.span(column, lo, hi) == tuple(int(i) for i in expected)
+
+
+def test_unwritable_tables_are_logged_and_parsed_again(analysis_json, caplog):
+    # A file where the table directory should be makes every write fail
+    with open(snapshot_dir(analysis_json), 'w'):
+        pass
+    snapshot = load_snapshot(analysis_json)
+    assert len(snapshot.holders) > 0 and snapshot.directory == ''
+    assert 'parsed on every load' in caplog.text
+    assert not is_fresh(analysis_json)
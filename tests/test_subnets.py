@@ -0,0 +1,48 @@
+import json
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from dashboard.filters import FilterState, build_mask
+from dashboard.rao import to_rao, to_tao
+from dashboard.subnets import subnet_totals
+
+
+@pytest.fixture(scope='module')
+def records(synthetic_json):
+    with open(synthetic_json) as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize('state', [FilterState(), FilterState(role="Miner"), FilterState(netuids=(2,))],
+                         ids=FilterState.describe)
+def test_subnet_totals_match_a_per_holding_pass(records, mapped_snapshot, state):
+    mask = build_mask(mapped_snapshot, state)
+    selected = set(mapped_snapshot.coldkeys.text(np.flatnonzero(mask)).to_pylist())
+
+    # The original breakdown: one pass over every selected holder's holdings
+    alpha, value, stakers, names = defaultdict(int), defaultdict(int), defaultdict(int), {}
+    for record in records:
+        if record['coldkey'] not in selected:
+            continue
+        for holding in record['alpha_holdings']:
+            netuid = holding['netuid']
+            alpha[netuid] += int(to_rao(holding['balance_alpha']))
+            value[netuid] += int(to_rao(holding['value_tao']))
+            stakers[netuid] += 1
+            names[netuid] = holding['subnet_name']
+
+    table = subnet_totals(mapped_snapshot, mask)
+    netuids = sorted(stakers)
+    assert table['Netuid'].tolist() == netuids
+    assert table['Subnet Name'].tolist() == [names[netuid] for netuid in netuids]
+    assert table['Number of Stakers'].tolist() == [stakers[netuid] for netuid in netuids]
+    assert table['Total Alpha Staked'].tolist() == [float(to_tao(alpha[netuid])) for netuid in netuids]
+    assert table['Total Value (TAO)'].tolist() == [float(to_tao(value[netuid])) for netuid in netuids]
+
+
+def test_no_holders_selected(mapped_snapshot):
+    table = subnet_totals(mapped_snapshot, np.zeros(len(mapped_snapshot.holders), dtype=bool))
+    assert table.empty
+    assert list(table.columns) == ['Netuid', 'Subnet Name', 'Total Alpha Staked', 'Total Value (TAO)', 'Number of Stakers']
@@ -0,0 +1,15 @@
+import os
+
+import pytest
+
+from benchmarks.synthetic import write_snapshot_json
+from dashboard.snapshot import SNAPSHOT_JSON
+
+
+def test_never_overwrites_the_analysis_output(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(os.path.dirname(SNAPSHOT_JSON))
+    with pytest.raises(ValueError):
+        write_snapshot_json(10, SNAPSHOT_JSON)
+    assert not os.path.exists(SNAPSHOT_JSON)
+    write_snapshot_json(10, 'output/benchmarks.json')
@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.tables import page_count, sort_order, table_page
+
+
+@pytest.mark.parametrize('dtype', [np.int64, np.int32, np.uint8, np.float64])
+@pytest.mark.parametrize('ascending', [True, False])
+def test_sort_order_keeps_ties_in_row_order(dtype, ascending):
+    values = np.array([3, 1, 3, 2, 1, 3], dtype=dtype)
+    expected = pd.Series(values).sort_values(ascending=ascending, kind='stable').index.to_numpy()
+    np.testing.assert_array_equal(sort_order(values, ascending), expected)
+
+
+def test_descending_large_rao_values_stay_distinct():
+    # Beyond 2**53 neighbouring int64 values share one float64
+    base = 2**60
+    values = np.array([base + 1, base, base + 1, base + 2, np.iinfo(np.int64).min, np.iinfo(np.int64).max])
+    np.testing.assert_array_equal(sort_order(values, ascending=False), [5, 3, 0, 2, 1, 4])
+    np.testing.assert_array_equal(sort_order(values, ascending=True), [4, 1, 0, 2, 3, 5])
+
+
+def test_pages_cover_every_row_once():
+    df = pd.DataFrame({'row': np.arange(23), 'value': 2**60 + np.arange(23, dtype=np.int64) % 4})
+    order = sort_order(df['value'].to_numpy(), ascending=False)
+    assert page_count(len(df), 5) == 5
+    pages = pd.concat([table_page(df, order, page, page_size=5) for page in range(1, 6)])
+    assert sorted(pages['row']) == list(range(23))
+    assert pages['value'].is_monotonic_decreasing
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from dashboard.filters import FilterState, Selection
+from dashboard.topk import RANK_COLUMNS, ranked_positions, top_k
+
+
+def reference_top_k(values, k):
+    """Full stable sort, largest first and ties by position"""
+    return np.lexsort((np.arange(len(values)), -values))[:k]
+
+
+@pytest.mark.parametrize('k', [0, 1, 5, 17, 100, 1000])
+@pytest.mark.parametrize('values', [
+    np.random.default_rng(0).integers(0, 5, 100),  # Ties everywhere
+    np.random.default_rng(1).normal(size=100),
+    2**60 + np.random.default_rng(2).integers(0, 3, 100),  # Near-equal RAO beyond float64 precision
+    np.zeros(0, dtype=np.int64),
+], ids=['ties', 'floats', 'large_rao', 'empty'])
+def test_matches_a_full_stable_sort(values, k):
+    np.testing.assert_array_equal(top_k(values, k), reference_top_k(values, k))
+
+
+def test_pages_of_a_ranking_never_overlap():
+    values = np.random.default_rng(3).integers(0, 4, 60)
+    ranking = top_k(values, 60)
+    assert sorted(ranking) == list(range(60))
+    np.testing.assert_array_equal(top_k(values, 20), ranking[:20])
+
+
+@pytest.mark.parametrize('column', RANK_COLUMNS.values())
+def test_ranked_positions_are_snapshot_rows(mapped_snapshot, column):
+    selection = Selection(mapped_snapshot, FilterState(role="Investor"))
+    positions = ranked_positions(selection, column, 25)
+    values = mapped_snapshot.holders[column].to_numpy()
+    assert selection.mask[positions].all()
+    expected = selection.positions[reference_top_k(values[selection.positions], 25)]
+    np.testing.assert_array_equal(positions, expected)
@@ -0,0 +1,94 @@
+import json
+import time
+
+import pytest
+
+from dashboard import tracing
+from dashboard.tracing import TRACE_LOG_ENV, latest_sections, phase, section, subscribe, trace_run, traced
+
+
+@pytest.fixture(autouse=True)
+def trace_log(tmp_path, monkeypatch):
+    path = tmp_path / 'traces.jsonl'
+    monkeypatch.setenv(TRACE_LOG_ENV, str(path))
+    monkeypatch.setattr(tracing, '_listeners', [])
+    return path
+
+
+def test_listeners_get_every_finished_trace():
+    finished = []
+    subscribe(finished.append)
+    subscribe(finished.append)  # Once per listener
+
+    with trace_run() as rerun:
+        with section('filter_summary'):
+            pass
+    with section('annexe'):  # A fragment rerunning on its own
+        pass
+    assert [trace.kind for trace in finished] == ['rerun', 'fragment']
+    assert finished[0] is rerun
+
+
+def test_latest_sections_combine_full_and_fragment_reruns():
+    finished = []
+    subscribe(finished.append)
+    with trace_run():
+        for name in ['filter_summary', 'top_holders_table', 'annexe']:
+            with section(name):
+                pass
+    with section('top_holders_table'):
+        time.sleep(0.01)
+
+    table = latest_sections(reversed(finished))
+    assert table['Section'].tolist() == ['filter_summary', 'top_holders_table', 'annexe']
+    assert table['Rerun'].tolist() == ['rerun', 'fragment', 'rerun']
+    assert table.loc[1, 'Wall (ms)'] >= 10
+    assert (table['Age (s)'] >= 0).all()
+
+
+def test_phases_record_their_own_time(trace_log):
+    with trace_run() as trace:
+        with section('summary'):
+            with phase('aggregate', rows=10) as outer:
+                outer.cache = 'miss'
+                time.sleep(0.02)
+                with phase('filter', rows=10):
+                    time.sleep(0.02)
+
+    aggregate, filtered = sorted(trace.spans, key=lambda span: span.phase)
+    assert filtered.seconds >= 0.02 and aggregate.seconds >= 0.02
+    assert aggregate.seconds + filtered.seconds <= trace.sections['summary'] <= trace.seconds
+
+    row = trace.table().iloc[0]
+    assert row['Section'] == 'summary' and row['Rows'] == 20
+    assert (row['Cache Hits'], row['Cache Misses']) == (0, 1)
+
+    logged = json.loads(trace_log.read_text())
+    assert logged['kind'] == 'rerun' and logged['sections'].keys() == {'summary'}
+    assert {span['phase'] for span in logged['spans']} == {'aggregate', 'filter'}
+    assert 'nested' not in logged['spans'][0]
+
+
+def test_sections_outside_a_rerun_get_a_fragment_trace(trace_log):
+    @traced
+    def create_annexe():
+        with phase('figure'):
+            pass
+
+    create_annexe()
+    logged = json.loads(trace_log.read_text())
+    assert logged['kind'] == 'fragment' and list(logged['sections']) == ['annexe']
+
+
+def test_phases_outside_a_trace_record_nothing(trace_log):
+    with phase('aggregate') as span:
+        span.rows = 5
+    assert not trace_log.exists()
+
+
+def test_empty_log_path_disables_the_log(trace_log, monkeypatch):
+    monkeypatch.setenv(TRACE_LOG_ENV, '')
+    with trace_run():
+        with section('summary'):
+            pass
+    assert not trace_log.exists()
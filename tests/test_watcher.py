@@ -0,0 +1,94 @@
+import os
+
+import pytest
+
+from benchmarks.synthetic import write_snapshot_json
+from dashboard.snapshot import source_version
+from dashboard.watcher import SnapshotWatcher
+
+
+@pytest.fixture
+def watcher(analysis_json):
+    return SnapshotWatcher(analysis_json, poll_seconds=0, settle_seconds=0)
+
+
+def rebuild(watcher):
+    """Poll once and wait for the background build it started, if any"""
+    watcher.poll()
+    if watcher._builder is not None:
+        watcher._builder.join()
+
+
+def replace_json(path, num_coldkeys, mtime=None):
+    """Move a new analysis JSON in place of path, the way run_analysis.sh replaces it"""
+    tmp_path = f"{path}.new"
+    write_snapshot_json(num_coldkeys, tmp_path, seed=num_coldkeys)
+    if mtime is not None:
+        os.utime(tmp_path, (mtime, mtime))
+    os.replace(tmp_path, path)
+
+
+def test_first_call_loads_the_json(watcher, analysis_json):
+    assert not watcher.loaded
+    snapshot = watcher.current()
+    assert watcher.loaded
+    assert snapshot.version == source_version(analysis_json)
+
+
+def test_unchanged_json_is_not_rebuilt(watcher):
+    snapshot = watcher.current()
+    rebuild(watcher)
+    assert watcher._builder is None
+    assert watcher.current() is snapshot
+
+
+@pytest.mark.parametrize('backdated', [False, True], ids=['newer', 'backdated'])
+def test_swaps_to_a_replaced_json(watcher, analysis_json, backdated):
+    old = watcher.current()
+    replace_json(analysis_json, 50, mtime=os.path.getmtime(analysis_json) - 3600 if backdated else None)
+    rebuild(watcher)
+    assert watcher.error is None
+    new = watcher.current()
+    assert new.version == source_version(analysis_json) != old.version
+    assert len(new.holders) == 50
+    assert len(old.holders) != 50  # The old snapshot stays usable by reruns that still hold it
+
+
+def test_unsettled_json_waits(analysis_json):
+    watcher = SnapshotWatcher(analysis_json, poll_seconds=0, settle_seconds=3600)
+    old = watcher.current()
+    replace_json(analysis_json, 50)
+    rebuild(watcher)
+    assert watcher._builder is None
+    assert watcher.current() is old
+
+
+def test_failed_build_keeps_the_old_snapshot(watcher, analysis_json):
+    old = watcher.current()
+    with open(analysis_json, 'a') as f:
+        f.write('{"truncated": ')
+    rebuild(watcher)
+    assert watcher.error
+    assert watcher.current() is old
+
+    # Not retried until the JSON changes again
+    builder = watcher._builder
+    rebuild(watcher)
+    assert watcher._builder is builder
+
+    replace_json(analysis_json, 50)
+    rebuild(watcher)
+    assert watcher.error is None
+    assert len(watcher.current().holders) == 50
+
+
+def test_only_the_polled_version_is_served(watcher, analysis_json):
+    old = watcher.current()
+    replace_json(analysis_json, 50)
+    polled = source_version(analysis_json)
+    replace_json(analysis_json, 60)  # Replaced again before the build ran
+    watcher._build(polled)
+    assert watcher.current() is old  # Not swapped to the tables of the newer, unsettled JSON
+    assert polled not in watcher._attempted
+    rebuild(watcher)
+    assert len(watcher.current().holders) == 60